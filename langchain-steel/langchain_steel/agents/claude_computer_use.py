@@ -3,24 +3,44 @@ ABOUTME: Provides browser automation using Claude's computer use capabilities wi
 
 import os
 import time
+import atexit
+import threading
+import weakref
 import base64
 import json
 import logging
 import asyncio
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from PIL import Image
-from io import BytesIO
-from playwright.sync_api import sync_playwright, Error as PlaywrightError
-from playwright.async_api import async_playwright, Error as AsyncPlaywrightError
+# The sync and async Playwright APIs re-export the same public Error class,
+# so catching it here covers sessions of either flavour
+from playwright.async_api import Error as PlaywrightError
 from steel import Steel
 from steel.types import Session
 
-from anthropic import Anthropic, RateLimitError, APITimeoutError
+import httpx
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APITimeoutError,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    RateLimitError,
+)
 from anthropic.types.beta import BetaMessageParam
+
+try:
+    # Optional SIMD base64 encoder, installed with the "speedups" extra
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:
+    _b64encode_as_string = None
 import random
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +48,15 @@ logger = logging.getLogger(__name__)
 class ActionBatcher:
     """Batch and optimize Claude Computer Use actions to reduce API calls."""
     
+    __slots__ = (
+        "throttle_delay",
+        "last_request_time",
+        "action_queue",
+        "last_screenshot_cache",
+        "cache_duration",
+        "cache_timestamp",
+    )
+    
     def __init__(self, throttle_delay: float = 0.2):
         """Initialize action batcher.
         
@@ -111,6 +140,8 @@ class ActionBatcher:
 class NavigationOptimizer:
     """Optimize navigation by using Steel's native methods instead of keystroke simulation."""
     
+    __slots__ = ("browser_session", "url_pattern")
+    
     def __init__(self, browser_session):
         self.browser_session = browser_session
         self.url_pattern = re.compile(
@@ -168,7 +199,7 @@ class NavigationOptimizer:
         
         # For now, disable direct navigation optimization due to async/sync compatibility
         # The other optimizations (throttling, caching, backoff) will still provide benefits
-        logger.info(f"Navigation optimization detected URL: {url} (letting Claude handle)")
+        logger.info("Navigation optimization detected URL: %s (letting Claude handle)", url)
         return False
 
 
@@ -191,8 +222,8 @@ MODEL_CONFIGS = {
     }
 }
 
-# Key mapping for Claude Computer Use to Playwright
-CUA_KEY_TO_PLAYWRIGHT_KEY = {
+# Key mapping for Claude Computer Use to Playwright (read-only)
+CUA_KEY_TO_PLAYWRIGHT_KEY = MappingProxyType({
     "/": "Divide",
     "\\": "Backslash",
     "alt": "Alt",
@@ -252,8 +283,152 @@ CUA_KEY_TO_PLAYWRIGHT_KEY = {
     "comma": ",",
     "period": ".",
     "slash": "/",
+})
+
+# Modifier names accepted in "key" combos (matched lowercase) mapped to Playwright names
+_MODIFIER_NORMALIZE = MappingProxyType({
+    "ctrl": "Control",
+    "control": "Control",
+    "shift": "Shift",
+    "alt": "Alt",
+    "option": "Alt",
+    "cmd": "Meta",
+    "meta": "Meta",
+    "super": "Meta",
+})
+
+# Holds shorter than this go straight through CDP so driver overhead does not
+# stretch the hold
+SHORT_HOLD_SECONDS = 0.5
+
+# Wheel delta per scroll step for each direction
+_SCROLL_DELTAS = MappingProxyType({
+    "down": (0, 100),
+    "up": (0, -100),
+    "right": (100, 0),
+    "left": (-100, 0),
+})
+
+
+def _encode_screenshot(image_bytes: bytes) -> str:
+    """Base64-encode raw screenshot bytes for an Anthropic image block.
+    
+    Only the Playwright fallback produces raw bytes; CDP captures arrive
+    base64-encoded and are passed through untouched.
+    """
+    if _b64encode_as_string is not None:
+        return _b64encode_as_string(image_bytes)
+    return base64.b64encode(image_bytes).decode("ascii")
+
+
+@lru_cache(maxsize=256)
+def _apply_key_mapping(press_key: str) -> str:
+    """Translate a CUA key or "mod+...+key" combo to Playwright key names.
+    
+    Both lookup tables are read-only, so translations are memoized.
+    """
+    if "+" not in press_key:
+        return CUA_KEY_TO_PLAYWRIGHT_KEY.get(press_key, press_key)
+    
+    *modifier_keys, main_key = press_key.split("+")
+    playwright_modifiers = [_MODIFIER_NORMALIZE.get(mod.lower(), mod) for mod in modifier_keys]
+    playwright_modifiers.append(CUA_KEY_TO_PLAYWRIGHT_KEY.get(main_key, main_key))
+    return "+".join(playwright_modifiers)
+
+# Rate limit backoff bounds (seconds) and the request headroom that triggers a pause
+RATE_LIMIT_BASE_DELAY = 1.0
+RATE_LIMIT_MAX_DELAY = 60.0
+RATE_LIMIT_LOW_REMAINING = 2
+# Minimum spacing between request starts in the sync agent, scaled down by headroom
+MIN_REQUEST_INTERVAL = 1.0
+
+# Keep idle API connections open across agent iterations; the httpx default of
+# 5s is shorter than a typical action + screenshot step, forcing a new TLS handshake
+ANTHROPIC_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=10, keepalive_expiry=120.0
+)
+
+# Screenshot encodings supported by both Playwright and CDP Page.captureScreenshot
+SCREENSHOT_FORMATS = ("jpeg", "png")
+
+# Fallback screenshots larger than this are base64-encoded off the event loop
+ASYNC_ENCODE_THRESHOLD_BYTES = 256 * 1024
+
+# Fingerprint of what a screenshot shows: URL, scroll offset and load state
+_PAGE_STATE_KEY_JS = "() => location.href + '|' + scrollX + '|' + scrollY + '|' + document.readyState"
+
+# Sent instead of an image when a screenshot matches the one Claude last received
+SCREENSHOT_UNCHANGED_TEXT = "[screenshot unchanged since the previous action]"
+
+# Completion marker in Claude's text; one scan finds either outcome
+_TASK_STATUS_RE = re.compile(r"TASK_(COMPLETED|FAILED):")
+
+# Only the most recent screenshots stay in the conversation sent to Claude
+SCREENSHOT_HISTORY_KEEP = 3
+SCREENSHOT_OMITTED_TEXT = "[prior screenshot omitted]"
+
+# Start URL navigation returns once the response commits; if it fails the
+# session falls back to a blank page and Claude navigates from there
+START_URL_TIMEOUT_MS = 10000
+FALLBACK_PAGE_URL = "about:blank"
+FALLBACK_PAGE_TIMEOUT_MS = 5000
+# Pooled sessions are retired this long before Steel's own session timeout
+POOLED_SESSION_TIMEOUT_MARGIN = 60.0  # seconds
+
+# First retry of a failed CDP connection comes quickly, later ones back off
+CONNECT_RETRY_BASE_DELAY = 0.25
+
+# Actions that cannot change what is rendered, so a recent screenshot stays valid
+_NON_RENDERING_ACTIONS = frozenset({"screenshot", "cursor_position"})
+
+# Actions whose dispatch the async session overlaps with the screenshot,
+# since a pointer move does not need to be acknowledged before capturing
+_OVERLAPPED_SCREENSHOT_ACTIONS = frozenset({"mouse_move"})
+
+# Argument rules per computer action: (text, coordinate), each "required",
+# "optional" or "rejected"
+_ACTION_ARG_RULES = {
+    "left_mouse_down": ("optional", "rejected"),
+    "left_mouse_up": ("optional", "rejected"),
+    "scroll": ("optional", "optional"),
+    "hold_key": ("required", "optional"),
+    "wait": ("optional", "optional"),
+    "left_click": ("rejected", "optional"),
+    "right_click": ("rejected", "optional"),
+    "double_click": ("rejected", "optional"),
+    "triple_click": ("rejected", "optional"),
+    "middle_click": ("rejected", "optional"),
+    "mouse_move": ("rejected", "required"),
+    "left_click_drag": ("rejected", "required"),
+    "key": ("required", "rejected"),
+    "type": ("required", "rejected"),
+    "screenshot": ("rejected", "rejected"),
+    "cursor_position": ("rejected", "rejected"),
 }
 
+
+def _validate_duration(duration: Any) -> None:
+    """Check the duration argument of hold_key and wait."""
+    if duration is None or not isinstance(duration, (int, float)):
+        raise ValueError("duration must be a number")
+    if duration < 0:
+        raise ValueError("duration must be non-negative")
+    if duration > 100:
+        raise ValueError("duration is too long")
+
+
+def _validate_action_args(action: str, text: Optional[str], coordinate: Any) -> None:
+    """Check text/coordinate presence against the rules for an action."""
+    text_rule, coordinate_rule = _ACTION_ARG_RULES[action]
+    if text is None and text_rule == "required":
+        raise ValueError(f"text is required for {action}")
+    if text is not None and text_rule == "rejected":
+        raise ValueError(f"text is not accepted for {action}")
+    if coordinate is None and coordinate_rule == "required":
+        raise ValueError(f"coordinate is required for {action}")
+    if coordinate is not None and coordinate_rule == "rejected":
+        raise ValueError(f"coordinate is not accepted for {action}")
+
 SYSTEM_PROMPT = """You are an expert browser automation assistant operating in an iterative execution loop. Your goal is to efficiently complete tasks using a Chrome browser with full internet access.
 
 <CAPABILITIES>
@@ -313,34 +488,293 @@ def _is_running_in_event_loop() -> bool:
         return False
 
 
-def _handle_rate_limit_error(attempt: int, max_retries: int = 10) -> Optional[float]:
-    """Handle rate limit errors with optimized exponential backoff.
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the ``retry-after`` header from an API error response, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_headroom_delay(headers: Any) -> float:
+    """Seconds to pause before the next request when request headroom is nearly used up.
+    
+    When ``anthropic-ratelimit-requests-remaining`` drops to
+    RATE_LIMIT_LOW_REMAINING or below, wait until the
+    ``anthropic-ratelimit-requests-reset`` time instead of running into a 429.
+    """
+    if not headers:
+        return 0.0
+    try:
+        remaining = int(headers.get("anthropic-ratelimit-requests-remaining"))
+        reset_at = datetime.fromisoformat(
+            headers.get("anthropic-ratelimit-requests-reset").replace("Z", "+00:00")
+        )
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+    if remaining > RATE_LIMIT_LOW_REMAINING:
+        return 0.0
+    
+    delay = (reset_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), RATE_LIMIT_MAX_DELAY)
+
+
+def _request_interval(headers: Any) -> float:
+    """Minimum seconds between request starts given the last response's headroom.
+    
+    Scales MIN_REQUEST_INTERVAL by the used fraction of the request limit, so
+    the pause shrinks toward zero while most of the budget is left.
+    """
+    if not headers:
+        return MIN_REQUEST_INTERVAL
+    try:
+        remaining = int(headers.get("anthropic-ratelimit-requests-remaining"))
+        limit = int(headers.get("anthropic-ratelimit-requests-limit"))
+    except (TypeError, ValueError):
+        return MIN_REQUEST_INTERVAL
+    if limit <= 0:
+        return MIN_REQUEST_INTERVAL
+    used = 1.0 - min(max(remaining / limit, 0.0), 1.0)
+    return MIN_REQUEST_INTERVAL * used
+
+
+def _handle_rate_limit_error(
+    error: Exception,
+    attempt: int,
+    prev_delay: float = RATE_LIMIT_BASE_DELAY,
+    max_retries: int = 10,
+) -> Optional[Tuple[float, float]]:
+    """Handle rate limit errors with decorrelated jitter backoff.
+    
+    A ``retry-after`` header on the error response takes precedence and is
+    honoured as given; otherwise the delay is drawn from ``[base, prev_delay * 3]``
+    and capped.
     
     Args:
+        error: Rate limit or timeout error raised by the Anthropic client
         attempt: Current attempt number (0-indexed)
+        prev_delay: Delay returned by the previous attempt
         max_retries: Maximum number of retries
         
     Returns:
-        Delay in seconds, or None if max retries exceeded
+        Tuple of (delay in seconds, prev_delay for the next attempt),
+        or None if max retries exceeded
     """
     if attempt >= max_retries:
         return None
     
-    # Optimized exponential backoff with shorter delays for faster recovery
-    # Progressive delays: 0.5s, 1s, 2s, 4s, 8s, 15s, 20s, 25s, 30s, 35s
-    base_delays = [0.5, 1, 2, 4, 8, 15, 20, 25, 30, 35]
-    base_delay = base_delays[min(attempt, len(base_delays) - 1)]
-    
-    # Add random jitter to prevent thundering herd
-    jitter = random.uniform(0.1, 0.4)
-    delay = base_delay + jitter
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        delay = retry_after
+    else:
+        # Decorrelated jitter keeps concurrent clients from retrying in lockstep
+        delay = min(
+            RATE_LIMIT_MAX_DELAY,
+            random.uniform(RATE_LIMIT_BASE_DELAY, prev_delay * 3),
+        )
+        prev_delay = delay
     
     logger.warning(f"Rate limit hit, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
-    return delay
+    return delay, prev_delay
+
+
+def _load_storage_state(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Load a Playwright storageState JSON file, if one exists at path."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable storage state {path}: {e}")
+        return None
+
+
+def _local_storage_init_script(origins: List[Dict[str, Any]]) -> str:
+    """Build an init script that seeds saved localStorage entries for each origin.
+    
+    Keys the page has already written are left alone, so the script is safe to
+    run on every navigation.
+    """
+    saved = {
+        origin["origin"]: {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+        for origin in origins
+        if origin.get("origin")
+    }
+    return (
+        "(() => {"
+        f"const items = ({json.dumps(saved)})[window.location.origin];"
+        "if (!items) return;"
+        "for (const [name, value] of Object.entries(items)) {"
+        "try { if (window.localStorage.getItem(name) === null) window.localStorage.setItem(name, value); }"
+        "catch (e) {}"
+        "}"
+        "})();"
+    )
+
+
+# One sync Playwright driver per thread, shared by every SteelBrowserSession
+# on that thread. Sync Playwright objects cannot cross threads, so this is the
+# widest scope a driver can be shared at.
+_sync_playwright_local = threading.local()
+_sync_playwright_drivers: List[Any] = []
+_sync_playwright_lock = threading.Lock()
+
+
+def _shared_sync_playwright():
+    """Return this thread's Playwright driver, starting it on first use."""
+    driver = getattr(_sync_playwright_local, "driver", None)
+    if driver is None:
+        from playwright.sync_api import sync_playwright
+        driver = sync_playwright().start()
+        _sync_playwright_local.driver = driver
+        with _sync_playwright_lock:
+            _sync_playwright_drivers.append(driver)
+    return driver
+
+
+def _stop_shared_sync_playwright() -> None:
+    """Stop every shared driver; registered to run at interpreter exit."""
+    with _sync_playwright_lock:
+        drivers = list(_sync_playwright_drivers)
+        _sync_playwright_drivers.clear()
+    for driver in drivers:
+        try:
+            driver.stop()
+        except Exception as e:
+            logger.debug("Error stopping shared playwright driver: %s", e)
+
+
+atexit.register(_stop_shared_sync_playwright)
+
+
+class _PooledSession:
+    """Idle Steel session plus the Playwright objects connected to it."""
+    
+    __slots__ = ("created_at", "steel_client", "playwright", "session", "browser", "page", "timeout_seconds")
+    
+    def __init__(self, created_at, steel_client, playwright, session, browser, page, timeout_seconds=None):
+        self.created_at = created_at
+        self.steel_client = steel_client
+        self.playwright = playwright
+        self.session = session
+        self.browser = browser
+        self.page = page
+        self.timeout_seconds = timeout_seconds
+    
+    def max_age(self, pool_max_age: float) -> float:
+        """Usable age: the pool's limit, shortened to stay clear of the session timeout."""
+        if self.timeout_seconds is None:
+            return pool_max_age
+        return min(pool_max_age, self.timeout_seconds - POOLED_SESSION_TIMEOUT_MARGIN)
+    
+    def close(self) -> None:
+        """Tear down the browser connection and release the Steel session."""
+        for step, action in (
+            ("closing browser", lambda: self.browser.close()),
+            ("releasing Steel session", lambda: self.steel_client.sessions.release(self.session.id)),
+        ):
+            try:
+                action()
+            except Exception as e:
+                logger.warning(f"Error {step} for pooled session: {e}")
+
+
+class SteelSessionPool:
+    """Pool of idle Steel browser sessions for reuse by SteelBrowserSession.
+    
+    Reusing a session skips ``sessions.create`` and the CDP handshake. Idle
+    sessions are evicted least-recently-used beyond ``max_idle`` and discarded
+    once older than ``max_age_seconds``, or sooner when the session's own
+    timeout would expire first, so they are never handed out close to Steel's
+    session timeout. Sync Playwright objects are bound to the thread that
+    created them, so share a pool only within one thread.
+    """
+    
+    def __init__(self, max_idle: int = 4, max_age_seconds: float = 300.0):
+        self.max_idle = max_idle
+        self.max_age_seconds = max_age_seconds
+        self._idle: List[Tuple[Tuple, _PooledSession]] = []  # oldest first
+        self._lock = threading.Lock()
+        _session_pools.add(self)
+    
+    def __len__(self) -> int:
+        return len(self._idle)
+    
+    def acquire(self, key: Tuple) -> Optional[_PooledSession]:
+        """Take the most recently released idle session matching key, if any."""
+        found = None
+        with self._lock:
+            expired = self._pop_expired()
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i][0] == key:
+                    found = self._idle.pop(i)[1]
+                    break
+        for entry in expired:
+            entry.close()
+        return found
+    
+    def release(self, key: Tuple, entry: _PooledSession) -> None:
+        """Return a healthy session to the pool, evicting old or excess entries."""
+        with self._lock:
+            self._idle.append((key, entry))
+            evicted = self._pop_expired()
+            while len(self._idle) > self.max_idle:
+                evicted.append(self._idle.pop(0)[1])
+        for stale in evicted:
+            stale.close()
+    
+    def close_all(self) -> None:
+        """Close every idle session in the pool."""
+        with self._lock:
+            entries = [entry for _, entry in self._idle]
+            self._idle = []
+        for entry in entries:
+            entry.close()
+    
+    def _pop_expired(self) -> List[_PooledSession]:
+        """Remove and return entries past max_age_seconds; caller holds the lock."""
+        now = time.time()
+        expired = [entry for _, entry in self._idle
+                   if now - entry.created_at > entry.max_age(self.max_age_seconds)]
+        if expired:
+            self._idle = [(k, e) for k, e in self._idle
+                          if now - e.created_at <= e.max_age(self.max_age_seconds)]
+        return expired
+
+
+# Live pools, closed at exit without the registry keeping them alive
+_session_pools: "weakref.WeakSet[SteelSessionPool]" = weakref.WeakSet()
+
+
+def _close_session_pools() -> None:
+    """Close idle sessions in every live pool; registered to run at interpreter exit."""
+    for pool in list(_session_pools):
+        pool.close_all()
+
+
+# Registered after the driver shutdown so it runs first, while browsers can still be closed
+atexit.register(_close_session_pools)
 
 
 class SteelBrowserSession:
-    """Manages Steel browser session with Playwright integration."""
+    """Manages Steel browser session with Playwright integration.
+    
+    When ``storage_state_path`` is set, cookies and localStorage saved by a
+    previous session are restored on enter and the current state is written
+    back on exit, so login-gated tasks can skip signing in. Saved cookies keep
+    their original expiry; if the start URL answers 401 the saved state is
+    discarded and the page is reloaded once without it.
+    
+    When a ``session_pool`` is given, a matching idle session is reused on
+    enter and a healthy session is returned to the pool on exit instead of
+    being released. Cookies and site storage are wiped before a session goes
+    back to the pool; a session whose context carries a localStorage restore
+    script is released instead, since init scripts cannot be removed.
+    """
 
     def __init__(
         self,
@@ -351,109 +785,289 @@ class SteelBrowserSession:
         solve_captcha: bool = False,
         session_timeout: int = 900000,
         start_url: str = "https://example.com",
+        screenshot_format: str = "jpeg",
+        screenshot_quality: int = 75,
+        typing_delay_ms: int = 12,
+        typing_group_size: int = 2000,
+        fast_type: bool = True,
+        storage_state_path: Optional[str] = None,
+        session_pool: Optional[SteelSessionPool] = None,
     ):
+        if screenshot_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"screenshot_format must be one of {SCREENSHOT_FORMATS}")
+        if typing_group_size < 1:
+            raise ValueError("typing_group_size must be a positive int")
         self.steel_client = steel_client
         self.dimensions = (width, height)
+        self._w, self._h = width, height
+        self._max_x, self._max_y = width - 1, height - 1
         self.use_proxy = use_proxy
         self.solve_captcha = solve_captcha
         self.session_timeout = session_timeout
         self.start_url = start_url
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.typing_delay_ms = typing_delay_ms
+        self.typing_group_size = typing_group_size
+        self.fast_type = fast_type
+        self.storage_state_path = storage_state_path
+        self._storage_state_restored = False
+        self._storage_init_script_added = False
+        self.session_pool = session_pool
+        self._session_created_at = 0.0
         self.session: Optional[Session] = None
         self._playwright = None
         self._browser = None
         self._page = None
+        self._cdp = None
         self._last_mouse_position = None
         self._last_keepalive = 0
         self._keepalive_interval = 30  # seconds
+        # Page closed/url reads are reused for a short window between actions
+        self._page_state_ttl = 0.25  # seconds
+        self._page_state_cached_at = float("-inf")
+        self._cached_closed = True
+        self._cached_url = ""
+        # Last screenshot, reused briefly while nothing has touched the page
+        self._screenshot_reuse_window = 0.25  # seconds
+        self._last_screenshot_b64: Optional[str] = None
+        self._last_screenshot_at = 0.0
+        self._viewport_dirty = True
+        self._actions = {
+            "left_mouse_down": self._do_left_mouse_down,
+            "left_mouse_up": self._do_left_mouse_up,
+            "scroll": self._do_scroll,
+            "hold_key": self._do_hold_key,
+            "wait": self._do_wait,
+            "left_click": self._do_click,
+            "right_click": self._do_click,
+            "double_click": self._do_click,
+            "triple_click": self._do_click,
+            "middle_click": self._do_click,
+            "mouse_move": self._do_mouse_move,
+            "left_click_drag": self._do_left_click_drag,
+            "key": self._do_key,
+            "type": self._do_type,
+            "screenshot": self._do_nothing,
+            "cursor_position": self._do_nothing,
+        }
 
     def get_dimensions(self) -> Tuple[int, int]:
         return self.dimensions
 
+    @property
+    def screenshot_media_type(self) -> str:
+        """MIME type of the images returned by screenshot()."""
+        return f"image/{self.screenshot_format}"
+
+    def _playwright_screenshot_options(self) -> Dict[str, Any]:
+        """Build keyword arguments for Playwright's page.screenshot()."""
+        options: Dict[str, Any] = {
+            "full_page": False,
+            "clip": {"x": 0, "y": 0, "width": self._w, "height": self._h},
+            "type": self.screenshot_format,
+        }
+        if self.screenshot_format == "jpeg":
+            options["quality"] = self.screenshot_quality
+        return options
+
+    def _cdp_screenshot_params(self) -> Dict[str, Any]:
+        """Build parameters for the CDP Page.captureScreenshot command."""
+        params: Dict[str, Any] = {
+            "format": self.screenshot_format,
+            "clip": {"x": 0, "y": 0, "width": self._w, "height": self._h, "scale": 1},
+            # Favour encode speed over output size
+            "optimizeForSpeed": True,
+            # Only the visible surface; no offscreen raster
+            "captureBeyondViewport": False,
+        }
+        if self.screenshot_format == "jpeg":
+            params["quality"] = self.screenshot_quality
+        return params
+
+    def _get_cdp_session(self):
+        """Return the CDP session for the current page, creating it on first use."""
+        if self._cdp is None:
+            self._cdp = self._page.context.new_cdp_session(self._page)
+        return self._cdp
+
+    def _detach_cdp_session(self) -> None:
+        """Detach the cached CDP session so it does not outlive this session."""
+        if self._cdp is None:
+            return
+        try:
+            self._cdp.detach()
+        except Exception as e:
+            logger.debug("Error detaching CDP session: %s", e)
+        self._cdp = None
+
+    def _page_state(self) -> Tuple[bool, str]:
+        """Return (is_closed, url) for the current page, re-read at most once per TTL."""
+        now = time.monotonic()
+        if now - self._page_state_cached_at > self._page_state_ttl:
+            closed = self._page is None or self._page.is_closed()
+            self._cached_closed = closed
+            self._cached_url = "" if closed else self._page.url
+            self._page_state_cached_at = now
+        return self._cached_closed, self._cached_url
+
+    def _cached_page_closed(self) -> bool:
+        return self._page_state()[0]
+
+    def _cached_page_url(self) -> str:
+        return self._page_state()[1]
+
+    def _invalidate_page_state(self) -> None:
+        """Force the next page state read to go to the driver."""
+        self._page_state_cached_at = float("-inf")
+        self._viewport_dirty = True
+
     def get_current_url(self) -> str:
         try:
-            return self._page.url if self._page and not self._page.is_closed() else ""
+            return self._cached_page_url()
         except Exception:
             return ""
+
+    def page_state_key(self) -> Optional[str]:
+        """Fingerprint of URL, scroll position and load state, or None if unavailable."""
+        try:
+            return self._page.evaluate(_PAGE_STATE_KEY_JS)
+        except Exception as e:
+            logger.debug("Page state key unavailable: %s", e)
+            return None
     
-    def _ensure_page_ready(self) -> bool:
-        """Ensure the page is ready for operations."""
+    def _page_health_check(self, for_keepalive: bool = False) -> bool:
+        """Check that the page is usable, recovering a new page if it was closed.
+        
+        Every check also counts as a keepalive. With ``for_keepalive=True`` the
+        check is skipped until the keepalive interval has elapsed.
+        """
+        now = time.time()
+        if for_keepalive and now - self._last_keepalive <= self._keepalive_interval:
+            return True
+        self._last_keepalive = now
+        
         try:
-            if not self._page or self._page.is_closed():
+            closed, url = self._page_state()
+            if closed:
                 logger.warning("Page is closed, attempting to get a new page")
-                if self._browser and len(self._browser.contexts) > 0:
-                    context = self._browser.contexts[0]
-                    if len(context.pages) > 0:
-                        self._page = context.pages[0]
-                    else:
-                        self._page = context.new_page()
-                        width, height = self.dimensions
-                        self._page.set_viewport_size({"width": width, "height": height})
-                    logger.info("Successfully obtained new page")
-                    return True
-                else:
+                if not self._browser or len(self._browser.contexts) == 0:
                     logger.error("No browser context available")
                     return False
+                context = self._browser.contexts[0]
+                self._cdp = None
+                if len(context.pages) > 0:
+                    self._page = context.pages[0]
+                else:
+                    self._page = context.new_page()
+                    self._page.set_viewport_size({"width": self._w, "height": self._h})
+                self._invalidate_page_state()
+                logger.info("Successfully obtained new page")
+                return True
             
-            # Test basic page functionality
-            url = self._page.url
-            logger.debug(f"Page ready check passed, URL: {url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Page health check passed, URL: %s", url)
             return True
             
         except Exception as e:
-            logger.error(f"Page readiness check failed: {e}")
+            logger.warning(f"Page health check failed: {e}")
             return False
+    
+    def _restore_storage_state(self, context) -> None:
+        """Load saved cookies and localStorage into the browser context."""
+        state = _load_storage_state(self.storage_state_path)
+        if not state:
+            return
+        try:
+            if state.get("cookies"):
+                context.add_cookies(state["cookies"])
+            if state.get("origins"):
+                self._storage_init_script_added = True
+                context.add_init_script(script=_local_storage_init_script(state["origins"]))
+            self._storage_state_restored = True
+            logger.info("Restored browser storage state from %s", self.storage_state_path)
+        except Exception as e:
+            logger.warning(f"Failed to restore storage state: {e}")
 
-    def _validate_connection(self) -> bool:
-        """Validate that the browser connection is stable and ready."""
+    def _clear_context_state(self) -> bool:
+        """Wipe cookies and site storage so the next pooled user starts clean."""
         try:
-            if not self._browser or not self._page or self._page.is_closed():
-                return False
-            
-            # Test basic page operations
-            url = self._page.url
-            logger.debug(f"Page URL: {url}")
+            context = self._page.context
+            cdp = self._get_cdp_session()
+            for origin in context.storage_state().get("origins", []):
+                if origin.get("origin"):
+                    cdp.send("Storage.clearDataForOrigin", {"origin": origin["origin"], "storageTypes": "all"})
+            context.clear_cookies()
+            self._page.evaluate("() => { try { window.sessionStorage.clear(); } catch (e) {} }")
+            self._page.goto(FALLBACK_PAGE_URL, wait_until="commit", timeout=FALLBACK_PAGE_TIMEOUT_MS)
+            self._invalidate_page_state()
             return True
         except Exception as e:
-            logger.warning(f"Connection validation failed: {e}")
+            logger.warning(f"Failed to clear pooled session state: {e}")
             return False
-    
+
+    def _save_storage_state(self) -> None:
+        """Write the current cookies and localStorage to storage_state_path."""
+        if not self.storage_state_path or not self._browser or not self._browser.contexts:
+            return
+        try:
+            self._browser.contexts[0].storage_state(path=self.storage_state_path)
+            logger.info("Saved browser storage state to %s", self.storage_state_path)
+        except Exception as e:
+            logger.warning(f"Failed to save storage state: {e}")
+
+    def _discard_storage_state(self) -> None:
+        """Drop restored state that the site rejected so the next login starts clean."""
+        self._storage_state_restored = False
+        try:
+            if os.path.exists(self.storage_state_path):
+                os.remove(self.storage_state_path)
+            self._page.context.clear_cookies()
+        except Exception as e:
+            logger.warning(f"Failed to discard storage state: {e}")
+
     def _connect_to_browser_with_retry(self, steel_api_key: str, max_retries: int = 3) -> bool:
         """Connect to Steel browser with retry logic."""
         for attempt in range(max_retries):
             try:
-                logger.info(f"Connecting to Steel browser via CDP (attempt {attempt + 1}/{max_retries}): {self.session.websocket_url}")
+                logger.info("Connecting to Steel browser via CDP (attempt %s/%s): %s", attempt + 1, max_retries, self.session.websocket_url)
                 browser = self._playwright.chromium.connect_over_cdp(
                     f"{self.session.websocket_url}&apiKey={steel_api_key}",
                     timeout=60000
                 )
                 self._browser = browser
                 
-                # Wait a moment for the connection to stabilize
-                time.sleep(1.0)
-                
                 context = browser.contexts[0]
-                logger.info(f"Connected to browser context with {len(context.pages)} pages")
+                logger.info("Connected to browser context with %s pages", len(context.pages))
+                self._restore_storage_state(context)
 
                 if len(context.pages) == 0:
                     logger.warning("No pages available in browser context, creating new page")
                     self._page = context.new_page()
                 else:
                     self._page = context.pages[0]
+                self._invalidate_page_state()
+                
+                # Actively wait for the page instead of sleeping a fixed time
+                try:
+                    self._page.wait_for_load_state("domcontentloaded", timeout=5000)
+                except PlaywrightError as load_error:
+                    logger.debug("Initial page load wait failed: %s", load_error)
                 
                 # Validate the connection
-                if self._validate_connection():
+                if self._page_health_check():
                     logger.info("Browser connection validated successfully")
                     return True
                 else:
                     logger.warning(f"Connection validation failed on attempt {attempt + 1}")
                     if attempt < max_retries - 1:
-                        time.sleep(2.0)  # Wait before retry
+                        time.sleep(CONNECT_RETRY_BASE_DELAY * 2 ** attempt)
                         continue
                     
             except Exception as e:
                 logger.warning(f"Browser connection attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2.0)  # Wait before retry
+                    time.sleep(CONNECT_RETRY_BASE_DELAY * 2 ** attempt)
                     continue
                 else:
                     raise e
@@ -462,10 +1076,10 @@ class SteelBrowserSession:
     
     def _safe_navigate_to_start_url(self) -> None:
         """Safely navigate to start URL with comprehensive error recovery."""
-        logger.info(f"Navigating to start URL: {self.start_url}")
+        logger.info("Navigating to start URL: %s", self.start_url)
         
         # First, ensure we have a valid page
-        if not self._ensure_page_ready():
+        if not self._page_health_check():
             logger.error("Cannot navigate - page is not ready")
             return
         
@@ -475,41 +1089,60 @@ class SteelBrowserSession:
         else:
             # Try primary navigation
             try:
-                self._page.goto(self.start_url, wait_until="domcontentloaded", timeout=15000)
-                logger.info(f"Successfully navigated to: {self._page.url}")
+                response = self._page.goto(self.start_url, wait_until="commit", timeout=START_URL_TIMEOUT_MS)
+                if self._storage_state_restored and response is not None and response.status == 401:
+                    logger.warning("Saved storage state was rejected (401), retrying without it")
+                    self._discard_storage_state()
+                    self._page.goto(self.start_url, wait_until="commit", timeout=START_URL_TIMEOUT_MS)
+                self._invalidate_page_state()
+                logger.info("Successfully navigated to: %s", self._page.url)
                 return
             except Exception as nav_error:
                 logger.warning(f"Primary navigation to {self.start_url} failed: {nav_error}")
                 
                 # Check if page is still valid after navigation failure
-                if not self._ensure_page_ready():
+                if not self._page_health_check():
                     logger.warning("Page became invalid after navigation failure")
                     return
         
-        # Try fallback navigation strategies - start with safest options first
-        fallback_urls = [
-            "data:text/html,<html><body><h1>Ready for automation</h1><p>Browser session active</p></body></html>",  # Safe data URI
-            "https://httpbin.org",  # Simple HTTP testing service
-            "https://example.com",  # Minimal test site
-        ]
+        # Fall back to a blank page; it commits without touching the network
+        try:
+            self._page.goto(FALLBACK_PAGE_URL, wait_until="commit", timeout=FALLBACK_PAGE_TIMEOUT_MS)
+            self._invalidate_page_state()
+            logger.info("Using blank fallback page")
+        except Exception as fallback_error:
+            logger.warning(f"Fallback navigation failed: {fallback_error}")
+            logger.info("Continuing with current page - Claude can navigate manually")
+
+    def _pool_key(self) -> Tuple:
+        # Sessions belong to one Steel account and keep their creation timeout
+        account = getattr(self.steel_client, "steel_api_key", None) or id(self.steel_client)
+        return (self._w, self._h, self.use_proxy, self.solve_captcha, self.session_timeout, account)
+
+    def _attach_pooled_session(self) -> bool:
+        """Adopt an idle session from the pool; returns False when none is usable."""
+        entry = self.session_pool.acquire(self._pool_key())
+        if entry is None:
+            return False
         
-        for fallback_url in fallback_urls:
-            try:
-                logger.info(f"Trying fallback navigation to: {fallback_url}")
-                self._page.goto(fallback_url, wait_until="domcontentloaded", timeout=15000)
-                logger.info(f"Successfully navigated to fallback: {self._page.url}")
-                return
-            except Exception as fallback_error:
-                logger.warning(f"Fallback navigation to {fallback_url} failed: {fallback_error}")
-                # Ensure page is still ready for next attempt
-                if not self._ensure_page_ready():
-                    logger.error("Page became invalid, cannot continue navigation attempts")
-                    return
-                continue
+        self.session = entry.session
+        self._playwright = entry.playwright
+        self._browser = entry.browser
+        self._page = entry.page
+        self._session_created_at = entry.created_at
+        self._cdp = None
+        self._invalidate_page_state()
+        
+        if not self._page_health_check():
+            logger.warning("Pooled Steel session is unhealthy, creating a new one")
+            entry.close()
+            self.session = self._playwright = self._browser = self._page = None
+            return False
         
-        # If all navigation attempts failed, log and continue
-        logger.info("All navigation attempts failed - continuing with current page")
-        logger.info("Claude will be able to navigate manually during task execution")
+        logger.info("Reusing pooled Steel session: %s", self.session.session_viewer_url)
+        self._restore_storage_state(self._page.context)
+        self._safe_navigate_to_start_url()
+        return True
 
     def __enter__(self):
         width, height = self.dimensions
@@ -521,11 +1154,15 @@ class SteelBrowserSession:
             "dimensions": {"width": width, "height": height}
         }
         
+        if self.session_pool is not None and self._attach_pooled_session():
+            return self
+        
         try:
             self.session = self.steel_client.sessions.create(**session_params)
-            logger.info(f"Steel Session created: {self.session.session_viewer_url}")
+            self._session_created_at = time.time()
+            logger.info("Steel Session created: %s", self.session.session_viewer_url)
 
-            self._playwright = sync_playwright().start()
+            self._playwright = _shared_sync_playwright()
             
             # Get Steel API key from environment or Steel client
             steel_api_key = os.getenv("STEEL_API_KEY")
@@ -544,7 +1181,7 @@ class SteelBrowserSession:
                 try:
                     error_message = str(error)
                     if "Cannot redefine property" in error_message:
-                        logger.debug(f"Suppressing non-critical page error: {error}")
+                        logger.debug("Suppressing non-critical page error: %s", error)
                     else:
                         logger.warning(f"Page error: {error}")
                 except Exception as handler_error:
@@ -555,19 +1192,22 @@ class SteelBrowserSession:
             # Set viewport size with error handling
             try:
                 self._page.set_viewport_size({"width": width, "height": height})
-                logger.info(f"Viewport set to {width}x{height}")
+                logger.info("Viewport set to %sx%s", width, height)
             except Exception as viewport_error:
                 logger.warning(f"Failed to set viewport size: {viewport_error}")
                 # Continue anyway - this isn't critical
             
+            # Open the CDP session used for screenshots up front
+            try:
+                self._get_cdp_session()
+            except Exception as cdp_error:
+                logger.warning(f"Failed to open CDP session: {cdp_error}")
+            
             # Navigate to start URL with enhanced error recovery
             self._safe_navigate_to_start_url()
             
-            # Wait a moment for the session to stabilize
-            time.sleep(2.0)
-            
             # Verify the session is still working
-            if not self._validate_connection():
+            if not self._page_health_check():
                 logger.warning("Session validation failed after initialization")
             
             return self
@@ -579,11 +1219,6 @@ class SteelBrowserSession:
                     self._browser.close()
                 except:
                     pass
-            if hasattr(self, '_playwright') and self._playwright:
-                try:
-                    self._playwright.stop()
-                except:
-                    pass
             if hasattr(self, 'session') and self.session:
                 try:
                     self.steel_client.sessions.release(self.session.id)
@@ -594,6 +1229,22 @@ class SteelBrowserSession:
     def __exit__(self, exc_type, exc_val, exc_tb):
         logger.info("Cleaning up Steel browser session...")
         
+        # Persist cookies and localStorage before the context goes away
+        self._save_storage_state()
+        
+        # Hand healthy sessions back to the pool, wiped, instead of tearing them down
+        pooled = (self.session_pool is not None and exc_type is None and self.session
+                  and not self._storage_init_script_added
+                  and self._page_health_check() and self._clear_context_state())
+        self._detach_cdp_session()
+        if pooled:
+            self.session_pool.release(self._pool_key(), _PooledSession(
+                self._session_created_at, self.steel_client, self._playwright,
+                self.session, self._browser, self._page, self.session_timeout / 1000,
+            ))
+            logger.info("Returned Steel session to pool: %s", self.session.session_viewer_url)
+            return
+        
         # Close page first
         if hasattr(self, '_page') and self._page:
             try:
@@ -610,96 +1261,247 @@ class SteelBrowserSession:
             except Exception as e:
                 logger.warning(f"Error closing browser: {e}")
         
-        # Stop playwright
-        if hasattr(self, '_playwright') and self._playwright:
-            try:
-                self._playwright.stop()
-                logger.info("Playwright stopped")
-            except Exception as e:
-                logger.warning(f"Error stopping playwright: {e}")
+        # The Playwright driver is shared per thread and stopped at exit
 
         # Release Steel session last
         if hasattr(self, 'session') and self.session:
             try:
                 logger.info("Releasing Steel session...")
                 self.steel_client.sessions.release(self.session.id)
-                logger.info(f"Session completed. View replay at {self.session.session_viewer_url}")
+                logger.info("Session completed. View replay at %s", self.session.session_viewer_url)
             except Exception as e:
                 logger.warning(f"Error releasing Steel session: {e}")
     
-    def _perform_keepalive_if_needed(self) -> None:
-        """Perform keepalive check if enough time has passed."""
-        current_time = time.time()
-        if current_time - self._last_keepalive > self._keepalive_interval:
-            try:
-                # Simple keepalive - check if page is still responsive
-                if self._page and not self._page.is_closed():
-                    url = self._page.url
-                    logger.debug(f"Keepalive check passed - URL: {url}")
-                    self._last_keepalive = current_time
-                else:
-                    logger.warning("Keepalive check failed - page is closed")
-                    self._last_keepalive = current_time
-            except Exception as e:
-                logger.warning(f"Keepalive check failed: {e}")
-                self._last_keepalive = current_time
+    def _reusable_screenshot(self) -> Optional[str]:
+        """Return the last screenshot if no action has touched the page since."""
+        if (not self._viewport_dirty and self._last_screenshot_b64 is not None
+                and time.monotonic() - self._last_screenshot_at < self._screenshot_reuse_window):
+            return self._last_screenshot_b64
+        return None
+
+    def _remember_screenshot(self, data: str) -> str:
+        self._last_screenshot_b64 = data
+        self._last_screenshot_at = time.monotonic()
+        self._viewport_dirty = False
+        return data
 
     def screenshot(self) -> str:
-        """Take a screenshot and return base64 encoded image."""
-        # Perform keepalive check if needed
-        self._perform_keepalive_if_needed()
-        
-        # Ensure page is ready for screenshot
-        if not self._ensure_page_ready():
+        """Take a screenshot and return the base64 encoded image.
+
+        The encoding follows ``screenshot_format``; JPEG keeps both the capture
+        cost and the upload to Claude well below lossless PNG. A screenshot
+        taken within ``_screenshot_reuse_window`` seconds is returned again
+        when no rendering action has run since.
+        """
+        cached = self._reusable_screenshot()
+        if cached is not None:
+            return cached
+        return self._remember_screenshot(self._capture_screenshot())
+
+    def _capture_screenshot(self) -> str:
+        # Ensure page is ready for screenshot (also serves as the keepalive)
+        if not self._page_health_check():
             raise RuntimeError("Browser session is not ready for screenshot")
         
         try:
-            width, height = self.dimensions
-            png_bytes = self._page.screenshot(
-                full_page=False,
-                clip={"x": 0, "y": 0, "width": width, "height": height}
+            # CDP already returns base64, so no encode step is needed
+            result = self._get_cdp_session().send(
+                "Page.captureScreenshot", self._cdp_screenshot_params()
             )
-            return base64.b64encode(png_bytes).decode("utf-8")
+            return result["data"]
         except PlaywrightError as error:
             error_msg = str(error)
             if "Target page, context or browser has been closed" in error_msg:
                 logger.error(f"Browser session closed unexpectedly: {error}")
                 raise RuntimeError("Browser session has been terminated. This may be due to Steel session timeout, network issues, or browser instability.")
             
-            logger.error(f"Screenshot failed, trying CDP fallback: {error}")
+            logger.error(f"CDP screenshot failed, trying Playwright fallback: {error}")
+            self._cdp = None
             try:
-                cdp_session = self._page.context.new_cdp_session(self._page)
-                result = cdp_session.send(
-                    "Page.captureScreenshot", {"format": "png", "fromSurface": False}
-                )
-                return result["data"]
-            except PlaywrightError as cdp_error:
-                logger.error(f"CDP screenshot also failed: {cdp_error}")
-                if "Target page, context or browser has been closed" in str(cdp_error):
+                image_bytes = self._page.screenshot(**self._playwright_screenshot_options())
+                return _encode_screenshot(image_bytes)
+            except PlaywrightError as fallback_error:
+                logger.error(f"Playwright screenshot also failed: {fallback_error}")
+                if "Target page, context or browser has been closed" in str(fallback_error):
                     raise RuntimeError("Browser session has been terminated. This may be due to Steel session timeout, network issues, or browser instability.")
                 raise error
 
+    def _type_text(self, text: str) -> None:
+        """Type text into the focused element.
+        
+        With ``fast_type`` each line is inserted in one CDP Input.insertText
+        call and newlines are pressed as Enter, instead of one simulated
+        keystroke per character. Set ``fast_type=False`` for pages that rely
+        on per-key keydown/keyup events.
+        """
+        if self.fast_type:
+            try:
+                cdp_session = self._get_cdp_session()
+                for i, line in enumerate(text.split("\n")):
+                    if i:
+                        self._page.keyboard.press("Enter")
+                    if line:
+                        cdp_session.send("Input.insertText", {"text": line})
+                return
+            except PlaywrightError as e:
+                if "Target page, context or browser has been closed" in str(e):
+                    raise
+                logger.warning(f"Fast typing failed, falling back to key events: {e}")
+                self._cdp = None
+        
+        # Typical input goes out in one keyboard.type call; only very long
+        # text is split. The per-key delay paces input, so no sleep between chunks
+        group_size = self.typing_group_size
+        for i in range(0, len(text), group_size):
+            self._page.keyboard.type(text[i:i + group_size], delay=self.typing_delay_ms)
+
+    def _triple_click(self, x: int, y: int) -> None:
+        """Triple-click as one CDP press/release pair with clickCount=3.
+        
+        The browser sees a single triple-click, so selection does not depend
+        on three separate clicks landing inside the double-click interval.
+        """
+        event = {"x": x, "y": y, "button": "left", "clickCount": 3}
+        try:
+            cdp_session = self._get_cdp_session()
+            cdp_session.send("Input.dispatchMouseEvent", {"type": "mousePressed", **event})
+            cdp_session.send("Input.dispatchMouseEvent", {"type": "mouseReleased", **event})
+        except PlaywrightError as e:
+            if "Target page, context or browser has been closed" in str(e):
+                raise
+            logger.warning(f"CDP triple click failed, falling back to mouse.click: {e}")
+            self._cdp = None
+            self._page.mouse.click(x, y, click_count=3)
+
     def validate_and_get_coordinates(self, coordinate):
         """Validate and get coordinates like the canonical example."""
-        if not isinstance(coordinate, (list, tuple)) or len(coordinate) != 2:
+        if not isinstance(coordinate, (list, tuple)):
             raise ValueError(f"{coordinate} must be a tuple or list of length 2")
-        if not all(isinstance(i, int) and i >= 0 for i in coordinate):
+        try:
+            x, y = coordinate
+        except ValueError:
+            raise ValueError(f"{coordinate} must be a tuple or list of length 2") from None
+        if not isinstance(x, int) or not isinstance(y, int) or x < 0 or y < 0:
             raise ValueError(f"{coordinate} must be a tuple/list of non-negative ints")
         
-        x, y = self.clamp_coordinates(coordinate[0], coordinate[1])
+        # Fast path for in-bounds values; only overflow goes through the clamp
+        max_x, max_y = self._max_x, self._max_y
+        if x > max_x or y > max_y:
+            return self.clamp_coordinates(x, y)
         return x, y
 
     def clamp_coordinates(self, x: int, y: int) -> Tuple[int, int]:
         """Clamp coordinates to viewport bounds."""
-        width, height = self.dimensions
-        clamped_x = max(0, min(x, width - 1))
-        clamped_y = max(0, min(y, height - 1))
+        max_x, max_y = self._max_x, self._max_y
+        clamped_x = 0 if x < 0 else (max_x if x > max_x else x)
+        clamped_y = 0 if y < 0 else (max_y if y > max_y else y)
         
         if x != clamped_x or y != clamped_y:
             logger.warning(f"Coordinate clamped: ({x}, {y}) → ({clamped_x}, {clamped_y})")
         
         return clamped_x, clamped_y
 
+    def _do_left_mouse_down(self, **_) -> None:
+        self._page.mouse.down()
+
+    def _do_left_mouse_up(self, **_) -> None:
+        self._page.mouse.up()
+
+    def _do_scroll(self, text=None, coordinate=None, scroll_direction=None, scroll_amount=None, **_) -> None:
+        if scroll_direction not in _SCROLL_DELTAS:
+            raise ValueError("scroll_direction must be 'up', 'down', 'left', or 'right'")
+        if scroll_amount is None or not isinstance(scroll_amount, int) or scroll_amount < 0:
+            raise ValueError("scroll_amount must be a non-negative int")
+        
+        if coordinate is not None:
+            x, y = self.validate_and_get_coordinates(coordinate)
+            self._page.mouse.move(x, y)
+            self._last_mouse_position = (x, y)
+        
+        if text:
+            modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY.get(text, text)
+            self._page.keyboard.down(modifier_key)
+        
+        delta_x, delta_y = _SCROLL_DELTAS[scroll_direction]
+        self._page.mouse.wheel(delta_x * scroll_amount, delta_y * scroll_amount)
+        
+        if text:
+            self._page.keyboard.up(modifier_key)
+
+    def _do_hold_key(self, text=None, duration=None, **_) -> None:
+        _validate_duration(duration)
+        hold_key = CUA_KEY_TO_PLAYWRIGHT_KEY.get(text, text)
+        if duration < SHORT_HOLD_SECONDS:
+            try:
+                cdp_session = self._get_cdp_session()
+                cdp_session.send("Input.dispatchKeyEvent", {"type": "keyDown", "key": hold_key})
+                time.sleep(duration)
+                cdp_session.send("Input.dispatchKeyEvent", {"type": "keyUp", "key": hold_key})
+                return
+            except PlaywrightError as e:
+                if "Target page, context or browser has been closed" in str(e):
+                    raise
+                logger.warning(f"CDP key hold failed, falling back to keyboard events: {e}")
+                self._cdp = None
+        
+        self._page.keyboard.down(hold_key)
+        time.sleep(duration)
+        self._page.keyboard.up(hold_key)
+
+    def _do_wait(self, duration=None, **_) -> None:
+        _validate_duration(duration)
+        time.sleep(duration)
+
+    def _do_click(self, action, coordinate=None, key=None, **_) -> None:
+        if coordinate is not None:
+            x, y = self.validate_and_get_coordinates(coordinate)
+            self._page.mouse.move(x, y)
+            self._last_mouse_position = (x, y)
+            click_x, click_y = x, y
+        elif self._last_mouse_position:
+            click_x, click_y = self._last_mouse_position
+        else:
+            click_x, click_y = self._w // 2, self._h // 2
+        
+        if key:
+            modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY.get(key, key)
+            self._page.keyboard.down(modifier_key)
+        
+        if action == "left_click":
+            self._page.mouse.click(click_x, click_y)
+        elif action == "right_click":
+            self._page.mouse.click(click_x, click_y, button="right")
+        elif action == "double_click":
+            self._page.mouse.dblclick(click_x, click_y)
+        elif action == "triple_click":
+            self._triple_click(click_x, click_y)
+        elif action == "middle_click":
+            self._page.mouse.click(click_x, click_y, button="middle")
+        
+        if key:
+            self._page.keyboard.up(modifier_key)
+
+    def _do_mouse_move(self, coordinate, **_) -> None:
+        x, y = self.validate_and_get_coordinates(coordinate)
+        self._page.mouse.move(x, y)
+        self._last_mouse_position = (x, y)
+
+    def _do_left_click_drag(self, coordinate, **_) -> None:
+        x, y = self.validate_and_get_coordinates(coordinate)
+        self._page.mouse.down()
+        self._page.mouse.move(x, y)
+        self._page.mouse.up()
+        self._last_mouse_position = (x, y)
+
+    def _do_key(self, text, **_) -> None:
+        self._page.keyboard.press(_apply_key_mapping(text))
+
+    def _do_type(self, text, **_) -> None:
+        self._type_text(text)
+
+    def _do_nothing(self, **_) -> None:
+        pass
+
     def execute_computer_action(
         self, 
         action: str, 
@@ -714,206 +1516,39 @@ class SteelBrowserSession:
         """Execute a computer action and return screenshot."""
         
         # Check if browser session is still active before action
-        if not self._page or self._page.is_closed():
+        if self._cached_page_closed():
             raise RuntimeError("Browser session has been closed")
+        if action not in _NON_RENDERING_ACTIONS:
+            self._viewport_dirty = True
         
-        try:
-            if action in ("left_mouse_down", "left_mouse_up"):
-                if coordinate is not None:
-                    raise ValueError(f"coordinate is not accepted for {action}")
-                
-                if action == "left_mouse_down":
-                    self._page.mouse.down()
-                elif action == "left_mouse_up":
-                    self._page.mouse.up()
-                
-                return self.screenshot()
+        handler = self._actions.get(action)
+        if handler is None:
+            raise ValueError(f"Invalid action: {action}")
+        _validate_action_args(action, text, coordinate)
         
+        try:
+            handler(
+                action=action,
+                text=text,
+                coordinate=coordinate,
+                scroll_direction=scroll_direction,
+                scroll_amount=scroll_amount,
+                duration=duration,
+                key=key,
+            )
         except PlaywrightError as e:
             if "Target page, context or browser has been closed" in str(e):
                 raise RuntimeError(f"Browser session closed during action '{action}': {e}")
-            else:
-                raise e
-        
-        if action == "scroll":
-            if scroll_direction is None or scroll_direction not in ("up", "down", "left", "right"):
-                raise ValueError("scroll_direction must be 'up', 'down', 'left', or 'right'")
-            if scroll_amount is None or not isinstance(scroll_amount, int) or scroll_amount < 0:
-                raise ValueError("scroll_amount must be a non-negative int")
-            
-            try:
-                if coordinate is not None:
-                    x, y = self.validate_and_get_coordinates(coordinate)
-                    self._page.mouse.move(x, y)
-                    self._last_mouse_position = (x, y)
-                
-                if text:
-                    modifier_key = text
-                    if modifier_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                        modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY[modifier_key]
-                    self._page.keyboard.down(modifier_key)
-                
-                scroll_mapping = {
-                    "down": (0, 100 * scroll_amount),
-                    "up": (0, -100 * scroll_amount),
-                    "right": (100 * scroll_amount, 0),
-                    "left": (-100 * scroll_amount, 0)
-                }
-                delta_x, delta_y = scroll_mapping[scroll_direction]
-                self._page.mouse.wheel(delta_x, delta_y)
-                
-                if text:
-                    self._page.keyboard.up(modifier_key)
-                
-                return self.screenshot()
-                
-            except PlaywrightError as e:
-                if "Target page, context or browser has been closed" in str(e):
-                    raise RuntimeError(f"Browser session closed during scroll action: {e}")
-                else:
-                    raise e
-        
-        if action in ("hold_key", "wait"):
-            if duration is None or not isinstance(duration, (int, float)):
-                raise ValueError("duration must be a number")
-            if duration < 0:
-                raise ValueError("duration must be non-negative")
-            if duration > 100:
-                raise ValueError("duration is too long")
-            
-            if action == "hold_key":
-                if text is None:
-                    raise ValueError("text is required for hold_key")
-                
-                hold_key = text
-                if hold_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                    hold_key = CUA_KEY_TO_PLAYWRIGHT_KEY[hold_key]
-                
-                self._page.keyboard.down(hold_key)
-                time.sleep(duration)
-                self._page.keyboard.up(hold_key)
-                
-            elif action == "wait":
-                time.sleep(duration)
-            
-            return self.screenshot()
-        
-        if action in ("left_click", "right_click", "double_click", "triple_click", "middle_click"):
-            if text is not None:
-                raise ValueError(f"text is not accepted for {action}")
-            
-            if coordinate is not None:
-                x, y = self.validate_and_get_coordinates(coordinate)
-                self._page.mouse.move(x, y)
-                self._last_mouse_position = (x, y)
-                click_x, click_y = x, y
-            elif self._last_mouse_position:
-                click_x, click_y = self._last_mouse_position
-            else:
-                width, height = self.dimensions
-                click_x, click_y = width // 2, height // 2
-            
-            if key:
-                modifier_key = key
-                if modifier_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                    modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY[modifier_key]
-                self._page.keyboard.down(modifier_key)
-            
-            if action == "left_click":
-                self._page.mouse.click(click_x, click_y)
-            elif action == "right_click":
-                self._page.mouse.click(click_x, click_y, button="right")
-            elif action == "double_click":
-                self._page.mouse.dblclick(click_x, click_y)
-            elif action == "triple_click":
-                for _ in range(3):
-                    self._page.mouse.click(click_x, click_y)
-            elif action == "middle_click":
-                self._page.mouse.click(click_x, click_y, button="middle")
-            
-            if key:
-                self._page.keyboard.up(modifier_key)
-            
-            return self.screenshot()
-        
-        if action in ("mouse_move", "left_click_drag"):
-            if coordinate is None:
-                raise ValueError(f"coordinate is required for {action}")
-            if text is not None:
-                raise ValueError(f"text is not accepted for {action}")
-            
-            x, y = self.validate_and_get_coordinates(coordinate)
-            
-            if action == "mouse_move":
-                self._page.mouse.move(x, y)
-                self._last_mouse_position = (x, y)
-            elif action == "left_click_drag":
-                self._page.mouse.down()
-                self._page.mouse.move(x, y)
-                self._page.mouse.up()
-                self._last_mouse_position = (x, y)
-            
-            return self.screenshot()
-        
-        if action in ("key", "type"):
-            if text is None:
-                raise ValueError(f"text is required for {action}")
-            if coordinate is not None:
-                raise ValueError(f"coordinate is not accepted for {action}")
-            
-            if action == "key":
-                press_key = text
-                
-                if "+" in press_key:
-                    key_parts = press_key.split("+")
-                    modifier_keys = key_parts[:-1]
-                    main_key = key_parts[-1]
-                    
-                    playwright_modifiers = []
-                    for mod in modifier_keys:
-                        if mod.lower() in ("ctrl", "control"):
-                            playwright_modifiers.append("Control")
-                        elif mod.lower() in ("shift",):
-                            playwright_modifiers.append("Shift")
-                        elif mod.lower() in ("alt", "option"):
-                            playwright_modifiers.append("Alt")
-                        elif mod.lower() in ("cmd", "meta", "super"):
-                            playwright_modifiers.append("Meta")
-                        else:
-                            playwright_modifiers.append(mod)
-                    
-                    if main_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                        main_key = CUA_KEY_TO_PLAYWRIGHT_KEY[main_key]
-                    
-                    press_key = "+".join(playwright_modifiers + [main_key])
-                else:
-                    if press_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                        press_key = CUA_KEY_TO_PLAYWRIGHT_KEY[press_key]
-                
-                self._page.keyboard.press(press_key)
-            elif action == "type":
-                # Type with chunking for better reliability
-                TYPING_DELAY_MS = 12
-                TYPING_GROUP_SIZE = 50
-                for chunk in [text[i:i + TYPING_GROUP_SIZE] for i in range(0, len(text), TYPING_GROUP_SIZE)]:
-                    self._page.keyboard.type(chunk, delay=TYPING_DELAY_MS)
-                    time.sleep(0.01)
-            
-            return self.screenshot()
-        
-        if action in ("screenshot", "cursor_position"):
-            if text is not None:
-                raise ValueError(f"text is not accepted for {action}")
-            if coordinate is not None:
-                raise ValueError(f"coordinate is not accepted for {action}")
-            
-            return self.screenshot()
+            raise
         
-        raise ValueError(f"Invalid action: {action}")
+        return self.screenshot()
 
 
 class AsyncSteelBrowserSession:
-    """Async version of Steel browser session with Playwright integration."""
+    """Async version of Steel browser session with Playwright integration.
+    
+    Supports the same ``storage_state_path`` persistence as SteelBrowserSession.
+    """
 
     def __init__(
         self,
@@ -924,27 +1559,188 @@ class AsyncSteelBrowserSession:
         solve_captcha: bool = False,
         session_timeout: int = 900000,
         start_url: str = "https://example.com",
+        screenshot_format: str = "jpeg",
+        screenshot_quality: int = 75,
+        typing_delay_ms: int = 12,
+        typing_group_size: int = 2000,
+        fast_type: bool = True,
+        storage_state_path: Optional[str] = None,
     ):
+        if screenshot_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"screenshot_format must be one of {SCREENSHOT_FORMATS}")
+        if typing_group_size < 1:
+            raise ValueError("typing_group_size must be a positive int")
         self.steel_client = steel_client
         self.dimensions = (width, height)
+        self._w, self._h = width, height
+        self._max_x, self._max_y = width - 1, height - 1
         self.use_proxy = use_proxy
         self.solve_captcha = solve_captcha
         self.session_timeout = session_timeout
         self.start_url = start_url
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.typing_delay_ms = typing_delay_ms
+        self.typing_group_size = typing_group_size
+        self.fast_type = fast_type
+        self.storage_state_path = storage_state_path
+        self._storage_state_restored = False
         self.session: Optional[Session] = None
         self._playwright = None
         self._browser = None
         self._page = None
+        self._cdp = None
         self._last_mouse_position = None
         self._last_keepalive = 0
         self._keepalive_interval = 30  # seconds
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # Last screenshot, reused briefly while nothing has touched the page
+        self._screenshot_reuse_window = 0.25  # seconds
+        self._last_screenshot_b64: Optional[str] = None
+        self._last_screenshot_at = 0.0
+        self._viewport_dirty = True
+        self._actions = {
+            "left_mouse_down": self._do_left_mouse_down,
+            "left_mouse_up": self._do_left_mouse_up,
+            "scroll": self._do_scroll,
+            "hold_key": self._do_hold_key,
+            "wait": self._do_wait,
+            "left_click": self._do_click,
+            "right_click": self._do_click,
+            "double_click": self._do_click,
+            "triple_click": self._do_click,
+            "middle_click": self._do_click,
+            "mouse_move": self._do_mouse_move,
+            "left_click_drag": self._do_left_click_drag,
+            "key": self._do_key,
+            "type": self._do_type,
+            "screenshot": self._do_nothing,
+            "cursor_position": self._do_nothing,
+        }
 
     def get_dimensions(self) -> Tuple[int, int]:
         return self.dimensions
 
+    @property
+    def screenshot_media_type(self) -> str:
+        """MIME type of the images returned by screenshot()."""
+        return f"image/{self.screenshot_format}"
+
+    def _playwright_screenshot_options(self) -> Dict[str, Any]:
+        """Build keyword arguments for Playwright's page.screenshot()."""
+        options: Dict[str, Any] = {
+            "full_page": False,
+            "clip": {"x": 0, "y": 0, "width": self._w, "height": self._h},
+            "type": self.screenshot_format,
+        }
+        if self.screenshot_format == "jpeg":
+            options["quality"] = self.screenshot_quality
+        return options
+
+    def _cdp_screenshot_params(self) -> Dict[str, Any]:
+        """Build parameters for the CDP Page.captureScreenshot command."""
+        params: Dict[str, Any] = {
+            "format": self.screenshot_format,
+            "clip": {"x": 0, "y": 0, "width": self._w, "height": self._h, "scale": 1},
+            # Favour encode speed over output size
+            "optimizeForSpeed": True,
+            # Only the visible surface; no offscreen raster
+            "captureBeyondViewport": False,
+        }
+        if self.screenshot_format == "jpeg":
+            params["quality"] = self.screenshot_quality
+        return params
+
+    async def _get_cdp_session(self):
+        """Return the CDP session for the current page, creating it on first use."""
+        if self._cdp is None:
+            self._cdp = await self._page.context.new_cdp_session(self._page)
+        return self._cdp
+
+    async def _detach_cdp_session(self) -> None:
+        """Detach the cached CDP session so it does not outlive this session."""
+        if self._cdp is None:
+            return
+        try:
+            await self._cdp.detach()
+        except Exception as e:
+            logger.debug("Error detaching CDP session: %s", e)
+        self._cdp = None
+
+    async def _send_keepalive(self) -> None:
+        """Send a cheap CDP request so an idle Steel session is not reaped."""
+        try:
+            cdp_session = await self._get_cdp_session()
+            await cdp_session.send("Target.getTargets")
+        except Exception as e:
+            logger.debug("Keepalive failed: %s", e)
+
+    def _maybe_keepalive(self) -> None:
+        """Fire a background keepalive if the session has been idle past the interval."""
+        now = time.monotonic()
+        if now - self._last_keepalive > self._keepalive_interval:
+            self._last_keepalive = now
+            # Keep one keepalive in flight so __aexit__ has a single task to stop
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._send_keepalive())
+
+    async def _stop_keepalive(self) -> None:
+        """Cancel and wait for a pending keepalive before the CDP session closes."""
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
     def get_current_url(self) -> str:
         return self._page.url if self._page else ""
 
+    async def page_state_key(self) -> Optional[str]:
+        """Fingerprint of URL, scroll position and load state, or None if unavailable."""
+        try:
+            return await self._page.evaluate(_PAGE_STATE_KEY_JS)
+        except Exception as e:
+            logger.debug("Page state key unavailable: %s", e)
+            return None
+
+    async def _restore_storage_state(self, context) -> None:
+        """Load saved cookies and localStorage into the browser context."""
+        state = _load_storage_state(self.storage_state_path)
+        if not state:
+            return
+        try:
+            if state.get("cookies"):
+                await context.add_cookies(state["cookies"])
+            if state.get("origins"):
+                await context.add_init_script(script=_local_storage_init_script(state["origins"]))
+            self._storage_state_restored = True
+            logger.info("Restored browser storage state from %s", self.storage_state_path)
+        except Exception as e:
+            logger.warning(f"Failed to restore storage state: {e}")
+
+    async def _save_storage_state(self) -> None:
+        """Write the current cookies and localStorage to storage_state_path."""
+        if not self.storage_state_path or not self._browser or not self._browser.contexts:
+            return
+        try:
+            await self._browser.contexts[0].storage_state(path=self.storage_state_path)
+            logger.info("Saved browser storage state to %s", self.storage_state_path)
+        except Exception as e:
+            logger.warning(f"Failed to save storage state: {e}")
+
+    async def _discard_storage_state(self) -> None:
+        """Drop restored state that the site rejected so the next login starts clean."""
+        self._storage_state_restored = False
+        try:
+            if os.path.exists(self.storage_state_path):
+                os.remove(self.storage_state_path)
+            await self._page.context.clear_cookies()
+        except Exception as e:
+            logger.warning(f"Failed to discard storage state: {e}")
+
     async def __aenter__(self):
         width, height = self.dimensions
         session_params = {
@@ -957,8 +1753,9 @@ class AsyncSteelBrowserSession:
         
         try:
             self.session = self.steel_client.sessions.create(**session_params)
-            logger.info(f"Steel Session created: {self.session.session_viewer_url}")
+            logger.info("Steel Session created: %s", self.session.session_viewer_url)
 
+            from playwright.async_api import async_playwright
             self._playwright = await async_playwright().start()
             
             # Get Steel API key from environment or Steel client
@@ -969,14 +1766,15 @@ class AsyncSteelBrowserSession:
             if not steel_api_key:
                 raise ValueError("STEEL_API_KEY not found in environment or client")
             
-            logger.info(f"Connecting to Steel browser via CDP: {self.session.websocket_url}")
+            logger.info("Connecting to Steel browser via CDP: %s", self.session.websocket_url)
             browser = await self._playwright.chromium.connect_over_cdp(
                 f"{self.session.websocket_url}&apiKey={steel_api_key}",
                 timeout=60000
             )
             self._browser = browser
             context = browser.contexts[0]
-            logger.info(f"Connected to browser context with {len(context.pages)} pages")
+            logger.info("Connected to browser context with %s pages", len(context.pages))
+            await self._restore_storage_state(context)
 
             self._page = context.pages[0]
             await self._page.set_viewport_size({"width": width, "height": height})
@@ -986,7 +1784,7 @@ class AsyncSteelBrowserSession:
                 try:
                     error_message = str(error)
                     if "Cannot redefine property" in error_message:
-                        logger.debug(f"Suppressing non-critical page error: {error}")
+                        logger.debug("Suppressing non-critical page error: %s", error)
                     else:
                         logger.warning(f"Page error: {error}")
                 except Exception as handler_error:
@@ -994,17 +1792,27 @@ class AsyncSteelBrowserSession:
             
             self._page.on("pageerror", handle_page_error)
             
+            # Open the CDP session used for screenshots up front
+            try:
+                await self._get_cdp_session()
+            except Exception as cdp_error:
+                logger.warning(f"Failed to open CDP session: {cdp_error}")
+            
             # Navigate to start URL with better error handling
-            logger.info(f"Navigating to start URL: {self.start_url}")
+            logger.info("Navigating to start URL: %s", self.start_url)
             try:
-                await self._page.goto(self.start_url, wait_until="domcontentloaded", timeout=30000)
-                logger.info(f"Successfully navigated to: {self._page.url}")
+                response = await self._page.goto(self.start_url, wait_until="commit", timeout=START_URL_TIMEOUT_MS)
+                if self._storage_state_restored and response is not None and response.status == 401:
+                    logger.warning("Saved storage state was rejected (401), retrying without it")
+                    await self._discard_storage_state()
+                    await self._page.goto(self.start_url, wait_until="commit", timeout=START_URL_TIMEOUT_MS)
+                logger.info("Successfully navigated to: %s", self._page.url)
             except Exception as nav_error:
                 logger.warning(f"Navigation to {self.start_url} failed: {nav_error}")
                 # Try a simple fallback URL
                 try:
-                    await self._page.goto("data:text/html,<html><body><h1>Ready for automation</h1></body></html>", wait_until="domcontentloaded")
-                    logger.info("Using fallback HTML page")
+                    await self._page.goto(FALLBACK_PAGE_URL, wait_until="commit", timeout=FALLBACK_PAGE_TIMEOUT_MS)
+                    logger.info("Using blank fallback page")
                 except Exception:
                     logger.info("Continuing with current page - Claude can navigate manually")
             
@@ -1032,81 +1840,265 @@ class AsyncSteelBrowserSession:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         logger.info("Cleaning up Steel browser session...")
         
-        # Close page first
-        if hasattr(self, '_page') and self._page:
-            try:
-                await self._page.close()
-                logger.info("Page closed")
-            except Exception as e:
-                logger.warning(f"Error closing page: {e}")
-        
-        # Close browser 
-        if hasattr(self, '_browser') and self._browser:
-            try:
-                await self._browser.close()
-                logger.info("Browser closed")
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
+        # A keepalive must not reach the CDP session while it is being closed
+        await self._stop_keepalive()
+        
+        # Persist cookies and localStorage before the context goes away
+        await self._save_storage_state()
+        await self._detach_cdp_session()
+        
+        # Closing the browser also closes the page, and releasing the Steel
+        # session is an independent HTTP call, so the two run concurrently
+        async def close_browser():
+            await self._browser.close()
+            logger.info("Browser closed")
+        
+        async def release_session():
+            logger.info("Releasing Steel session...")
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.steel_client.sessions.release, self.session.id)
+            logger.info("Session completed. View replay at %s", self.session.session_viewer_url)
+        
+        steps = []
+        if self._browser:
+            steps.append(("closing browser", close_browser()))
+        if self.session:
+            steps.append(("releasing Steel session", release_session()))
+        results = await asyncio.gather(*(coro for _, coro in steps), return_exceptions=True)
+        for (step, _), result in zip(steps, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error {step}: {result}")
         
         # Stop playwright
-        if hasattr(self, '_playwright') and self._playwright:
+        if self._playwright:
             try:
                 await self._playwright.stop()
                 logger.info("Playwright stopped")
             except Exception as e:
                 logger.warning(f"Error stopping playwright: {e}")
 
-        # Release Steel session last
-        if hasattr(self, 'session') and self.session:
-            try:
-                logger.info("Releasing Steel session...")
-                self.steel_client.sessions.release(self.session.id)
-                logger.info(f"Session completed. View replay at {self.session.session_viewer_url}")
-            except Exception as e:
-                logger.warning(f"Error releasing Steel session: {e}")
+    def _reusable_screenshot(self) -> Optional[str]:
+        """Return the last screenshot if no action has touched the page since."""
+        if (not self._viewport_dirty and self._last_screenshot_b64 is not None
+                and time.monotonic() - self._last_screenshot_at < self._screenshot_reuse_window):
+            return self._last_screenshot_b64
+        return None
+
+    def _remember_screenshot(self, data: str) -> str:
+        self._last_screenshot_b64 = data
+        self._last_screenshot_at = time.monotonic()
+        self._viewport_dirty = False
+        return data
 
     async def screenshot(self) -> str:
-        """Take a screenshot and return base64 encoded image."""
+        """Take a screenshot and return the base64 encoded image.
+
+        The encoding follows ``screenshot_format``; JPEG keeps both the capture
+        cost and the upload to Claude well below lossless PNG. A recent
+        screenshot is reused as in SteelBrowserSession.screenshot().
+        """
+        cached = self._reusable_screenshot()
+        if cached is not None:
+            return cached
+        return self._remember_screenshot(await self._capture_screenshot())
+
+    async def _capture_screenshot(self) -> str:
         try:
-            width, height = self.dimensions
-            png_bytes = await self._page.screenshot(
-                full_page=False,
-                clip={"x": 0, "y": 0, "width": width, "height": height}
+            # CDP already returns base64, so no encode step is needed
+            cdp_session = await self._get_cdp_session()
+            result = await cdp_session.send(
+                "Page.captureScreenshot", self._cdp_screenshot_params()
             )
-            return base64.b64encode(png_bytes).decode("utf-8")
-        except AsyncPlaywrightError as error:
-            logger.error(f"Screenshot failed, trying CDP fallback: {error}")
+            return result["data"]
+        except PlaywrightError as error:
+            logger.error(f"CDP screenshot failed, trying Playwright fallback: {error}")
+            self._cdp = None
             try:
-                cdp_session = await self._page.context.new_cdp_session(self._page)
-                result = await cdp_session.send(
-                    "Page.captureScreenshot", {"format": "png", "fromSurface": False}
-                )
-                return result["data"]
-            except AsyncPlaywrightError as cdp_error:
-                logger.error(f"CDP screenshot also failed: {cdp_error}")
+                image_bytes = await self._page.screenshot(**self._playwright_screenshot_options())
+                if len(image_bytes) > ASYNC_ENCODE_THRESHOLD_BYTES:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(None, _encode_screenshot, image_bytes)
+                return _encode_screenshot(image_bytes)
+            except PlaywrightError as fallback_error:
+                logger.error(f"Playwright screenshot also failed: {fallback_error}")
                 raise error
 
+    async def _screenshot_after_action(self, capture_screenshot: bool) -> str:
+        return await self.screenshot() if capture_screenshot else ""
+
+    async def _type_text(self, text: str) -> None:
+        """Type text into the focused element.
+        
+        Same strategy as SteelBrowserSession._type_text: one CDP insertText per
+        line when ``fast_type`` is set, chunked key events otherwise.
+        """
+        if self.fast_type:
+            try:
+                cdp_session = await self._get_cdp_session()
+                for i, line in enumerate(text.split("\n")):
+                    if i:
+                        await self._page.keyboard.press("Enter")
+                    if line:
+                        await cdp_session.send("Input.insertText", {"text": line})
+                return
+            except PlaywrightError as e:
+                if "Target page, context or browser has been closed" in str(e):
+                    raise
+                logger.warning(f"Fast typing failed, falling back to key events: {e}")
+                self._cdp = None
+        
+        # Typical input goes out in one keyboard.type call; only very long
+        # text is split. The per-key delay paces input, so no sleep between chunks
+        group_size = self.typing_group_size
+        for i in range(0, len(text), group_size):
+            await self._page.keyboard.type(text[i:i + group_size], delay=self.typing_delay_ms)
+
+    async def _hold_key(self, hold_key: str, duration: float) -> None:
+        """Hold a key for duration seconds; short holds go through CDP."""
+        if duration < SHORT_HOLD_SECONDS:
+            try:
+                cdp_session = await self._get_cdp_session()
+                await cdp_session.send("Input.dispatchKeyEvent", {"type": "keyDown", "key": hold_key})
+                await asyncio.sleep(duration)
+                await cdp_session.send("Input.dispatchKeyEvent", {"type": "keyUp", "key": hold_key})
+                return
+            except PlaywrightError as e:
+                if "Target page, context or browser has been closed" in str(e):
+                    raise
+                logger.warning(f"CDP key hold failed, falling back to keyboard events: {e}")
+                self._cdp = None
+        
+        await self._page.keyboard.down(hold_key)
+        await asyncio.sleep(duration)
+        await self._page.keyboard.up(hold_key)
+
+    async def _triple_click(self, x: int, y: int) -> None:
+        """Triple-click as one CDP press/release pair with clickCount=3."""
+        event = {"x": x, "y": y, "button": "left", "clickCount": 3}
+        try:
+            cdp_session = await self._get_cdp_session()
+            await cdp_session.send("Input.dispatchMouseEvent", {"type": "mousePressed", **event})
+            await cdp_session.send("Input.dispatchMouseEvent", {"type": "mouseReleased", **event})
+        except PlaywrightError as e:
+            if "Target page, context or browser has been closed" in str(e):
+                raise
+            logger.warning(f"CDP triple click failed, falling back to mouse.click: {e}")
+            self._cdp = None
+            await self._page.mouse.click(x, y, click_count=3)
+
     def validate_and_get_coordinates(self, coordinate):
         """Validate and get coordinates like the canonical example."""
-        if not isinstance(coordinate, (list, tuple)) or len(coordinate) != 2:
+        if not isinstance(coordinate, (list, tuple)):
             raise ValueError(f"{coordinate} must be a tuple or list of length 2")
-        if not all(isinstance(i, int) and i >= 0 for i in coordinate):
+        try:
+            x, y = coordinate
+        except ValueError:
+            raise ValueError(f"{coordinate} must be a tuple or list of length 2") from None
+        if not isinstance(x, int) or not isinstance(y, int) or x < 0 or y < 0:
             raise ValueError(f"{coordinate} must be a tuple/list of non-negative ints")
         
-        x, y = self.clamp_coordinates(coordinate[0], coordinate[1])
+        # Fast path for in-bounds values; only overflow goes through the clamp
+        max_x, max_y = self._max_x, self._max_y
+        if x > max_x or y > max_y:
+            return self.clamp_coordinates(x, y)
         return x, y
 
     def clamp_coordinates(self, x: int, y: int) -> Tuple[int, int]:
         """Clamp coordinates to viewport bounds."""
-        width, height = self.dimensions
-        clamped_x = max(0, min(x, width - 1))
-        clamped_y = max(0, min(y, height - 1))
+        max_x, max_y = self._max_x, self._max_y
+        clamped_x = 0 if x < 0 else (max_x if x > max_x else x)
+        clamped_y = 0 if y < 0 else (max_y if y > max_y else y)
         
         if x != clamped_x or y != clamped_y:
             logger.warning(f"Coordinate clamped: ({x}, {y}) → ({clamped_x}, {clamped_y})")
         
         return clamped_x, clamped_y
 
+    async def _do_left_mouse_down(self, **_) -> None:
+        await self._page.mouse.down()
+
+    async def _do_left_mouse_up(self, **_) -> None:
+        await self._page.mouse.up()
+
+    async def _do_scroll(self, text=None, coordinate=None, scroll_direction=None, scroll_amount=None, **_) -> None:
+        if scroll_direction not in _SCROLL_DELTAS:
+            raise ValueError("scroll_direction must be 'up', 'down', 'left', or 'right'")
+        if scroll_amount is None or not isinstance(scroll_amount, int) or scroll_amount < 0:
+            raise ValueError("scroll_amount must be a non-negative int")
+        
+        if coordinate is not None:
+            x, y = self.validate_and_get_coordinates(coordinate)
+            await self._page.mouse.move(x, y)
+            self._last_mouse_position = (x, y)
+        
+        if text:
+            modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY.get(text, text)
+            await self._page.keyboard.down(modifier_key)
+        
+        delta_x, delta_y = _SCROLL_DELTAS[scroll_direction]
+        await self._page.mouse.wheel(delta_x * scroll_amount, delta_y * scroll_amount)
+        
+        if text:
+            await self._page.keyboard.up(modifier_key)
+
+    async def _do_hold_key(self, text=None, duration=None, **_) -> None:
+        _validate_duration(duration)
+        await self._hold_key(CUA_KEY_TO_PLAYWRIGHT_KEY.get(text, text), duration)
+
+    async def _do_wait(self, duration=None, **_) -> None:
+        _validate_duration(duration)
+        await asyncio.sleep(duration)
+
+    async def _do_click(self, action, coordinate=None, key=None, **_) -> None:
+        if coordinate is not None:
+            x, y = self.validate_and_get_coordinates(coordinate)
+            await self._page.mouse.move(x, y)
+            self._last_mouse_position = (x, y)
+            click_x, click_y = x, y
+        elif self._last_mouse_position:
+            click_x, click_y = self._last_mouse_position
+        else:
+            click_x, click_y = self._w // 2, self._h // 2
+        
+        if key:
+            modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY.get(key, key)
+            await self._page.keyboard.down(modifier_key)
+        
+        if action == "left_click":
+            await self._page.mouse.click(click_x, click_y)
+        elif action == "right_click":
+            await self._page.mouse.click(click_x, click_y, button="right")
+        elif action == "double_click":
+            await self._page.mouse.dblclick(click_x, click_y)
+        elif action == "triple_click":
+            await self._triple_click(click_x, click_y)
+        elif action == "middle_click":
+            await self._page.mouse.click(click_x, click_y, button="middle")
+        
+        if key:
+            await self._page.keyboard.up(modifier_key)
+
+    async def _do_mouse_move(self, coordinate, **_) -> None:
+        x, y = self.validate_and_get_coordinates(coordinate)
+        await self._page.mouse.move(x, y)
+        self._last_mouse_position = (x, y)
+
+    async def _do_left_click_drag(self, coordinate, **_) -> None:
+        x, y = self.validate_and_get_coordinates(coordinate)
+        await self._page.mouse.down()
+        await self._page.mouse.move(x, y)
+        await self._page.mouse.up()
+        self._last_mouse_position = (x, y)
+
+    async def _do_key(self, text, **_) -> None:
+        await self._page.keyboard.press(_apply_key_mapping(text))
+
+    async def _do_type(self, text, **_) -> None:
+        await self._type_text(text)
+
+    async def _do_nothing(self, **_) -> None:
+        pass
+
     async def execute_computer_action(
         self, 
         action: str, 
@@ -1116,200 +2108,112 @@ class AsyncSteelBrowserSession:
         scroll_amount: int = None,
         duration = None,
         key: str = None,
+        capture_screenshot: bool = True,
         **kwargs
     ) -> str:
-        """Execute a computer action and return screenshot."""
+        """Execute a computer action and return screenshot.
+        
+        With ``capture_screenshot=False`` the action is performed and an empty
+        string is returned, for callers that capture the screenshot themselves.
+        """
         
         # Check if browser session is still active before action
         if not self._page or self._page.is_closed():
             raise RuntimeError("Browser session has been closed")
+        self._maybe_keepalive()
+        if action not in _NON_RENDERING_ACTIONS:
+            self._viewport_dirty = True
         
-        try:
-            if action in ("left_mouse_down", "left_mouse_up"):
-                if coordinate is not None:
-                    raise ValueError(f"coordinate is not accepted for {action}")
-                
-                if action == "left_mouse_down":
-                    await self._page.mouse.down()
-                elif action == "left_mouse_up":
-                    await self._page.mouse.up()
+        handler = self._actions.get(action)
+        if handler is None:
+            raise ValueError(f"Invalid action: {action}")
+        _validate_action_args(action, text, coordinate)
         
-        except AsyncPlaywrightError as e:
+        try:
+            action_call = handler(
+                action=action,
+                text=text,
+                coordinate=coordinate,
+                scroll_direction=scroll_direction,
+                scroll_amount=scroll_amount,
+                duration=duration,
+                key=key,
+            )
+            if capture_screenshot and action in _OVERLAPPED_SCREENSHOT_ACTIONS:
+                results = await asyncio.gather(action_call, self.screenshot(), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                return results[1]
+            await action_call
+        except PlaywrightError as e:
             if "Target page, context or browser has been closed" in str(e):
                 raise RuntimeError(f"Browser session closed during action '{action}': {e}")
-            else:
-                raise e
-            
-            return await self.screenshot()
-        
-        if action == "scroll":
-            if scroll_direction is None or scroll_direction not in ("up", "down", "left", "right"):
-                raise ValueError("scroll_direction must be 'up', 'down', 'left', or 'right'")
-            if scroll_amount is None or not isinstance(scroll_amount, int) or scroll_amount < 0:
-                raise ValueError("scroll_amount must be a non-negative int")
-            
-            if coordinate is not None:
-                x, y = self.validate_and_get_coordinates(coordinate)
-                await self._page.mouse.move(x, y)
-                self._last_mouse_position = (x, y)
-            
-            if text:
-                modifier_key = text
-                if modifier_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                    modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY[modifier_key]
-                await self._page.keyboard.down(modifier_key)
-            
-            scroll_mapping = {
-                "down": (0, 100 * scroll_amount),
-                "up": (0, -100 * scroll_amount),
-                "right": (100 * scroll_amount, 0),
-                "left": (-100 * scroll_amount, 0)
-            }
-            delta_x, delta_y = scroll_mapping[scroll_direction]
-            await self._page.mouse.wheel(delta_x, delta_y)
-            
-            if text:
-                await self._page.keyboard.up(modifier_key)
-            
-            return await self.screenshot()
-        
-        if action in ("hold_key", "wait"):
-            if duration is None or not isinstance(duration, (int, float)):
-                raise ValueError("duration must be a number")
-            if duration < 0:
-                raise ValueError("duration must be non-negative")
-            if duration > 100:
-                raise ValueError("duration is too long")
-            
-            if action == "hold_key":
-                if text is None:
-                    raise ValueError("text is required for hold_key")
-                
-                hold_key = text
-                if hold_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                    hold_key = CUA_KEY_TO_PLAYWRIGHT_KEY[hold_key]
-                
-                await self._page.keyboard.down(hold_key)
-                await asyncio.sleep(duration)
-                await self._page.keyboard.up(hold_key)
-                
-            elif action == "wait":
-                await asyncio.sleep(duration)
-            
-            return await self.screenshot()
-        
-        if action in ("left_click", "right_click", "double_click", "triple_click", "middle_click"):
-            if text is not None:
-                raise ValueError(f"text is not accepted for {action}")
-            
-            if coordinate is not None:
-                x, y = self.validate_and_get_coordinates(coordinate)
-                await self._page.mouse.move(x, y)
-                self._last_mouse_position = (x, y)
-                click_x, click_y = x, y
-            elif self._last_mouse_position:
-                click_x, click_y = self._last_mouse_position
-            else:
-                width, height = self.dimensions
-                click_x, click_y = width // 2, height // 2
-            
-            if key:
-                modifier_key = key
-                if modifier_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                    modifier_key = CUA_KEY_TO_PLAYWRIGHT_KEY[modifier_key]
-                await self._page.keyboard.down(modifier_key)
-            
-            if action == "left_click":
-                await self._page.mouse.click(click_x, click_y)
-            elif action == "right_click":
-                await self._page.mouse.click(click_x, click_y, button="right")
-            elif action == "double_click":
-                await self._page.mouse.dblclick(click_x, click_y)
-            elif action == "triple_click":
-                for _ in range(3):
-                    await self._page.mouse.click(click_x, click_y)
-            elif action == "middle_click":
-                await self._page.mouse.click(click_x, click_y, button="middle")
-            
-            if key:
-                await self._page.keyboard.up(modifier_key)
-            
-            return await self.screenshot()
-        
-        if action in ("mouse_move", "left_click_drag"):
-            if coordinate is None:
-                raise ValueError(f"coordinate is required for {action}")
-            if text is not None:
-                raise ValueError(f"text is not accepted for {action}")
-            
-            x, y = self.validate_and_get_coordinates(coordinate)
-            
-            if action == "mouse_move":
-                await self._page.mouse.move(x, y)
-                self._last_mouse_position = (x, y)
-            elif action == "left_click_drag":
-                await self._page.mouse.down()
-                await self._page.mouse.move(x, y)
-                await self._page.mouse.up()
-                self._last_mouse_position = (x, y)
-            
-            return await self.screenshot()
-        
-        if action in ("key", "type"):
-            if text is None:
-                raise ValueError(f"text is required for {action}")
-            if coordinate is not None:
-                raise ValueError(f"coordinate is not accepted for {action}")
-            
-            if action == "key":
-                press_key = text
-                
-                if "+" in press_key:
-                    key_parts = press_key.split("+")
-                    modifier_keys = key_parts[:-1]
-                    main_key = key_parts[-1]
-                    
-                    playwright_modifiers = []
-                    for mod in modifier_keys:
-                        if mod.lower() in ("ctrl", "control"):
-                            playwright_modifiers.append("Control")
-                        elif mod.lower() in ("shift",):
-                            playwright_modifiers.append("Shift")
-                        elif mod.lower() in ("alt", "option"):
-                            playwright_modifiers.append("Alt")
-                        elif mod.lower() in ("cmd", "meta", "super"):
-                            playwright_modifiers.append("Meta")
-                        else:
-                            playwright_modifiers.append(mod)
-                    
-                    if main_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                        main_key = CUA_KEY_TO_PLAYWRIGHT_KEY[main_key]
-                    
-                    press_key = "+".join(playwright_modifiers + [main_key])
-                else:
-                    if press_key in CUA_KEY_TO_PLAYWRIGHT_KEY:
-                        press_key = CUA_KEY_TO_PLAYWRIGHT_KEY[press_key]
-                
-                await self._page.keyboard.press(press_key)
-            elif action == "type":
-                # Type with chunking for better reliability
-                TYPING_DELAY_MS = 12
-                TYPING_GROUP_SIZE = 50
-                for chunk in [text[i:i + TYPING_GROUP_SIZE] for i in range(0, len(text), TYPING_GROUP_SIZE)]:
-                    await self._page.keyboard.type(chunk, delay=TYPING_DELAY_MS)
-                    await asyncio.sleep(0.01)
-            
-            return await self.screenshot()
-        
-        if action in ("screenshot", "cursor_position"):
-            if text is not None:
-                raise ValueError(f"text is not accepted for {action}")
-            if coordinate is not None:
-                raise ValueError(f"coordinate is not accepted for {action}")
-            
-            return await self.screenshot()
+            raise
         
-        raise ValueError(f"Invalid action: {action}")
+        return await self._screenshot_after_action(capture_screenshot)
+
+
+# Extra guidance appended to SYSTEM_PROMPT for the agents
+AGENT_PROMPT_GUIDANCE = """
+
+<NAVIGATION_OPTIMIZATION>
+* When you need to navigate to a website, clearly state the URL in your text response
+* Be explicit about navigation intent (e.g., "I need to navigate to https://example.com")
+* Avoid excessive typing of URLs character by character when possible
+* Use direct navigation methods when available
+</NAVIGATION_OPTIMIZATION>
+
+<EFFICIENCY_GUIDELINES>  
+* Minimize unnecessary actions and screenshots
+* Use cached screenshots when the page hasn't changed
+* Group related actions together when possible
+* Be aware of rate limits and pace your requests appropriately
+</EFFICIENCY_GUIDELINES>"""
+
+
+def _prune_old_screenshots(conversation: List[Dict[str, Any]], keep: int = SCREENSHOT_HISTORY_KEEP) -> None:
+    """Replace images in all but the last ``keep`` screenshot tool results with a note.
+    
+    Walks backwards and stops at the first result that was already pruned,
+    since everything before it was pruned on an earlier call.
+    """
+    seen = 0
+    for message in reversed(conversation):
+        if message["role"] != "user" or not isinstance(message["content"], list):
+            continue
+        for block in message["content"]:
+            if block.get("type") != "tool_result":
+                continue
+            content = block["content"]
+            if content and content[0].get("text") == SCREENSHOT_OMITTED_TEXT:
+                return
+            if not any(item.get("type") == "image" for item in content):
+                continue
+            seen += 1
+            if seen > keep:
+                block["content"] = [{"type": "text", "text": SCREENSHOT_OMITTED_TEXT}]
+
+
+@lru_cache(maxsize=16)
+def _build_system_prompt(width: int, height: int) -> str:
+    """Return the agent system prompt for a viewport size."""
+    return (SYSTEM_PROMPT + AGENT_PROMPT_GUIDANCE).replace(
+        '<COORDINATE_SYSTEM>',
+        f'<COORDINATE_SYSTEM>\n* The browser viewport dimensions are {width}x{height} pixels\n* The browser viewport has specific dimensions that you must respect'
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_tools(tool_type: str, width: int, height: int) -> Tuple[Dict[str, Any], ...]:
+    """Return the computer tool schema; callers copy it into a list."""
+    return ({
+        "type": tool_type,
+        "name": "computer",
+        "display_width_px": width,
+        "display_height_px": height,
+        "display_number": 1,
+    },)
 
 
 class ClaudeComputerUseAgent:
@@ -1322,12 +2226,17 @@ class ClaudeComputerUseAgent:
         model: str = "claude-3-5-sonnet-20241022",
         throttle_delay: float = 0.2
     ):
-        self.client = Anthropic(api_key=anthropic_api_key)
+        self.client = Anthropic(
+            api_key=anthropic_api_key,
+            http_client=DefaultHttpxClient(limits=ANTHROPIC_CONNECTION_LIMITS),
+        )
         self.browser_session = browser_session
         self.model = model
         self.messages: List[BetaMessageParam] = []
         self._last_screenshot_cache = None
         self._screenshot_cache_timestamp = 0
+        self._screenshot_cache_state: Optional[str] = None
+        self._last_sent_screenshot: Optional[str] = None
         self._cache_duration = 2.0  # Increased cache duration
         
         # Initialize optimization components
@@ -1343,65 +2252,72 @@ class ClaudeComputerUseAgent:
         self.viewport_width = width
         self.viewport_height = height
         
-        # Enhanced system prompt with optimization guidance
-        enhanced_system_prompt = SYSTEM_PROMPT + """
-
-<NAVIGATION_OPTIMIZATION>
-* When you need to navigate to a website, clearly state the URL in your text response
-* Be explicit about navigation intent (e.g., "I need to navigate to https://example.com")
-* Avoid excessive typing of URLs character by character when possible
-* Use direct navigation methods when available
-</NAVIGATION_OPTIMIZATION>
-
-<EFFICIENCY_GUIDELINES>  
-* Minimize unnecessary actions and screenshots
-* Use cached screenshots when the page hasn't changed
-* Group related actions together when possible
-* Be aware of rate limits and pace your requests appropriately
-</EFFICIENCY_GUIDELINES>"""
-        
-        self.system_prompt = enhanced_system_prompt.replace(
-            '<COORDINATE_SYSTEM>',
-            f'<COORDINATE_SYSTEM>\n* The browser viewport dimensions are {width}x{height} pixels\n* The browser viewport has specific dimensions that you must respect'
-        )
-        
-        self.tools = [{
-            "type": self.model_config["tool_type"],
-            "name": "computer",
-            "display_width_px": width,
-            "display_height_px": height,
-            "display_number": 1,
-        }]
+        # Prompt and tool schema depend only on the viewport and model, so they are shared
+        self.system_prompt = _build_system_prompt(width, height)
+        self.tools = list(_build_tools(self.model_config["tool_type"], width, height))
 
     def _get_cached_screenshot(self) -> Optional[str]:
-        """Get cached screenshot if still valid."""
-        current_time = time.time()
-        if (self._last_screenshot_cache and 
-            current_time - self._screenshot_cache_timestamp < self._cache_duration):
+        """Get cached screenshot if still recent and the page state it shows is unchanged."""
+        return self._cached_screenshot_for(self.browser_session.page_state_key())
+    
+    def _cached_screenshot_for(self, state: Optional[str]) -> Optional[str]:
+        """Return the cached screenshot if it is recent and was captured in ``state``."""
+        if (self._last_screenshot_cache and
+            time.time() - self._screenshot_cache_timestamp < self._cache_duration and
+            state is not None and
+            state == self._screenshot_cache_state):
             return self._last_screenshot_cache
         return None
     
-    def _cache_screenshot(self, screenshot: str) -> None:
-        """Cache a screenshot with timestamp."""
+    def _cache_screenshot(self, screenshot: str, state: Optional[str] = None) -> None:
+        """Cache a screenshot with timestamp and the page state it was captured in.
+        
+        A screenshot cached without a state is never reused.
+        """
         self._last_screenshot_cache = screenshot
         self._screenshot_cache_timestamp = time.time()
-        
+        self._screenshot_cache_state = state
+        
+    def _screenshot_result_content(self, screenshot: str) -> List[Dict[str, Any]]:
+        """Build tool_result content, replacing a repeat of the last image with a note."""
+        # Compare the strings directly: no encoded copy to hash, and a reused
+        # cached screenshot matches on identity without scanning the data
+        if screenshot == self._last_sent_screenshot:
+            return [{"type": "text", "text": SCREENSHOT_UNCHANGED_TEXT}]
+        self._last_sent_screenshot = screenshot
+        return [{
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": self.browser_session.screenshot_media_type,
+                "data": screenshot
+            }
+        }]
+
     def _get_screenshot_with_cache(self, force_new: bool = False) -> str:
-        """Get screenshot with caching to reduce redundant captures."""
+        """Get screenshot with caching to reduce redundant captures.
+        
+        The page fingerprint read for the cache check also describes the fresh
+        capture taken right after it. Screenshots returned by actions are
+        cached without one, since the sync API cannot read it in the same
+        round-trip as the capture.
+        """
+        state = None
         if not force_new:
-            cached = self._get_cached_screenshot()
+            state = self.browser_session.page_state_key()
+            cached = self._cached_screenshot_for(state)
             if cached:
                 logger.debug("Using cached screenshot")
                 return cached
                 
         screenshot = self.browser_session.screenshot()
-        self._cache_screenshot(screenshot)
+        self._cache_screenshot(screenshot, state)
         return screenshot
 
     def execute_task(self, task: str, max_iterations: int = 30) -> Dict[str, Any]:
         """Execute a browser automation task using Claude Computer Use with optimizations."""
         
-        logger.info(f"Executing task: {task}")
+        logger.info("Executing task: %s", task)
         
         # Check for navigation optimization opportunity
         if self.navigation_optimizer.can_optimize_navigation(task):
@@ -1415,36 +2331,52 @@ class ClaudeComputerUseAgent:
                 except Exception as e:
                     logger.warning(f"Failed to capture screenshot after navigation: {e}")
         
-        input_items = [{"role": "user", "content": task}]
-        new_items = []
+        # One conversation list, extended in place instead of re-concatenated per request
+        conversation = [{"role": "user", "content": task}]
         iterations = 0
+        headroom_delay = 0.0
+        min_interval = MIN_REQUEST_INTERVAL
+        request_started_at = 0.0
+        self._last_sent_screenshot = None
         
         while iterations < max_iterations:
             iterations += 1
+            _prune_old_screenshots(conversation)
             
             # Handle rate limiting with retry logic
             retry_attempt = 0
+            prev_delay = RATE_LIMIT_BASE_DELAY
             response = None
             
             while retry_attempt < 10:  # Max 10 retry attempts per iteration
                 try:
+                    # Back off proactively when the last response showed little headroom
+                    if headroom_delay:
+                        logger.info("Request rate limit nearly exhausted, pausing %.2fs", headroom_delay)
+                        time.sleep(headroom_delay)
+                        headroom_delay = 0.0
+                    
                     # Apply request throttling
                     if hasattr(self, 'action_batcher'):
                         self.action_batcher.wait_if_needed()
                     
-                    response = self.client.beta.messages.create(
+                    request_started_at = time.monotonic()
+                    raw_response = self.client.beta.messages.with_raw_response.create(
                         model=self.model,
                         max_tokens=4096,
                         system=self.system_prompt,
-                        messages=input_items + new_items,
+                        messages=conversation,
                         tools=self.tools,
                         betas=[self.model_config["beta_flag"]]
                     )
+                    response = raw_response.parse()
+                    headroom_delay = _rate_limit_headroom_delay(raw_response.headers)
+                    min_interval = _request_interval(raw_response.headers)
                     break  # Success, exit retry loop
                     
                 except (RateLimitError, APITimeoutError) as rate_error:
-                    delay = _handle_rate_limit_error(retry_attempt)
-                    if delay is None:
+                    backoff = _handle_rate_limit_error(rate_error, retry_attempt, prev_delay)
+                    if backoff is None:
                         logger.error(f"Max retries exceeded for rate limiting: {rate_error}")
                         return {
                             "success": False,
@@ -1453,6 +2385,7 @@ class ClaudeComputerUseAgent:
                             "final_url": self.browser_session.get_current_url()
                         }
                     
+                    delay, prev_delay = backoff
                     time.sleep(delay)
                     retry_attempt += 1
                     continue
@@ -1481,26 +2414,20 @@ class ClaudeComputerUseAgent:
                 # Process response content blocks
                 for block in response.content:
                     if block.type == "text":
-                        logger.info(f"Claude: {block.text}")
+                        logger.info("Claude: %s", block.text)
                         
                         # Check for completion
-                        if "TASK_COMPLETED:" in block.text:
-                            return {
-                                "success": True,
-                                "result": block.text,
-                                "iterations": iterations,
-                                "final_url": self.browser_session.get_current_url()
-                            }
-                        elif "TASK_FAILED:" in block.text:
+                        status = _TASK_STATUS_RE.search(block.text)
+                        if status:
                             return {
-                                "success": False,
+                                "success": status.group(1) == "COMPLETED",
                                 "result": block.text,
                                 "iterations": iterations,
                                 "final_url": self.browser_session.get_current_url()
                             }
                         
                         # Add text message to conversation
-                        new_items.append({
+                        conversation.append({
                             "role": "assistant",
                             "content": [{"type": "text", "text": block.text}]
                         })
@@ -1528,7 +2455,7 @@ class ClaudeComputerUseAgent:
                                 # Default to screenshot if we can't determine the action
                                 action = "screenshot"
                             
-                            logger.info(f"Action: {action}({tool_input})")
+                            logger.info("Action: %s(%s)", action, tool_input)
                             
                             # Execute the computer action
                             # Force new screenshot for actions that change the page state
@@ -1550,8 +2477,8 @@ class ClaudeComputerUseAgent:
                                 # Cache the new screenshot
                                 self._cache_screenshot(screenshot_base64)
                             
-                            # Add tool use message
-                            new_items.append({
+                            # Add tool use message and tool result with screenshot
+                            conversation.extend([{
                                 "role": "assistant", 
                                 "content": [{
                                     "type": "tool_use",
@@ -1559,24 +2486,14 @@ class ClaudeComputerUseAgent:
                                     "name": block.name,
                                     "input": tool_input
                                 }]
-                            })
-                            
-                            # Add tool result with screenshot
-                            new_items.append({
+                            }, {
                                 "role": "user",
                                 "content": [{
                                     "type": "tool_result",
                                     "tool_use_id": block.id,
-                                    "content": [{
-                                        "type": "image",
-                                        "source": {
-                                            "type": "base64",
-                                            "media_type": "image/png",
-                                            "data": screenshot_base64
-                                        }
-                                    }]
+                                    "content": self._screenshot_result_content(screenshot_base64)
                                 }]
-                            })
+                            }])
                             
             except Exception as processing_error:
                 logger.error(f"Error processing response: {processing_error}")
@@ -1587,9 +2504,12 @@ class ClaudeComputerUseAgent:
                     "final_url": self.browser_session.get_current_url()
                 }
             
-            # Add optimized delay between iterations to prevent rate limiting 
+            # Space request starts by min_interval; time spent on the model call
+            # and the actions already counts towards it
             if iterations < max_iterations:
-                time.sleep(1.0)  # 1 second delay between iterations (reduced)
+                pause = min_interval - (time.monotonic() - request_started_at)
+                if pause > 0:
+                    time.sleep(pause)
         
         return {
             "success": False,
@@ -1611,7 +2531,10 @@ async def create_browser_automation_agent(
     session_timeout: int = 900000,
     model: str = "claude-3-5-sonnet-20241022",
     start_url: str = "https://example.com",
-    throttle_delay: float = 0.2
+    throttle_delay: float = 0.2,
+    screenshot_format: str = "jpeg",
+    screenshot_quality: int = 75,
+    storage_state_path: Optional[str] = None
 ) -> Dict[str, Any]:
     """Factory function to create and run browser automation with proper async handling.
     
@@ -1631,13 +2554,16 @@ async def create_browser_automation_agent(
         model: Claude model to use for computer use
         start_url: Initial URL to load in browser
         throttle_delay: Minimum delay between API requests
+        screenshot_format: Screenshot encoding, "jpeg" (default) or "png"
+        screenshot_quality: JPEG quality (0-100) used for screenshots
+        storage_state_path: JSON file to restore and save cookies/localStorage
     
     Returns:
         Dict with task execution results including success status, result text,
         iterations executed, final URL, and session viewer URL
     """
-    logger.info(f"Creating browser automation agent for task: {task[:100]}...")
-    logger.info(f"Configuration: {width}x{height}, proxy={use_proxy}, captcha={solve_captcha}")
+    logger.info("Creating browser automation agent for task: %.100s...", task)
+    logger.info("Configuration: %sx%s, proxy=%s, captcha=%s", width, height, use_proxy, solve_captcha)
     
     # Use async browser session since we're in an async function
     async with AsyncSteelBrowserSession(
@@ -1647,7 +2573,10 @@ async def create_browser_automation_agent(
         use_proxy=use_proxy,
         solve_captcha=solve_captcha,
         session_timeout=session_timeout,
-        start_url=start_url
+        start_url=start_url,
+        screenshot_format=screenshot_format,
+        screenshot_quality=screenshot_quality,
+        storage_state_path=storage_state_path
     ) as browser_session:
         
         # Create Claude agent with async browser session and optimizations
@@ -1671,7 +2600,7 @@ async def create_browser_automation_agent(
             result["viewport_dimensions"] = f"{width}x{height}"
             result["optimizations_enabled"] = True
             
-            logger.info(f"Task completed: success={result.get('success')}, iterations={result.get('iterations')}")
+            logger.info("Task completed: success=%s, iterations=%s", result.get('success'), result.get('iterations'))
             return result
             
         except Exception as e:
@@ -1684,6 +2613,10 @@ async def create_browser_automation_agent(
                 "session_url": browser_session.session.session_viewer_url if browser_session.session else None,
                 "error": str(e)
             }
+        
+        finally:
+            # The client's connections belong to this loop, so release them with it
+            await claude_agent.aclose()
 
 
 class AsyncClaudeComputerUseAgent:
@@ -1694,15 +2627,31 @@ class AsyncClaudeComputerUseAgent:
         anthropic_api_key: str,
         browser_session: AsyncSteelBrowserSession,
         model: str = "claude-3-5-sonnet-20241022",
-        throttle_delay: float = 0.2
+        throttle_delay: float = 0.2,
+        requests_per_minute: int = 50,
+        client: Optional[AsyncAnthropic] = None
     ):
-        self.client = Anthropic(api_key=anthropic_api_key)
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {requests_per_minute}")
+        
+        # Async client so model calls do not block the browser connection.
+        # Agents on one loop can share a connection pool by passing the same
+        # client; its owner closes it.
+        self._owns_client = client is None
+        self.client = client if client is not None else AsyncAnthropic(
+            api_key=anthropic_api_key,
+            http_client=DefaultAsyncHttpxClient(limits=ANTHROPIC_CONNECTION_LIMITS),
+        )
         self.browser_session = browser_session
         self.model = model
         self.messages: List[BetaMessageParam] = []
         self._last_screenshot_cache = None
         self._screenshot_cache_timestamp = 0
+        self._screenshot_cache_state: Optional[str] = None
+        self._last_sent_screenshot: Optional[str] = None
         self._cache_duration = 2.0  # Increased cache duration
+        # Start times of the last requests_per_minute requests
+        self._recent_request_times: Deque[float] = deque(maxlen=requests_per_minute)
         
         # Initialize optimization components  
         self.action_batcher = ActionBatcher(throttle_delay=throttle_delay)
@@ -1717,66 +2666,92 @@ class AsyncClaudeComputerUseAgent:
         self.viewport_width = width
         self.viewport_height = height
         
-        # Enhanced system prompt with optimization guidance
-        enhanced_system_prompt = SYSTEM_PROMPT + """
-
-<NAVIGATION_OPTIMIZATION>
-* When you need to navigate to a website, clearly state the URL in your text response
-* Be explicit about navigation intent (e.g., "I need to navigate to https://example.com")
-* Avoid excessive typing of URLs character by character when possible
-* Use direct navigation methods when available
-</NAVIGATION_OPTIMIZATION>
-
-<EFFICIENCY_GUIDELINES>  
-* Minimize unnecessary actions and screenshots
-* Use cached screenshots when the page hasn't changed
-* Group related actions together when possible
-* Be aware of rate limits and pace your requests appropriately
-</EFFICIENCY_GUIDELINES>"""
-        
-        self.system_prompt = enhanced_system_prompt.replace(
-            '<COORDINATE_SYSTEM>',
-            f'<COORDINATE_SYSTEM>\n* The browser viewport dimensions are {width}x{height} pixels\n* The browser viewport has specific dimensions that you must respect'
-        )
-        
-        self.tools = [{
-            "type": self.model_config["tool_type"],
-            "name": "computer",
-            "display_width_px": width,
-            "display_height_px": height,
-            "display_number": 1,
-        }]
-
-    def _get_cached_screenshot(self) -> Optional[str]:
-        """Get cached screenshot if still valid."""
-        current_time = time.time()
-        if (self._last_screenshot_cache and 
-            current_time - self._screenshot_cache_timestamp < self._cache_duration):
+        # Prompt and tool schema depend only on the viewport and model, so they are shared
+        self.system_prompt = _build_system_prompt(width, height)
+        self.tools = list(_build_tools(self.model_config["tool_type"], width, height))
+
+    async def aclose(self) -> None:
+        """Close the API client's connection pool if this agent created it."""
+        if self._owns_client:
+            await self.client.close()
+
+    def _request_window_delay(self) -> float:
+        """Seconds to wait so at most requests_per_minute requests start in any 60s window."""
+        times = self._recent_request_times
+        if len(times) < times.maxlen:
+            return 0.0
+        return max(0.0, 60.0 - (time.monotonic() - times[0]))
+
+    async def _get_cached_screenshot(self) -> Optional[str]:
+        """Get cached screenshot if still recent and the page state it shows is unchanged."""
+        return self._cached_screenshot_for(await self.browser_session.page_state_key())
+    
+    def _cached_screenshot_for(self, state: Optional[str]) -> Optional[str]:
+        """Return the cached screenshot if it is recent and was captured in ``state``."""
+        if (self._last_screenshot_cache and
+            time.time() - self._screenshot_cache_timestamp < self._cache_duration and
+            state is not None and
+            state == self._screenshot_cache_state):
             return self._last_screenshot_cache
         return None
     
-    def _cache_screenshot(self, screenshot: str) -> None:
-        """Cache a screenshot with timestamp."""
+    def _cache_screenshot(self, screenshot: str, state: Optional[str] = None) -> None:
+        """Cache a screenshot with timestamp and the page state it was captured in.
+        
+        A screenshot cached without a state is never reused.
+        """
         self._last_screenshot_cache = screenshot
         self._screenshot_cache_timestamp = time.time()
+        self._screenshot_cache_state = state
+        
+    def _screenshot_result_content(self, screenshot: str) -> List[Dict[str, Any]]:
+        """Build tool_result content, replacing a repeat of the last image with a note."""
+        # Compare the strings directly: no encoded copy to hash, and a reused
+        # cached screenshot matches on identity without scanning the data
+        if screenshot == self._last_sent_screenshot:
+            return [{"type": "text", "text": SCREENSHOT_UNCHANGED_TEXT}]
+        self._last_sent_screenshot = screenshot
+        return [{
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": self.browser_session.screenshot_media_type,
+                "data": screenshot
+            }
+        }]
+
+    async def _capture_screenshot_with_state(self) -> str:
+        """Capture and cache a screenshot with the page fingerprint read alongside it.
         
+        Both requests are sent together, so the fingerprint describes the page
+        the screenshot shows without an extra round-trip.
+        """
+        screenshot, state = await asyncio.gather(
+            self.browser_session.screenshot(), self.browser_session.page_state_key()
+        )
+        self._cache_screenshot(screenshot, state)
+        return screenshot
+
     async def _get_screenshot_with_cache(self, force_new: bool = False) -> str:
         """Get screenshot with caching to reduce redundant captures."""
         if not force_new:
-            cached = self._get_cached_screenshot()
+            state = await self.browser_session.page_state_key()
+            cached = self._cached_screenshot_for(state)
             if cached:
                 logger.debug("Using cached screenshot")
                 return cached
-                
-        screenshot = await self.browser_session.screenshot()
-        self._cache_screenshot(screenshot)
-        return screenshot
+            
+            screenshot = await self.browser_session.screenshot()
+            self._cache_screenshot(screenshot, state)
+            return screenshot
+        
+        return await self._capture_screenshot_with_state()
 
     async def execute_task(self, task: str, max_iterations: int = 30) -> Dict[str, Any]:
         """Execute a browser automation task using Claude Computer Use with optimizations."""
         
-        logger.info(f"Executing task: {task}")
-        logger.info(f"Using model: {self.model} with {max_iterations} max iterations")
+        logger.info("Executing task: %s", task)
+        logger.info("Using model: %s with %s max iterations", self.model, max_iterations)
         
         # Check for navigation optimization opportunity
         if self.navigation_optimizer.can_optimize_navigation(task):
@@ -1785,41 +2760,53 @@ class AsyncClaudeComputerUseAgent:
                 logger.info("Optimized navigation successful, continuing with Claude for remaining tasks")
                 # Take a screenshot after navigation to update Claude's context
                 try:
-                    screenshot = await self.browser_session.screenshot()
-                    self._cache_screenshot(screenshot)
+                    await self._capture_screenshot_with_state()
                 except Exception as e:
                     logger.warning(f"Failed to capture screenshot after navigation: {e}")
         
-        input_items = [{"role": "user", "content": task}]
-        new_items = []
+        # One conversation list, extended in place instead of re-concatenated per request
+        conversation = [{"role": "user", "content": task}]
         iterations = 0
+        headroom_delay = 0.0
+        self._last_sent_screenshot = None
         
         while iterations < max_iterations:
             iterations += 1
+            _prune_old_screenshots(conversation)
             
             # Handle rate limiting with retry logic
             retry_attempt = 0
+            prev_delay = RATE_LIMIT_BASE_DELAY
             response = None
             
             while retry_attempt < 10:  # Max 10 retry attempts per iteration
                 try:
+                    # Back off proactively when the last response showed little headroom
+                    if headroom_delay:
+                        logger.info("Request rate limit nearly exhausted, pausing %.2fs", headroom_delay)
+                        await asyncio.sleep(headroom_delay)
+                        headroom_delay = 0.0
+                    
                     # Apply async request throttling
                     if hasattr(self, 'action_batcher'):
                         await self.action_batcher.async_wait_if_needed()
                     
-                    response = self.client.beta.messages.create(
+                    self._recent_request_times.append(time.monotonic())
+                    raw_response = await self.client.beta.messages.with_raw_response.create(
                         model=self.model,
                         max_tokens=4096,
                         system=self.system_prompt,
-                        messages=input_items + new_items,
+                        messages=conversation,
                         tools=self.tools,
                         betas=[self.model_config["beta_flag"]]
                     )
+                    response = await raw_response.parse()
+                    headroom_delay = _rate_limit_headroom_delay(raw_response.headers)
                     break  # Success, exit retry loop
                     
                 except (RateLimitError, APITimeoutError) as rate_error:
-                    delay = _handle_rate_limit_error(retry_attempt)
-                    if delay is None:
+                    backoff = _handle_rate_limit_error(rate_error, retry_attempt, prev_delay)
+                    if backoff is None:
                         logger.error(f"Max retries exceeded for rate limiting: {rate_error}")
                         return {
                             "success": False,
@@ -1828,6 +2815,7 @@ class AsyncClaudeComputerUseAgent:
                             "final_url": self.browser_session.get_current_url()
                         }
                     
+                    delay, prev_delay = backoff
                     await asyncio.sleep(delay)  # Use async sleep
                     retry_attempt += 1
                     continue
@@ -1856,26 +2844,20 @@ class AsyncClaudeComputerUseAgent:
                 # Process response content blocks
                 for block in response.content:
                     if block.type == "text":
-                        logger.info(f"Claude: {block.text}")
+                        logger.info("Claude: %s", block.text)
                         
                         # Check for completion
-                        if "TASK_COMPLETED:" in block.text:
-                            return {
-                                "success": True,
-                                "result": block.text,
-                                "iterations": iterations,
-                                "final_url": self.browser_session.get_current_url()
-                            }
-                        elif "TASK_FAILED:" in block.text:
+                        status = _TASK_STATUS_RE.search(block.text)
+                        if status:
                             return {
-                                "success": False,
+                                "success": status.group(1) == "COMPLETED",
                                 "result": block.text,
                                 "iterations": iterations,
                                 "final_url": self.browser_session.get_current_url()
                             }
                         
                         # Add text message to conversation
-                        new_items.append({
+                        conversation.append({
                             "role": "assistant",
                             "content": [{"type": "text", "text": block.text}]
                         })
@@ -1903,7 +2885,7 @@ class AsyncClaudeComputerUseAgent:
                                 # Default to screenshot if we can't determine the action
                                 action = "screenshot"
                             
-                            logger.info(f"Action: {action}({tool_input})")
+                            logger.info("Action: %s(%s)", action, tool_input)
                             
                             # Execute the computer action (async)
                             # Force new screenshot for actions that change the page state
@@ -1913,20 +2895,22 @@ class AsyncClaudeComputerUseAgent:
                                 # Use cached screenshot if available for pure screenshot requests
                                 screenshot_base64 = await self._get_screenshot_with_cache(force_new=False)
                             else:
-                                # Execute action and get fresh screenshot
-                                screenshot_base64 = await self.browser_session.execute_computer_action(
+                                # Execute action, then capture a fresh, fingerprinted screenshot
+                                await self.browser_session.execute_computer_action(
                                     action=action,
                                     text=tool_input.get("text"),
                                     coordinate=tool_input.get("coordinate"),
                                     scroll_direction=tool_input.get("scroll_direction"),
                                     scroll_amount=tool_input.get("scroll_amount"),
-                                    key=tool_input.get("key")
+                                    key=tool_input.get("key"),
+                                    capture_screenshot=False
                                 )
-                                # Cache the new screenshot
-                                self._cache_screenshot(screenshot_base64)
+                                screenshot_base64 = await self._capture_screenshot_with_state()
                             
-                            # Add tool use message
-                            new_items.append({
+                            result_content = self._screenshot_result_content(screenshot_base64)
+                            
+                            # Add tool use message and tool result with screenshot
+                            conversation.extend([{
                                 "role": "assistant", 
                                 "content": [{
                                     "type": "tool_use",
@@ -1934,24 +2918,20 @@ class AsyncClaudeComputerUseAgent:
                                     "name": block.name,
                                     "input": tool_input
                                 }]
-                            })
-                            
-                            # Add tool result with screenshot
-                            new_items.append({
+                            }, {
                                 "role": "user",
                                 "content": [{
                                     "type": "tool_result",
                                     "tool_use_id": block.id,
-                                    "content": [{
-                                        "type": "image",
-                                        "source": {
-                                            "type": "base64",
-                                            "media_type": "image/png",
-                                            "data": screenshot_base64
-                                        }
-                                    }]
+                                    "content": result_content
                                 }]
-                            })
+                            }])
+                
+                # Only pause when the request window is full
+                if iterations < max_iterations:
+                    delay = self._request_window_delay()
+                    if delay:
+                        await asyncio.sleep(delay)
                             
             except Exception as processing_error:
                 logger.error(f"Error processing response: {processing_error}")
@@ -1961,12 +2941,6 @@ class AsyncClaudeComputerUseAgent:
                     "iterations": iterations,
                     "final_url": self.browser_session.get_current_url()
                 }
-            
-            # Add optimized delay between iterations to prevent rate limiting (async version)
-            if iterations < max_iterations:
-                # Progressive delay: longer delays for more iterations to prevent rate limiting
-                delay = min(1.0 + (iterations * 0.1), 3.0)  # 1.0s to 3.0s progressive delay
-                await asyncio.sleep(delay)
         
         return {
             "success": False,
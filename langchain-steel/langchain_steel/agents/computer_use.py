@@ -7,12 +7,26 @@ import time
 import base64
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional, Tuple
+import random
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from steel import Steel
-from playwright.async_api import async_playwright, Page
-from anthropic import Anthropic, RateLimitError
+import httpx
+# The Steel SDK, Playwright and the Anthropic SDK are imported where first
+# used, so importing the package (e.g. for SteelScrapeTool) does not pay for them
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from steel import Steel
+
+try:
+    # Optional SIMD base64 encoder, installed with the "speedups" extra
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:
+    _b64encode_as_string = None
 
 logger = logging.getLogger(__name__)
 
@@ -22,53 +36,42 @@ TOOL_CONFIG = {
     "name": "computer"
 }
 
-# Key mappings for Claude Computer Use to Playwright
-KEY_MAPPINGS = {
-    "Return": "Enter",
+# Key mappings for Claude Computer Use to Playwright, keyed by lowercase name
+KEY_MAPPINGS = MappingProxyType({
     "return": "Enter",
-    "Enter": "Enter",
     "enter": "Enter",
     "space": " ",
-    "Space": " ",
     "cmd": "Meta",
-    "Cmd": "Meta",
     "ctrl": "Control",
-    "Ctrl": "Control",
-    "Control": "Control",
+    "control": "Control",
     "alt": "Alt",
-    "Alt": "Alt",
     "shift": "Shift",
-    "Shift": "Shift",
     "tab": "Tab",
-    "Tab": "Tab",
     "escape": "Escape",
-    "Escape": "Escape",
     "esc": "Escape",
     "backspace": "Backspace",
-    "Backspace": "Backspace",
     "delete": "Delete",
-    "Delete": "Delete",
     "arrowup": "ArrowUp",
-    "ArrowUp": "ArrowUp",
     "arrowdown": "ArrowDown",
-    "ArrowDown": "ArrowDown",
     "arrowleft": "ArrowLeft",
-    "ArrowLeft": "ArrowLeft",
     "arrowright": "ArrowRight",
-    "ArrowRight": "ArrowRight",
     "pageup": "PageUp",
-    "PageUp": "PageUp",
     "pagedown": "PageDown",
-    "PageDown": "PageDown",
     "home": "Home",
-    "Home": "Home",
     "end": "End",
-    "End": "End",
     "up": "ArrowUp",
     "down": "ArrowDown",
     "left": "ArrowLeft",
     "right": "ArrowRight",
-}
+})
+
+# Wheel delta per scroll step for each direction
+_SCROLL_UNIT = MappingProxyType({
+    "up": (0, -100),
+    "down": (0, 100),
+    "left": (-100, 0),
+    "right": (100, 0),
+})
 
 # System prompt for Claude Computer Use
 SYSTEM_PROMPT = """You are an AI assistant operating a web browser to complete tasks. You have access to a browser that you control through computer actions.
@@ -82,27 +85,151 @@ IMPORTANT INSTRUCTIONS:
 
 Be direct and action-oriented. Focus on completing the task."""
 
+# Rate limit retry backoff bounds (seconds)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+# Keep idle API connections open between steps (httpx defaults to 5s)
+ANTHROPIC_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=10, keepalive_expiry=120.0
+)
+
+# Completion marker in Claude's text; one scan finds either outcome
+_TASK_STATUS_RE = re.compile(r"TASK_(COMPLETED|FAILED):")
+
+# Only the most recent screenshots stay in the conversation sent to Claude
+SCREENSHOT_HISTORY_KEEP = 3
+SCREENSHOT_OMITTED_TEXT = "[prior screenshot omitted]"
+
+# Screenshot encodings Playwright can produce natively
+SCREENSHOT_FORMATS = ("jpeg", "png")
+
+# Sent in place of a screenshot identical to the one sent after the previous action
+SCREENSHOT_UNCHANGED_TEXT = "[screenshot unchanged since the previous action]"
+
+
+@lru_cache(maxsize=16)
+def _build_tools(width: int, height: int) -> Tuple[Dict[str, Any], ...]:
+    """Return the computer tool schema for a viewport; callers copy it into a list."""
+    return ({
+        **TOOL_CONFIG,
+        "display_width_px": width,
+        "display_height_px": height,
+        "display_number": 1
+    },)
+
+
+def _retry_delay(error: Exception, prev_delay: float) -> float:
+    """Next retry delay using capped decorrelated jitter, floored by any ``retry-after`` header.
+
+    The cap applies to the jitter only; a server's ``retry-after`` is honoured as given.
+    """
+    delay = min(random.uniform(RETRY_BASE_DELAY, prev_delay * 3), RETRY_MAX_DELAY)
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        try:
+            delay = max(delay, float(headers.get("retry-after")))
+        except (TypeError, ValueError):
+            pass
+    return delay
+
+
+@lru_cache(maxsize=256)
+def _map_key(name: str) -> str:
+    """Map a Claude key name to Playwright, case-insensitively; unknown keys pass through."""
+    name = name.strip()
+    return KEY_MAPPINGS.get(name.lower(), name)
+
+
+@lru_cache(maxsize=256)
+def _playwright_combo(text: str) -> str:
+    """Convert a combo like ``"ctrl+l"`` into Playwright's ``"Control+l"`` form."""
+    return "+".join(_map_key(k) for k in text.split("+"))
+
+
+def _prune_old_screenshots(messages: List[Dict[str, Any]], keep: int = SCREENSHOT_HISTORY_KEEP) -> None:
+    """Replace images in all but the last ``keep`` screenshot tool results with a note.
+    
+    Without this every request re-uploads every screenshot taken so far.
+    Stops at the first result that was already pruned on an earlier call.
+    """
+    seen = 0
+    for message in reversed(messages):
+        if message["role"] != "user" or not isinstance(message["content"], list):
+            continue
+        for block in message["content"]:
+            if block.get("type") != "tool_result":
+                continue
+            content = block["content"]
+            if content and content[0].get("text") == SCREENSHOT_OMITTED_TEXT:
+                return
+            if not any(item.get("type") == "image" for item in content):
+                continue
+            seen += 1
+            if seen > keep:
+                block["content"] = [{"type": "text", "text": SCREENSHOT_OMITTED_TEXT}]
+
+
+def _new_client(api_key: str) -> "AsyncAnthropic":
+    from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+    
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(limits=ANTHROPIC_CONNECTION_LIMITS),
+    )
+
+
+def _encode_screenshot(image_bytes: bytes) -> str:
+    """Base64-encode raw screenshot bytes, with pybase64 when it is installed."""
+    if _b64encode_as_string is not None:
+        return _b64encode_as_string(image_bytes)
+    return base64.b64encode(image_bytes).decode("ascii")
+
 
 class SteelBrowser:
     """Manages Steel browser session with Playwright integration."""
     
     def __init__(
         self,
-        steel_client: Steel,
+        steel_client: "Steel",
         width: int = 1280,
         height: int = 800,
         use_proxy: bool = False,
-        solve_captcha: bool = False
+        solve_captcha: bool = False,
+        screenshot_format: str = "jpeg",
+        screenshot_quality: int = 75
     ):
+        if screenshot_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"screenshot_format must be one of {SCREENSHOT_FORMATS}")
         self.steel_client = steel_client
         self.width = width
         self.height = height
         self.use_proxy = use_proxy
         self.solve_captcha = solve_captcha
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
         self.session = None
         self.playwright = None
         self.browser = None
         self.page = None
+        self._cdp = None
+        # The viewport is fixed, so the capture parameters are built once
+        self._clip = {"x": 0, "y": 0, "width": width, "height": height}
+        self._cdp_screenshot_params: Dict[str, Any] = {
+            "format": screenshot_format,
+            "clip": {**self._clip, "scale": 1},
+            "captureBeyondViewport": False,
+            # Favour encode speed over output size; JPEG is already small
+            "optimizeForSpeed": True,
+        }
+        self._screenshot_options: Dict[str, Any] = {
+            "full_page": False,
+            "clip": self._clip,
+            "type": screenshot_format,
+        }
+        if screenshot_format == "jpeg":
+            self._cdp_screenshot_params["quality"] = screenshot_quality
+            self._screenshot_options["quality"] = screenshot_quality
     
     async def __aenter__(self):
         """Create Steel session and connect Playwright."""
@@ -116,6 +243,8 @@ class SteelBrowser:
             logger.info(f"Steel session created: {self.session.session_viewer_url}")
             
             # Connect Playwright
+            from playwright.async_api import async_playwright
+            
             self.playwright = await async_playwright().start()
             
             # Get API key
@@ -144,6 +273,13 @@ class SteelBrowser:
     
     async def _cleanup(self):
         """Clean up browser resources."""
+        if self._cdp:
+            try:
+                await self._cdp.detach()
+            except:
+                pass
+            self._cdp = None
+        
         if self.page:
             try:
                 await self.page.close()
@@ -169,16 +305,36 @@ class SteelBrowser:
             except:
                 pass
     
+    @property
+    def screenshot_media_type(self) -> str:
+        """MIME type of the images returned by screenshot()."""
+        return f"image/{self.screenshot_format}"
+    
     async def screenshot(self) -> str:
-        """Take a screenshot and return base64 encoded image."""
+        """Take a screenshot and return base64 encoded image.
+        
+        JPEG (the default) is several times smaller than PNG for most pages,
+        which shrinks both the upload and the image tokens per step.
+        """
         if not self.page:
             raise RuntimeError("Browser not initialized")
         
-        png_bytes = await self.page.screenshot(
-            full_page=False,
-            clip={"x": 0, "y": 0, "width": self.width, "height": self.height}
-        )
-        return base64.b64encode(png_bytes).decode("utf-8")
+        # Already loaded by the time a page exists, so this import is free
+        from playwright.async_api import Error as PlaywrightError
+        
+        try:
+            # CDP returns base64 directly and skips Playwright's per-call
+            # viewport metrics round-trip
+            if self._cdp is None:
+                self._cdp = await self.page.context.new_cdp_session(self.page)
+            result = await self._cdp.send("Page.captureScreenshot", self._cdp_screenshot_params)
+            return result["data"]
+        except PlaywrightError as e:
+            logger.warning(f"CDP screenshot failed, falling back to Playwright: {e}")
+            self._cdp = None
+        
+        image_bytes = await self.page.screenshot(**self._screenshot_options)
+        return _encode_screenshot(image_bytes)
     
     async def execute_action(
         self,
@@ -210,44 +366,28 @@ class SteelBrowser:
             await self.page.keyboard.type(text, delay=12)
         
         elif action == "key" and text:
-            # Handle key combinations like "ctrl+l" or "cmd+t"
-            if "+" in text:
-                key_parts = text.split("+")
-                modifier_keys = [KEY_MAPPINGS.get(k.strip(), k.strip()) for k in key_parts[:-1]]
-                main_key = KEY_MAPPINGS.get(key_parts[-1].strip(), key_parts[-1].strip())
-                
-                # Press modifiers
-                for mod in modifier_keys:
-                    await self.page.keyboard.down(mod)
-                
-                # Press main key
-                await self.page.keyboard.press(main_key)
-                
-                # Release modifiers
-                for mod in reversed(modifier_keys):
-                    await self.page.keyboard.up(mod)
+            if "+" not in text:
+                # Single key press, the common case
+                await self.page.keyboard.press(_map_key(text))
             else:
-                # Single key press
-                key_to_press = KEY_MAPPINGS.get(text.strip(), text.strip())
-                await self.page.keyboard.press(key_to_press)
+                # Key combinations like "ctrl+l" or "cmd+t"; Playwright holds the
+                # modifiers itself, in one call instead of a round-trip per key
+                await self.page.keyboard.press(_playwright_combo(text))
         
         # Handle scroll
         elif action == "scroll":
-            direction = kwargs.get("scroll_direction", "down")
-            amount = kwargs.get("scroll_amount", 3)
+            # The agent passes missing tool inputs through as None
+            direction = kwargs.get("scroll_direction") or "down"
+            amount = kwargs.get("scroll_amount")
+            if amount is None:
+                amount = 3
             
             if coordinate:
                 x, y = self._clamp_coords(coordinate)
                 await self.page.mouse.move(x, y)
             
-            delta_map = {
-                "up": (0, -100 * amount),
-                "down": (0, 100 * amount),
-                "left": (-100 * amount, 0),
-                "right": (100 * amount, 0)
-            }
-            dx, dy = delta_map.get(direction, (0, 100))
-            await self.page.mouse.wheel(dx, dy)
+            ux, uy = _SCROLL_UNIT.get(direction, _SCROLL_UNIT["down"])
+            await self.page.mouse.wheel(ux * amount, uy * amount)
         
         # Handle mouse move
         elif action == "mouse_move" and coordinate:
@@ -276,10 +416,35 @@ class ClaudeAgent:
     def __init__(
         self,
         api_key: str,
-        model: str = "claude-3-5-sonnet-20241022"
+        model: str = "claude-3-5-sonnet-20241022",
+        client: Optional["AsyncAnthropic"] = None,
     ):
-        self.client = Anthropic(api_key=api_key)
+        # Async client so the model call does not block the event loop. Agents
+        # on one loop can share a connection pool by passing the same client;
+        # its owner closes it.
+        self._owns_client = client is None
+        self.client = client if client is not None else _new_client(api_key)
         self.model = model
+        self._last_sent_screenshot: Optional[str] = None
+    
+    async def aclose(self) -> None:
+        """Close the API client's connection pool if this agent created it."""
+        if self._owns_client:
+            await self.client.close()
+    
+    def _screenshot_result_content(self, screenshot: str, media_type: str = "image/png") -> List[Dict[str, Any]]:
+        """Build tool_result content, replacing a repeat of the last image with a note."""
+        if screenshot == self._last_sent_screenshot:
+            return [{"type": "text", "text": SCREENSHOT_UNCHANGED_TEXT}]
+        self._last_sent_screenshot = screenshot
+        return [{
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": media_type,
+                "data": screenshot
+            }
+        }]
         
     async def execute_task(
         self,
@@ -291,18 +456,15 @@ class ClaudeAgent:
         
         logger.info(f"Starting task: {task}")
         
-        # Build tool definition
-        tools = [{
-            **TOOL_CONFIG,
-            "display_width_px": browser.width,
-            "display_height_px": browser.height,
-            "display_number": 1
-        }]
+        # Tool definition is built once per viewport size
+        tools = list(_build_tools(browser.width, browser.height))
         
-        # Initialize conversation
+        # Single conversation list, appended to in place
         messages = [{"role": "user", "content": task}]
+        self._last_sent_screenshot = None
         
         for step in range(max_steps):
+            _prune_old_screenshots(messages)
             try:
                 # Call Claude with rate limit handling
                 response = await self._call_claude_with_retry(
@@ -317,16 +479,10 @@ class ClaudeAgent:
                         logger.info(f"Claude: {block.text}")
                         
                         # Check for completion
-                        if "TASK_COMPLETED:" in block.text:
-                            return {
-                                "success": True,
-                                "result": block.text,
-                                "steps": step + 1,
-                                "session_url": browser.session.session_viewer_url
-                            }
-                        elif "TASK_FAILED:" in block.text:
+                        status = _TASK_STATUS_RE.search(block.text)
+                        if status:
                             return {
-                                "success": False,
+                                "success": status.group(1) == "COMPLETED",
                                 "result": block.text,
                                 "steps": step + 1,
                                 "session_url": browser.session.session_viewer_url
@@ -357,7 +513,7 @@ class ClaudeAgent:
                         )
                         
                         # Add tool use and result to conversation
-                        messages.append({
+                        messages.extend([{
                             "role": "assistant",
                             "content": [{
                                 "type": "tool_use",
@@ -365,23 +521,16 @@ class ClaudeAgent:
                                 "name": "computer",
                                 "input": tool_input
                             }]
-                        })
-                        
-                        messages.append({
+                        }, {
                             "role": "user",
                             "content": [{
                                 "type": "tool_result",
                                 "tool_use_id": block.id,
-                                "content": [{
-                                    "type": "image",
-                                    "source": {
-                                        "type": "base64",
-                                        "media_type": "image/png",
-                                        "data": screenshot
-                                    }
-                                }]
+                                "content": self._screenshot_result_content(
+                                    screenshot, browser.screenshot_media_type
+                                )
                             }]
-                        })
+                        }])
                 
             except Exception as e:
                 logger.error(f"Error at step {step}: {e}")
@@ -407,10 +556,12 @@ class ClaudeAgent:
         max_retries: int = 3
     ):
         """Call Claude API with retry logic for rate limits."""
+        from anthropic import RateLimitError
         
+        prev_delay = RETRY_BASE_DELAY
         for attempt in range(max_retries):
             try:
-                return self.client.beta.messages.create(
+                return await self.client.beta.messages.create(
                     model=self.model,
                     max_tokens=4096,
                     system=system,
@@ -420,8 +571,8 @@ class ClaudeAgent:
                 )
             except RateLimitError as e:
                 if attempt < max_retries - 1:
-                    wait_time = min(2 ** attempt, 10)
-                    logger.warning(f"Rate limit hit, waiting {wait_time}s...")
+                    wait_time = prev_delay = _retry_delay(e, prev_delay)
+                    logger.warning(f"Rate limit hit, waiting {wait_time:.1f}s...")
                     await asyncio.sleep(wait_time)
                 else:
                     raise e
@@ -457,6 +608,8 @@ async def run_browser_task(
     """
     
     # Initialize Steel client
+    from steel import Steel
+    
     steel_client = Steel(steel_api_key=steel_api_key)
     
     # Create browser session
@@ -469,11 +622,15 @@ async def run_browser_task(
         # Create Claude agent
         agent = ClaudeAgent(api_key=anthropic_api_key)
         
-        # Execute task
-        result = await agent.execute_task(
-            browser=browser,
-            task=task,
-            max_steps=max_steps
-        )
+        try:
+            # Execute task
+            result = await agent.execute_task(
+                browser=browser,
+                task=task,
+                max_steps=max_steps
+            )
+        finally:
+            # The client's connections belong to this loop, so release them with it
+            await agent.aclose()
         
         return result
\ No newline at end of file
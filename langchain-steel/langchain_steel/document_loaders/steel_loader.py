@@ -1,19 +1,90 @@
 """Steel document loader for LangChain."""
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, Iterator, List, Optional, Union
-from urllib.parse import urlparse
+import os
+import re
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
 
 from langchain_steel.utils.client import SteelClient, AsyncSteelClient
 from langchain_steel.utils.config import SteelConfig, OutputFormat
-from langchain_steel.utils.errors import SteelContentError, SteelError
+from langchain_steel.utils.errors import SteelConfigError, SteelContentError, SteelError
 
 logger = logging.getLogger(__name__)
 
+# Below this many URLs the cost of starting worker processes outweighs
+# what they save over the thread pool, so process mode falls back to threads
+PROCESS_POOL_MIN_URLS = 32
+
+# Largest batch the "auto" executor keeps on the thread pool; bigger batches
+# run on the asyncio path, which holds far more requests in flight cheaply
+THREAD_POOL_MAX_URLS = 16
+
+_EXECUTORS = ("auto", "thread", "async", "process")
+
+# scheme://host prefix; the scheme is checked separately for a clearer error
+_URL_RE = re.compile(r"^([a-z][a-z0-9+.-]*)://([^/?#\s]+)", re.IGNORECASE)
+
+# Response keys probed for page content, in priority order
+_CONTENT_KEYS = ("content", "data", "body", "text", "html")
+
+# Metadata field -> response keys that may carry it, in priority order
+_METADATA_FIELDS = {
+    "title": ("title", "page_title"),
+    "description": ("description", "meta_description"),
+    "content_type": ("content_type", "mime_type"),
+    "status_code": ("status_code", "http_status"),
+    "final_url": ("final_url", "resolved_url", "url"),
+    "load_time": ("load_time", "duration"),
+    "page_size": ("page_size", "content_length"),
+}
+
+_CONTENT_PRIORITY = {key: priority for priority, key in enumerate(_CONTENT_KEYS)}
+
+# Fallback order for the per-format content object returned by the Steel SDK
+_SDK_CONTENT_FORMATS = ("markdown", "readability", "cleaned_html", "html")
+
+# Inverted lookup: response key -> (metadata field, priority)
+_META_KEY_TO_FIELD = {
+    key: (field, priority)
+    for field, keys in _METADATA_FIELDS.items()
+    for priority, key in enumerate(keys)
+}
+
+# Client owned by each process-pool worker, built once by _init_scrape_worker
+_worker_client: Optional[SteelClient] = None
+
+
+def _init_scrape_worker(config: SteelConfig) -> None:
+    """Create the Steel client a process-pool worker reuses for its URLs."""
+    global _worker_client
+    _worker_client = SteelClient(config)
+
+
+def _scrape_url_worker(
+    url: str, scrape_params: Dict[str, Any]
+) -> Tuple[Optional[Any], Optional[str]]:
+    """Scrape one URL inside a process-pool worker.
+    
+    Errors are returned as strings because Steel exceptions carry
+    constructor arguments that do not survive pickling.
+    
+    Returns:
+        Tuple of (response, None) on success or (None, error message)
+    """
+    try:
+        return _worker_client.scrape(url=url, **scrape_params), None
+    except Exception as e:
+        return None, str(e)
+
 
 class SteelDocumentLoader(BaseLoader):
     """Steel document loader for LangChain.
@@ -62,12 +133,18 @@ class SteelDocumentLoader(BaseLoader):
         config: Optional[SteelConfig] = None,
         format: Optional[OutputFormat] = None,
         session_reuse: bool = True,
+        sort_by_host: bool = False,
         extract_images: bool = False,
         extract_links: bool = False,
         custom_headers: Optional[Dict[str, str]] = None,
         delay_ms: Optional[int] = None,
         wait_for_selector: Optional[str] = None,
         screenshot: bool = False,
+        max_concurrency: int = 10,
+        max_workers: Optional[int] = None,
+        executor: str = "auto",
+        cache: Optional[Any] = None,
+        cache_ttl: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         """Initialize Steel document loader.
@@ -77,12 +154,22 @@ class SteelDocumentLoader(BaseLoader):
             config: Steel configuration (uses environment defaults if None)
             format: Output format for content extraction
             session_reuse: Whether to reuse browser sessions for efficiency
+            sort_by_host: Whether to group URLs by host so a shared session visits
+                each site's pages back to back (changes document order)
             extract_images: Whether to extract image information
             extract_links: Whether to extract link information
             custom_headers: Custom HTTP headers to send
             delay_ms: Delay in milliseconds before content extraction
             wait_for_selector: CSS selector to wait for before extraction
             screenshot: Whether to capture screenshots
+            max_concurrency: Maximum number of URLs scraped at once by ``aload``
+            max_workers: Thread pool size for ``load`` (default: min(32, len(urls)))
+            executor: How ``load`` runs a batch: ``"thread"``, ``"async"``, ``"process"``
+                (used from ``PROCESS_POOL_MIN_URLS`` URLs) or ``"auto"`` to pick by
+                batch size
+            cache: Optional response cache with ``get(key)`` and
+                ``set(key, value, expire=...)``, e.g. a ``diskcache.Cache``
+            cache_ttl: Seconds before a cached response expires (None keeps it)
             **kwargs: Additional Steel API parameters
         """
         # Normalize URLs to list
@@ -91,8 +178,12 @@ class SteelDocumentLoader(BaseLoader):
         else:
             self.urls = list(urls)
         
-        # Validate URLs
-        self._validate_urls()
+        # Validate URLs, keeping each URL's host
+        self._url_hosts = self._validate_urls()
+        if sort_by_host:
+            order = sorted(range(len(self.urls)), key=self._url_hosts.__getitem__)
+            self.urls = [self.urls[i] for i in order]
+            self._url_hosts = [self._url_hosts[i] for i in order]
         
         # Configuration
         self.config = config or SteelConfig.from_env()
@@ -107,6 +198,22 @@ class SteelDocumentLoader(BaseLoader):
         self.wait_for_selector = wait_for_selector
         self.screenshot = screenshot
         
+        if max_concurrency < 1:
+            raise SteelConfigError(
+                f"max_concurrency must be at least 1, got {max_concurrency}",
+                config_field="max_concurrency",
+            )
+        if executor not in _EXECUTORS:
+            raise SteelConfigError(
+                f"executor must be one of {', '.join(_EXECUTORS)}, got {executor!r}",
+                config_field="executor",
+            )
+        self.max_concurrency = max_concurrency
+        self.max_workers = max_workers or min(32, len(self.urls))
+        self.executor = executor
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        
         # Additional Steel parameters
         self.steel_params = kwargs
         
@@ -114,18 +221,28 @@ class SteelDocumentLoader(BaseLoader):
         self._client: Optional[SteelClient] = None
         self._async_client: Optional[AsyncSteelClient] = None
     
-    def _validate_urls(self) -> None:
-        """Validate that all URLs are properly formatted."""
+    def _validate_urls(self) -> List[str]:
+        """Validate that all URLs are properly formatted.
+        
+        Returns:
+            Lowercased host (netloc) of each URL, in URL order
+        """
+        hosts = []
         for url in self.urls:
             if not isinstance(url, str):
                 raise SteelContentError(f"URL must be string, got {type(url)}")
             
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
+            match = _URL_RE.match(url)
+            if match is None:
                 raise SteelContentError(f"Invalid URL format: {url}")
             
-            if parsed.scheme not in ("http", "https"):
-                raise SteelContentError(f"Unsupported URL scheme: {parsed.scheme}")
+            scheme = match.group(1).lower()
+            if scheme not in ("http", "https"):
+                raise SteelContentError(f"Unsupported URL scheme: {scheme}")
+            
+            hosts.append(match.group(2).lower())
+        
+        return hosts
     
     @property
     def client(self) -> SteelClient:
@@ -141,86 +258,56 @@ class SteelDocumentLoader(BaseLoader):
             self._async_client = AsyncSteelClient(self.config)
         return self._async_client
     
-    def _extract_content_from_response(self, response: Dict[str, Any], url: str) -> str:
-        """Extract content from Steel API response.
+    def _extract_document(self, response: Dict[str, Any], url: str) -> Document:
+        """Build a Document from a Steel API response.
+        
+        Content and metadata are collected in a single pass over the
+        response: the highest-priority content key becomes the page content
+        and known metadata aliases are mapped through ``_META_KEY_TO_FIELD``.
         
         Args:
             response: Steel API response
-            url: Original URL (for error context)
+            url: Original URL (for metadata and error context)
             
         Returns:
-            Extracted content string
+            LangChain Document object
             
         Raises:
-            SteelContentError: If content extraction fails
-        """
-        try:
-            # Handle different response formats from Steel API
-            if isinstance(response, dict):
-                # Try different content keys
-                for content_key in ["content", "data", "body", "text", "html"]:
-                    if content_key in response:
-                        content = response[content_key]
-                        if content and isinstance(content, str):
-                            return content
-                
-                # If no content found, try to serialize the response
-                if response:
-                    return str(response)
-            
-            elif isinstance(response, str):
-                return response
-            
-            else:
-                return str(response)
-        
-        except Exception as e:
-            raise SteelContentError(
-                f"Failed to extract content from response for URL: {url}",
-                url=url,
-                format_requested=self.format.value,
-                original_error=e
-            )
-        
-        raise SteelContentError(
-            f"No content found in Steel response for URL: {url}",
-            url=url,
-            format_requested=self.format.value
-        )
-    
-    def _extract_metadata(self, response: Dict[str, Any], url: str) -> Dict[str, Any]:
-        """Extract metadata from Steel API response.
-        
-        Args:
-            response: Steel API response
-            url: Original URL
-            
-        Returns:
-            Dictionary of metadata
+            SteelContentError: If no content can be extracted
         """
         metadata = {
             "source": url,
             "format": self.format.value,
             "loader": "SteelDocumentLoader"
         }
+        content = None
+        
+        if not isinstance(response, (dict, str)) and hasattr(response, "model_dump"):
+            # Steel SDK ScrapeResponse model
+            response = response.model_dump()
         
         if isinstance(response, dict):
-            # Extract common metadata fields
-            metadata_fields = {
-                "title": ["title", "page_title"],
-                "description": ["description", "meta_description"],
-                "content_type": ["content_type", "mime_type"],
-                "status_code": ["status_code", "http_status"],
-                "final_url": ["final_url", "resolved_url", "url"],
-                "load_time": ["load_time", "duration"],
-                "page_size": ["page_size", "content_length"]
-            }
-            
-            for meta_key, possible_keys in metadata_fields.items():
-                for key in possible_keys:
-                    if key in response:
-                        metadata[meta_key] = response[key]
-                        break
+            content_priority = len(_CONTENT_KEYS)
+            meta_priorities: Dict[str, int] = {}
+            for key, value in response.items():
+                priority = _CONTENT_PRIORITY.get(key)
+                if priority is not None:
+                    if isinstance(value, dict):
+                        # SDK shape: {"markdown": ..., "html": ...}
+                        value = value.get(self.format.value) or next(
+                            (value[fmt] for fmt in _SDK_CONTENT_FORMATS if value.get(fmt)), None
+                        )
+                    if priority < content_priority and value and isinstance(value, str):
+                        content, content_priority = value, priority
+                    continue
+                
+                target = _META_KEY_TO_FIELD.get(key)
+                if target is None:
+                    continue
+                meta_key, priority = target
+                if meta_key not in meta_priorities or priority < meta_priorities[meta_key]:
+                    meta_priorities[meta_key] = priority
+                    metadata[meta_key] = value
             
             # Extract image information if requested
             if self.extract_images and "images" in response:
@@ -234,7 +321,48 @@ class SteelDocumentLoader(BaseLoader):
             if self.screenshot and "screenshot" in response:
                 metadata["screenshot"] = response["screenshot"]
         
-        return metadata
+        elif isinstance(response, str):
+            content = response
+        
+        # No recognised content is an error; serializing the whole response
+        # would hand a potentially huge repr to downstream prompts instead
+        if content is None:
+            raise SteelContentError(
+                f"No content found in Steel response for URL: {url}",
+                url=url,
+                format_requested=self.format.value
+            )
+        
+        return Document(page_content=content, metadata=metadata)
+    
+    def _cache_key(self, url: str, scrape_params: Dict[str, Any]) -> str:
+        """Build a stable cache key for a URL and its scrape parameters."""
+        payload = json.dumps({"url": url, "params": scrape_params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _scrape(self, url: str, session: Optional[Any] = None, **scrape_params: Any) -> Any:
+        """Scrape a URL, serving repeat requests from the response cache."""
+        if self.cache is None:
+            return self.client.scrape(url=url, session=session, **scrape_params)
+        
+        key = self._cache_key(url, scrape_params)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.client.scrape(url=url, session=session, **scrape_params)
+            self.cache.set(key, response, expire=self.cache_ttl)
+        return response
+    
+    async def _ascrape(self, url: str, session: Optional[Any] = None, **scrape_params: Any) -> Any:
+        """Async version of ``_scrape``."""
+        if self.cache is None:
+            return await self.async_client.scrape(url=url, session=session, **scrape_params)
+        
+        key = self._cache_key(url, scrape_params)
+        response = self.cache.get(key)
+        if response is None:
+            response = await self.async_client.scrape(url=url, session=session, **scrape_params)
+            self.cache.set(key, response, expire=self.cache_ttl)
+        return response
     
     def _load_single_url(self, url: str) -> Document:
         """Load content from a single URL.
@@ -249,50 +377,14 @@ class SteelDocumentLoader(BaseLoader):
             SteelError: If loading fails
         """
         try:
-            logger.info(f"Loading content from URL: {url}")
-            
-            # Prepare scraping parameters
-            scrape_params = {
-                "format": self.format.value,
-                **self.steel_params
-            }
-            
-            # Add optional parameters
-            if self.custom_headers:
-                scrape_params["headers"] = self.custom_headers
-            
-            if self.delay_ms is not None:
-                scrape_params["delay"] = self.delay_ms
-            
-            if self.wait_for_selector:
-                scrape_params["wait_for_selector"] = self.wait_for_selector
-            
-            if self.screenshot:
-                scrape_params["screenshot"] = True
-            
-            if self.extract_images:
-                scrape_params["extract_images"] = True
-            
-            if self.extract_links:
-                scrape_params["extract_links"] = True
+            logger.info("Loading content from URL: %s", url)
             
             # Scrape content using Steel client
-            response = self.client.scrape(
-                url=url,
-                **scrape_params
-            )
-            
-            # Extract content and metadata
-            content = self._extract_content_from_response(response, url)
-            metadata = self._extract_metadata(response, url)
+            response = self._scrape(url, **self._scrape_params)
             
-            # Create and return Document
-            document = Document(
-                page_content=content,
-                metadata=metadata
-            )
+            document = self._extract_document(response, url)
             
-            logger.info(f"Successfully loaded content from {url} (length: {len(content)})")
+            logger.info("Successfully loaded content from %s (length: %d)", url, len(document.page_content))
             return document
         
         except SteelError:
@@ -307,63 +399,27 @@ class SteelDocumentLoader(BaseLoader):
                 original_error=e
             )
     
-    async def _aload_single_url(self, url: str) -> Document:
+    async def _aload_single_url(self, url: str, session: Optional[Any] = None) -> Document:
         """Async load content from a single URL.
         
         Args:
             url: URL to load
+            session: Steel session shared across the batch (created per call if None)
             
         Returns:
             LangChain Document object
         """
         try:
-            logger.info(f"Loading content from URL (async): {url}")
-            
-            # Prepare scraping parameters
-            scrape_params = {
-                "format": self.format.value,
-                **self.steel_params
-            }
+            logger.info("Loading content from URL (async): %s", url)
             
-            # Add optional parameters
-            if self.custom_headers:
-                scrape_params["headers"] = self.custom_headers
+            response = await self._ascrape(url, session, **self._scrape_params)
             
-            if self.delay_ms is not None:
-                scrape_params["delay"] = self.delay_ms
+            document = self._extract_document(response, url)
             
-            if self.wait_for_selector:
-                scrape_params["wait_for_selector"] = self.wait_for_selector
-            
-            if self.screenshot:
-                scrape_params["screenshot"] = True
-            
-            if self.extract_images:
-                scrape_params["extract_images"] = True
-            
-            if self.extract_links:
-                scrape_params["extract_links"] = True
-            
-            # Note: This assumes Steel SDK has async scrape method
-            # Adjust based on actual Steel SDK async API
-            async with self.async_client.session_context() as session:
-                response = await self.async_client.scrape(
-                    url=url,
-                    session=session,
-                    **scrape_params
-                )
-            
-            # Extract content and metadata
-            content = self._extract_content_from_response(response, url)
-            metadata = self._extract_metadata(response, url)
-            
-            # Create and return Document
-            document = Document(
-                page_content=content,
-                metadata=metadata
+            logger.info(
+                "Successfully loaded content from %s (async, length: %d)",
+                url, len(document.page_content)
             )
-            
-            logger.info(f"Successfully loaded content from {url} (async, length: {len(content)})")
             return document
         
         except SteelError:
@@ -386,38 +442,43 @@ class SteelDocumentLoader(BaseLoader):
         Raises:
             SteelError: If loading fails
         """
-        logger.info(f"Loading {len(self.urls)} URLs with Steel document loader")
+        logger.info("Loading %d URLs with Steel document loader", len(self.urls))
         
         documents = []
         errors = []
         
         try:
+            if len(self.urls) == 1:
+                # Single URL: no shared session, pool or cleanup to pay for
+                return [self._load_single_url(self.urls[0])]
+            
+            executor = self._resolve_executor()
+            if executor == "async":
+                return asyncio.run(self._aload_standalone())
+            
+            if executor == "process" and len(self.urls) >= PROCESS_POOL_MIN_URLS:
+                documents, errors = self._load_in_processes()
+            
             # Load documents with session reuse if enabled
-            if self.session_reuse and len(self.urls) > 1:
+            elif self.session_reuse and len(self.urls) > 1:
                 with self.client.session_context() as session:
-                    for url in self.urls:
-                        try:
-                            # Use session for efficient loading
-                            response = self.client.scrape(
-                                url=url,
-                                session=session,
-                                format=self.format.value,
-                                **self._get_scrape_params()
-                            )
-                            
-                            content = self._extract_content_from_response(response, url)
-                            metadata = self._extract_metadata(response, url)
-                            
-                            document = Document(
-                                page_content=content,
-                                metadata=metadata
-                            )
-                            documents.append(document)
-                            
-                        except Exception as e:
-                            error_msg = f"Failed to load {url}: {str(e)}"
-                            logger.warning(error_msg)
-                            errors.append(error_msg)
+                    
+                    def _scrape_one(url: str) -> Document:
+                        # Use session for efficient loading
+                        response = self._scrape(url, session, **self._scrape_params)
+                        return self._extract_document(response, url)
+                    
+                    # Scrapes are network-bound, so threads overlap the waits.
+                    # Futures are drained in submission order to keep URL order.
+                    with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                        futures = [(url, pool.submit(_scrape_one, url)) for url in self.urls]
+                        for url, future in futures:
+                            try:
+                                documents.append(future.result())
+                            except Exception as e:
+                                error_msg = f"Failed to load {url}: {str(e)}"
+                                logger.warning(error_msg)
+                                errors.append(error_msg)
             
             else:
                 # Load documents individually
@@ -433,7 +494,7 @@ class SteelDocumentLoader(BaseLoader):
             # Cleanup sessions
             self.client.cleanup_sessions()
             
-            logger.info(f"Successfully loaded {len(documents)} out of {len(self.urls)} URLs")
+            logger.info("Successfully loaded %d out of %d URLs", len(documents), len(self.urls))
             
             # If no documents loaded and we have errors, raise the first error
             if not documents and errors:
@@ -447,34 +508,123 @@ class SteelDocumentLoader(BaseLoader):
         except Exception as e:
             raise SteelError(f"Document loading failed: {str(e)}", original_error=e)
     
+    def _resolve_executor(self) -> str:
+        """Pick the executor ``load`` uses for this batch.
+        
+        ``"auto"`` keeps small batches on the thread pool and moves larger
+        ones to the asyncio path. The asyncio path needs its own event loop,
+        so any caller already inside one stays on threads.
+        """
+        executor = self.executor
+        if executor == "auto":
+            executor = "thread" if len(self.urls) <= THREAD_POOL_MAX_URLS else "async"
+        
+        if executor == "async":
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return "async"
+            return "thread"
+        
+        return executor
+    
+    async def _aload_standalone(self) -> List[Document]:
+        """Run ``aload`` on a private event loop and close its client afterwards.
+        
+        The async client's connection pool is bound to the loop that created
+        it, so it is discarded rather than reused by a later ``asyncio.run``.
+        """
+        try:
+            return await self.aload()
+        finally:
+            client, self._async_client = self._async_client, None
+            if client is not None:
+                await client.close()
+    
+    def _load_in_processes(self) -> Tuple[List[Document], List[str]]:
+        """Scrape all URLs on a process pool, one Steel client per worker.
+        
+        Session reuse is not available across processes, but response
+        decoding and content extraction run in parallel on every core.
+        The response cache lives in this process, so it is checked before
+        submitting and filled from the results that come back.
+        
+        Returns:
+            Tuple of (documents, error messages)
+        """
+        documents = []
+        errors = []
+        responses: Dict[str, Tuple[Optional[Any], Optional[str]]] = {}
+        if self.cache is not None:
+            for url in self.urls:
+                cached = self.cache.get(self._cache_key(url, self._scrape_params))
+                if cached is not None:
+                    responses[url] = (cached, None)
+        
+        # Each uncached URL is scraped once, however often it is listed
+        pending = [url for url in dict.fromkeys(self.urls) if url not in responses]
+        if pending:
+            with ProcessPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) - 1),
+                initializer=_init_scrape_worker,
+                initargs=(self.config,),
+            ) as pool:
+                results = pool.map(
+                    _scrape_url_worker,
+                    pending,
+                    [self._scrape_params] * len(pending),
+                    chunksize=4,
+                )
+                for url, (response, error) in zip(pending, results):
+                    responses[url] = (response, error)
+                    if self.cache is not None and error is None:
+                        self.cache.set(
+                            self._cache_key(url, self._scrape_params), response, expire=self.cache_ttl
+                        )
+        
+        for url in self.urls:
+            response, error = responses[url]
+            try:
+                if error is not None:
+                    raise SteelError(error)
+                documents.append(self._extract_document(response, url))
+            except Exception as e:
+                error_msg = f"Failed to load {url}: {str(e)}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+        
+        return documents, errors
+    
     async def aload(self) -> List[Document]:
         """Async load documents from all URLs.
         
         Returns:
-            List of LangChain Document objects
+            List of LangChain Document objects, in URL order
         """
-        logger.info(f"Loading {len(self.urls)} URLs with Steel document loader (async)")
+        logger.info("Loading %d URLs with Steel document loader (async)", len(self.urls))
         
-        # Load documents concurrently
         try:
-            tasks = [self._aload_single_url(url) for url in self.urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if len(self.urls) == 1:
+                # Single URL: skip the shared session, fan-out and cleanup
+                return [await self._aload_single_url(self.urls[0])]
+            
+            # Scrapes finish out of order; slot them back by URL position
+            results: List[Union[Document, Exception, None]] = [None] * len(self.urls)
+            async for index, _url, result in self._aiter_results():
+                results[index] = result
             
             documents = []
             errors = []
             
-            for i, result in enumerate(results):
+            for url, result in zip(self.urls, results):
                 if isinstance(result, Document):
                     documents.append(result)
-                elif isinstance(result, Exception):
-                    error_msg = f"Failed to load {self.urls[i]}: {str(result)}"
+                else:
+                    error_msg = f"Failed to load {url}: {str(result)}"
                     logger.warning(error_msg)
                     errors.append(error_msg)
             
-            # Cleanup sessions
-            await self.async_client.cleanup_sessions()
-            
-            logger.info(f"Successfully loaded {len(documents)} out of {len(self.urls)} URLs (async)")
+            logger.info("Successfully loaded %d out of %d URLs (async)", len(documents), len(self.urls))
             
             if not documents and errors:
                 raise SteelContentError(f"Failed to load any documents. First error: {errors[0]}")
@@ -487,33 +637,136 @@ class SteelDocumentLoader(BaseLoader):
         except Exception as e:
             raise SteelError(f"Async document loading failed: {str(e)}", original_error=e)
     
+    async def aload_iter(self) -> AsyncIterator[Document]:
+        """Async load documents, yielding each one as soon as it finishes.
+        
+        Documents arrive in completion order rather than URL order; URLs
+        that fail are logged and skipped.
+        
+        Yields:
+            LangChain Document objects
+        """
+        async for _index, url, result in self._aiter_results():
+            if isinstance(result, Document):
+                yield result
+            else:
+                logger.warning(f"Failed to load {url}: {str(result)}")
+    
+    @asynccontextmanager
+    async def _batch_session(self) -> AsyncIterator[Optional[Any]]:
+        """Yield the Steel session shared by an async batch.
+        
+        Without ``session_reuse`` this yields None, so each scrape opens its own.
+        """
+        if not self.session_reuse:
+            yield None
+            return
+        async with self.async_client.session_context() as session:
+            yield session
+    
+    async def _aiter_results(
+        self,
+    ) -> AsyncIterator[Tuple[int, str, Union[Document, Exception]]]:
+        """Scrape all URLs concurrently and yield (index, url, result) as each completes.
+        
+        At most ``max_concurrency`` scrapes are in flight, sharing one Steel
+        session when ``session_reuse`` is set. Failures are yielded as the
+        exception instead of raised.
+        """
+        # Created here so the semaphore binds to the running loop
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _guarded(
+            index: int, url: str, session: Any
+        ) -> Tuple[int, str, Union[Document, Exception]]:
+            async with semaphore:
+                try:
+                    return index, url, await self._aload_single_url(url, session)
+                except Exception as e:
+                    return index, url, e
+        
+        # One session for the whole batch keeps connections warm across URLs
+        async with self._batch_session() as session:
+            tasks = [
+                asyncio.ensure_future(_guarded(index, url, session))
+                for index, url in enumerate(self.urls)
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                # Stop outstanding scrapes if the consumer stops iterating early
+                for task in tasks:
+                    task.cancel()
+        
+        await self.async_client.cleanup_sessions()
+    
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Async lazy load documents in URL order with bounded prefetch.
+        
+        A producer starts scrapes ahead of the consumer through a queue of
+        ``max_concurrency`` slots, so network latency overlaps the caller's
+        work while only a handful of responses are ever held in memory.
+        
+        Yields:
+            LangChain Document objects
+        """
+        logger.info("Async lazy loading %d URLs with Steel document loader", len(self.urls))
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency)
+        
+        async with self._batch_session() as session:
+            
+            async def _produce() -> None:
+                for url in self.urls:
+                    await queue.put((url, asyncio.ensure_future(self._aload_single_url(url, session))))
+                await queue.put(None)
+            
+            producer = asyncio.ensure_future(_produce())
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    url, task = item
+                    try:
+                        yield await task
+                    except Exception as e:
+                        logger.warning(f"Failed to load {url}: {str(e)}")
+            finally:
+                # Stop prefetching if the consumer stops iterating early
+                producer.cancel()
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not None:
+                        item[1].cancel()
+        
+        await self.async_client.cleanup_sessions()
+    
     def lazy_load(self) -> Iterator[Document]:
         """Lazy load documents one at a time.
         
         Yields:
             LangChain Document objects
         """
-        logger.info(f"Lazy loading {len(self.urls)} URLs with Steel document loader")
+        logger.info("Lazy loading %d URLs with Steel document loader", len(self.urls))
+        
+        if len(self.urls) == 1:
+            # Single URL: no shared session to open or clean up
+            try:
+                yield self._load_single_url(self.urls[0])
+            except Exception as e:
+                logger.warning(f"Failed to load {self.urls[0]}: {str(e)}")
+            return
         
         try:
             if self.session_reuse:
                 with self.client.session_context() as session:
                     for url in self.urls:
                         try:
-                            response = self.client.scrape(
-                                url=url,
-                                session=session,
-                                format=self.format.value,
-                                **self._get_scrape_params()
-                            )
+                            response = self._scrape(url, session, **self._scrape_params)
                             
-                            content = self._extract_content_from_response(response, url)
-                            metadata = self._extract_metadata(response, url)
-                            
-                            yield Document(
-                                page_content=content,
-                                metadata=metadata
-                            )
+                            yield self._extract_document(response, url)
                             
                         except Exception as e:
                             logger.warning(f"Failed to load {url}: {str(e)}")
@@ -533,13 +786,16 @@ class SteelDocumentLoader(BaseLoader):
         except Exception as e:
             raise SteelError(f"Lazy document loading failed: {str(e)}", original_error=e)
     
-    def _get_scrape_params(self) -> Dict[str, Any]:
-        """Get scraping parameters for Steel API calls.
+    @cached_property
+    def _scrape_params(self) -> Dict[str, Any]:
+        """Scraping parameters for Steel API calls, built once per loader.
+        
+        Every scrape call site unpacks this dict as-is, output format included.
         
         Returns:
-            Dictionary of scraping parameters
+            Dictionary of scraping parameters (treat as read-only)
         """
-        params = self.steel_params.copy()
+        params = {"format": self.format.value, **self.steel_params}
         
         if self.custom_headers:
             params["headers"] = self.custom_headers
@@ -1,8 +1,11 @@
 """Base Steel tool for LangChain agents."""
 
 import asyncio
+import atexit
 import logging
+import time
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Dict, Optional, Type, Union
 
 from langchain_core.callbacks import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
@@ -10,11 +13,59 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field, PrivateAttr
 
 from langchain_steel.utils.client import SteelClient, AsyncSteelClient
-from langchain_steel.utils.config import SteelConfig
+from langchain_steel.utils.config import SteelConfig, get_default_config
 from langchain_steel.utils.errors import SteelError
 
 logger = logging.getLogger(__name__)
 
+# Set once enable_logging has configured the root logger for this process
+_LOGGING_CONFIGURED = False
+
+# Steel clients shared by every tool with equivalent settings, keyed by
+# SteelConfig.cache_key(), so tools reuse one HTTP connection pool and
+# session pool instead of each opening their own
+_CLIENT_POOL: Dict[str, SteelClient] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _pooled_client(config: SteelConfig) -> SteelClient:
+    """Return the shared Steel client for this configuration, creating it on first use."""
+    key = config.cache_key()
+    client = _CLIENT_POOL.get(key)
+    if client is None:
+        client = _CLIENT_POOL[key] = SteelClient(config)
+    return client
+
+
+# Browser sessions opened by ensure_session() and not yet released, mapped to
+# the config of the tool holding them, so they can be released at exit
+_LIVE_SESSIONS: Dict[str, SteelConfig] = {}
+
+
+@atexit.register
+def _cleanup_client_pool() -> None:
+    """Release tool sessions still open and expired pooled sessions at interpreter exit."""
+    # The event loops that opened these sessions are gone, so use sync clients
+    for session_id, config in list(_LIVE_SESSIONS.items()):
+        try:
+            _pooled_client(config).release_session(session_id)
+        except Exception as e:
+            logger.warning(f"Error releasing Steel session {session_id}: {e}")
+    _LIVE_SESSIONS.clear()
+    
+    for client in list(_CLIENT_POOL.values()):
+        try:
+            client.cleanup_sessions()
+        except Exception as e:
+            logger.warning(f"Error during Steel client cleanup: {e}")
+
 
 class BaseSteelTool(BaseTool, ABC):
     """Abstract base class for Steel tools.
@@ -24,6 +75,15 @@ class BaseSteelTool(BaseTool, ABC):
     - Session handling
     - Error handling and logging
     - Configuration management
+    
+    Inside ``async with tool:`` (with ``session_reuse`` enabled) async calls
+    share one browser session, released when the block exits; outside it
+    each call opens and releases its own. Sessions from ``ensure_session()``
+    stay open until ``aclose()``, or are released at interpreter exit.
+    
+    HTTP connection pool sizing (``max_connections``,
+    ``max_keepalive_connections``, ``http_timeout``) is read from the tool's
+    SteelConfig, so set it there once for every tool sharing that config.
     """
     
     # Tool metadata (to be overridden by subclasses)
@@ -34,9 +94,18 @@ class BaseSteelTool(BaseTool, ABC):
     config: Optional[SteelConfig] = Field(default=None, exclude=True)
     session_reuse: bool = Field(default=True, description="Whether to reuse browser sessions")
     
-    # Internal clients - using PrivateAttr since they start with underscore
-    _client: Optional[SteelClient] = PrivateAttr(default=None)
+    # Browser session shared by this tool's async calls (see ensure_session)
+    _session: Optional[Any] = PrivateAttr(default=None)
+    _session_opened_at: float = PrivateAttr(default=0.0)
+    _session_held: bool = PrivateAttr(default=False)
+    _session_lock: Optional[asyncio.Lock] = PrivateAttr(default=None)
+    _session_lock_loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+    
+    # Async client, either created by the tool (and closed by aclose) or
+    # supplied through the async_client setter
     _async_client: Optional[AsyncSteelClient] = PrivateAttr(default=None)
+    _owns_async_client: bool = PrivateAttr(default=False)
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
     
     class Config:
         """Pydantic configuration."""
@@ -52,26 +121,43 @@ class BaseSteelTool(BaseTool, ABC):
         
         # Initialize configuration
         if self.config is None:
-            self.config = SteelConfig.from_env()
+            self.config = get_default_config()
         
-        # Setup logging
-        if self.config.enable_logging:
+        # Setup logging once per process rather than on every tool construction
+        global _LOGGING_CONFIGURED
+        if self.config.enable_logging and not _LOGGING_CONFIGURED:
             logging.basicConfig(level=logging.INFO)
+            _LOGGING_CONFIGURED = True
     
-    @property
+    @cached_property
     def client(self) -> SteelClient:
-        """Get or create synchronous Steel client."""
-        if self._client is None:
-            self._client = SteelClient(self.config)
-        return self._client
+        """Shared synchronous Steel client for this tool's config."""
+        return _pooled_client(self.config)
     
     @property
     def async_client(self) -> AsyncSteelClient:
-        """Get or create asynchronous Steel client."""
+        """Asynchronous Steel client for this tool, created on first use.
+        
+        A client the tool creates is closed by ``aclose()``; one supplied
+        through the setter belongs to the caller. An async client's
+        connections belong to the loop that opened them, so a tool used from
+        a new loop (e.g. a later ``asyncio.run()``) replaces its own client.
+        """
+        if self._owns_async_client and self._async_client_loop is not _running_loop():
+            # The old loop is gone, so its client can no longer be closed cleanly
+            self._async_client = None
         if self._async_client is None:
             self._async_client = AsyncSteelClient(self.config)
+            self._owns_async_client = True
+            self._async_client_loop = _running_loop()
         return self._async_client
     
+    @async_client.setter
+    def async_client(self, client: Optional[AsyncSteelClient]) -> None:
+        """Use a caller-owned async client, e.g. one shared between tools."""
+        self._async_client = client
+        self._owns_async_client = False
+    
     @abstractmethod
     def _run(
         self,
@@ -141,21 +227,29 @@ class BaseSteelTool(BaseTool, ABC):
         if isinstance(error, SteelError):
             error_msg = f"Steel {operation} failed: {error.message}"
             
-            if hasattr(error, 'details') and error.details:
+            details = getattr(error, "details", None)
+            if details:
                 # Add relevant error details
-                relevant_details = {
-                    k: v for k, v in error.details.items() 
-                    if k in ['url', 'status_code', 'retry_after']
-                }
+                relevant_details = [
+                    f"{key}={value}"
+                    for key, value in (
+                        ("url", details.get("url")),
+                        ("status_code", details.get("status_code")),
+                        ("retry_after", details.get("retry_after")),
+                    )
+                    if value is not None
+                ]
                 if relevant_details:
-                    details_str = ", ".join(f"{k}={v}" for k, v in relevant_details.items())
-                    error_msg += f" ({details_str})"
+                    error_msg += f" ({', '.join(relevant_details)})"
             
             logger.error(error_msg)
             return error_msg
         
         else:
-            error_msg = f"Steel {operation} failed: {str(error)}"
+            # A lone string argument is the message; anything else needs __str__
+            args = error.args
+            message = args[0] if len(args) == 1 and type(args[0]) is str else str(error)
+            error_msg = f"Steel {operation} failed: {message}"
             logger.error(error_msg)
             return error_msg
     
@@ -166,32 +260,95 @@ class BaseSteelTool(BaseTool, ABC):
             operation: Name of the operation
             params: Parameters used for the operation
         """
-        if self.config and self.config.enable_logging:
+        if self.config and self.config.enable_logging and logger.isEnabledFor(logging.INFO):
             # Filter sensitive parameters for logging
             safe_params = {
                 k: v for k, v in params.items() 
                 if k not in ['api_key', 'session_id', 'headers']
             }
-            logger.info(f"Executing Steel {operation} with params: {safe_params}")
+            logger.info("Executing Steel %s with params: %s", operation, safe_params)
+    
+    async def ensure_session(self) -> Any:
+        """Return the browser session shared by this tool's async calls.
+        
+        The session is opened on first use and replaced once it is older than
+        the configured session timeout. Concurrent callers wait for a single
+        session to be opened rather than each creating their own.
+        
+        Returns:
+            Steel session object
+        """
+        session = self._session
+        if session is not None and not self._session_expired():
+            return session
+        
+        async with self._get_session_lock():
+            if self._session is not None and self._session_expired():
+                await self._release_session()
+            if self._session is None:
+                self._session = await self.async_client.create_session()
+                self._session_opened_at = time.monotonic()
+                _LIVE_SESSIONS[self._session.id] = self.config
+            return self._session
+    
+    def _get_session_lock(self) -> asyncio.Lock:
+        """Return the session lock for the running loop.
+        
+        On Python < 3.10 a lock binds to the loop current when it is created,
+        so a new one is made whenever the tool is used from another loop.
+        """
+        loop = _running_loop()
+        if self._session_lock is None or self._session_lock_loop is not loop:
+            self._session_lock = asyncio.Lock()
+            self._session_lock_loop = loop
+        return self._session_lock
+    
+    def _session_expired(self) -> bool:
+        """Check whether the shared session has outlived the session timeout."""
+        return time.monotonic() - self._session_opened_at > self.config.session_timeout
+    
+    async def _release_session(self) -> None:
+        """Release the shared session, if any."""
+        session, self._session = self._session, None
+        if session is not None:
+            _LIVE_SESSIONS.pop(session.id, None)
+            await self.async_client.release_session(session.id)
+    
+    async def aclose(self) -> None:
+        """Release the shared browser session and close the async client this tool created."""
+        self._session_held = False
+        if self._session is not None:
+            async with self._get_session_lock():
+                await self._release_session()
+        
+        if self._owns_async_client and self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            self._owns_async_client = False
+            self._async_client_loop = None
+            await client.close()
+    
+    async def __aenter__(self) -> "BaseSteelTool":
+        """Share one browser session across async calls until the block exits."""
+        self._session_held = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the shared browser session and the tool's async client."""
+        await self.aclose()
     
     def cleanup(self) -> None:
         """Cleanup tool resources."""
         try:
-            if self._client:
-                self._client.cleanup_sessions()
-            if self._async_client:
+            # Only touch clients this tool has actually created
+            client = self.__dict__.get("client")
+            if client:
+                client.cleanup_sessions()
+            if self._async_client is not None:
                 # Note: This would need to be called from an async context
-                # asyncio.create_task(self._async_client.cleanup_sessions())
+                # asyncio.create_task(self.async_client.cleanup_sessions())
                 pass
         except Exception as e:
             logger.warning(f"Error during tool cleanup: {e}")
-    
-    def __del__(self) -> None:
-        """Destructor to ensure cleanup."""
-        try:
-            self.cleanup()
-        except Exception:
-            pass  # Ignore errors during cleanup in destructor
 
 
 class SteelToolInput(BaseModel):
@@ -216,23 +373,26 @@ class SteelToolMixin:
             **kwargs: Additional parameters
         """
         super().__init__(**kwargs)
-        self.steel_config = config or SteelConfig.from_env()
-        self._steel_client: Optional[SteelClient] = None
+        self.steel_config = config or get_default_config()
         self._steel_async_client: Optional[AsyncSteelClient] = None
     
-    @property
+    @cached_property
     def steel_client(self) -> SteelClient:
-        """Get or create Steel client."""
-        if self._steel_client is None:
-            self._steel_client = SteelClient(self.steel_config)
-        return self._steel_client
+        """Shared Steel client for this config."""
+        return _pooled_client(self.steel_config)
     
     @property
     def steel_async_client(self) -> AsyncSteelClient:
-        """Get or create async Steel client."""
+        """Get or create async Steel client; close it with ``steel_aclose()``."""
         if self._steel_async_client is None:
             self._steel_async_client = AsyncSteelClient(self.steel_config)
         return self._steel_async_client
+    
+    async def steel_aclose(self) -> None:
+        """Close the async Steel client, if one was created."""
+        client, self._steel_async_client = self._steel_async_client, None
+        if client is not None:
+            await client.close()
 
 
 def create_steel_tool(
@@ -256,11 +416,13 @@ def create_steel_tool(
     Returns:
         Steel tool class
     """
+    # Class bodies cannot read enclosing names they also assign
+    tool_name, tool_description = name, description
     
     class DynamicSteelTool(BaseSteelTool):
-        name = name
-        description = description
-        args_schema = input_schema
+        name: str = tool_name
+        description: str = tool_description
+        args_schema: Type[BaseModel] = input_schema
         
         def _run(
             self,
@@ -290,9 +452,9 @@ def create_steel_tool(
                     return await async_func(self.async_client, steel_params, run_manager)
                 else:
                     # Fallback to sync function in thread pool
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     return await loop.run_in_executor(
-                        None, lambda: sync_func(self.client, steel_params, run_manager)
+                        None, sync_func, self.client, steel_params, run_manager
                     )
             
             except Exception as e:
@@ -1,17 +1,49 @@
 """Steel scrape tool for single-page content extraction."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional, Type
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from langchain_core.callbacks import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
 from langchain_steel.tools.base import BaseSteelTool
 from langchain_steel.utils.config import OutputFormat
-from langchain_steel.utils.errors import SteelContentError
+from langchain_steel.utils.errors import SteelConfigError, SteelContentError
 
 logger = logging.getLogger(__name__)
 
+# Output format values accepted by the scrape tool
+_VALID_FORMATS = frozenset(f.value for f in OutputFormat)
+
+# Content attributes of the SDK's ScrapeResponse.content, in fallback order
+_SDK_CONTENT_FORMATS = ("markdown", "readability", "cleaned_html", "html")
+
+# Content keys probed in legacy dict responses, in fallback order
+_CONTENT_KEYS = ("content", "data", "body", "text", "html", "markdown")
+
+
+def _format_first(keys: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Map each key to the fallback order with that key moved to the front."""
+    return {key: (key,) + tuple(k for k in keys if k != key) for key in keys}
+
+
+# Probe order per requested format, so typical responses hit on the first lookup
+_SDK_FORMAT_ORDER = _format_first(_SDK_CONTENT_FORMATS)
+_CONTENT_KEY_ORDER = _format_first(_CONTENT_KEYS)
+
+# Scalar response fields shown in the metadata summary, with their templates
+_SUMMARY_FIELDS = (
+    ("title", "Title: {}"),
+    ("final_url", "Final URL: {}"),
+    ("status_code", "Status Code: {}"),
+    ("load_time", "Load Time: {}ms"),
+)
+
+# Number of images/links listed individually in the metadata summary
+_SUMMARY_PREVIEW = 3
+
 
 class SteelScrapeInput(BaseModel):
     """Input schema for Steel scrape tool."""
@@ -129,31 +161,13 @@ class SteelScrapeTool(BaseSteelTool):
             })
             
             # Validate format
-            if format and format.lower() not in [f.value for f in OutputFormat]:
+            if format and format.lower() not in _VALID_FORMATS:
                 return f"Invalid format '{format}'. Supported formats: html, markdown, text, pdf"
             
-            # Prepare scraping parameters
-            scrape_params = {
-                "format": format or "markdown",
-            }
-            
-            if wait_for_selector:
-                scrape_params["wait_for_selector"] = wait_for_selector
-            
-            if delay_ms is not None:
-                scrape_params["delay"] = delay_ms
-            
-            if screenshot:
-                scrape_params["screenshot"] = True
-            
-            if extract_images:
-                scrape_params["extract_images"] = True
-            
-            if extract_links:
-                scrape_params["extract_links"] = True
-            
-            if custom_headers:
-                scrape_params["headers"] = custom_headers
+            scrape_params = self._build_scrape_params(
+                format, wait_for_selector, delay_ms, screenshot,
+                extract_images, extract_links, custom_headers,
+            )
             
             # Execute scraping
             if run_manager:
@@ -192,6 +206,7 @@ class SteelScrapeTool(BaseSteelTool):
         extract_links: bool = False,
         custom_headers: Optional[Dict[str, str]] = None,
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+        session: Optional[Any] = None,
     ) -> str:
         """Async scrape content from a web page.
         
@@ -205,6 +220,9 @@ class SteelScrapeTool(BaseSteelTool):
             extract_links: Whether to extract link information
             custom_headers: Custom HTTP headers
             run_manager: Async callback manager for tool execution
+            session: Existing Steel session to scrape in; defaults to the
+                tool's shared session inside ``async with tool:``, or a
+                per-call session otherwise
             
         Returns:
             Scraped content as string, or error message if scraping fails
@@ -217,44 +235,34 @@ class SteelScrapeTool(BaseSteelTool):
             })
             
             # Validate format
-            if format and format.lower() not in [f.value for f in OutputFormat]:
+            if format and format.lower() not in _VALID_FORMATS:
                 return f"Invalid format '{format}'. Supported formats: html, markdown, text, pdf"
             
-            # Prepare scraping parameters
-            scrape_params = {
-                "format": format or "markdown",
-            }
-            
-            if wait_for_selector:
-                scrape_params["wait_for_selector"] = wait_for_selector
-            
-            if delay_ms is not None:
-                scrape_params["delay"] = delay_ms
-            
-            if screenshot:
-                scrape_params["screenshot"] = True
-            
-            if extract_images:
-                scrape_params["extract_images"] = True
-            
-            if extract_links:
-                scrape_params["extract_links"] = True
-            
-            if custom_headers:
-                scrape_params["headers"] = custom_headers
+            scrape_params = self._build_scrape_params(
+                format, wait_for_selector, delay_ms, screenshot,
+                extract_images, extract_links, custom_headers,
+            )
             
             # Execute async scraping
             if run_manager:
                 await run_manager.on_text(f"Scraping content from: {url}\n")
             
-            # Use session context for efficient async scraping
-            async with self.async_client.session_context() as session:
-                # Note: Adjust based on actual Steel SDK async API
+            if session is None and self.session_reuse and self._session_held:
+                session = await self.ensure_session()
+            
+            if session is not None:
                 response = await self.async_client.scrape(
-                    url=url, 
-                    session=session,
-                    **scrape_params
+                    url=url, session=session, **scrape_params
                 )
+            else:
+                # Use session context for efficient async scraping
+                async with self.async_client.session_context() as session:
+                    # Note: Adjust based on actual Steel SDK async API
+                    response = await self.async_client.scrape(
+                        url=url, 
+                        session=session,
+                        **scrape_params
+                    )
             
             # Extract content from response
             content = self._extract_content_from_response(response, url, format)
@@ -276,6 +284,75 @@ class SteelScrapeTool(BaseSteelTool):
                 await run_manager.on_text(f"Error: {error_msg}\n")
             return f"Error scraping {url}: {error_msg}"
     
+    async def abatch(
+        self,
+        urls: List[str],
+        *,
+        concurrency: int = 32,
+        **kwargs: Any,
+    ) -> List[Union[str, BaseException]]:
+        """Scrape several URLs concurrently within one Steel session.
+        
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of scrapes in flight at once
+            **kwargs: Scrape options passed to ``_arun`` for every URL
+            
+        Returns:
+            One result per URL, in input order. Scrape failures are returned
+            as error strings, as with ``_arun``; anything else raised is
+            returned as the exception.
+        """
+        if concurrency < 1:
+            raise SteelConfigError(
+                f"concurrency must be at least 1, got {concurrency}",
+                config_field="concurrency",
+            )
+        if not urls:
+            return []
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with self.async_client.session_context() as session:
+            async def _one(url: str) -> str:
+                async with semaphore:
+                    return await self._arun(url=url, session=session, **kwargs)
+            
+            return await asyncio.gather(
+                *(_one(url) for url in urls), return_exceptions=True
+            )
+    
+    @classmethod
+    def _build_scrape_params(
+        cls,
+        format: Optional[str],
+        wait_for_selector: Optional[str],
+        delay_ms: Optional[int],
+        screenshot: bool,
+        extract_images: bool,
+        extract_links: bool,
+        custom_headers: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """Build Steel scrape parameters, leaving out options that are unset.
+        
+        Returns:
+            Dictionary of scraping parameters
+        """
+        params = {"format": format or "markdown"}
+        params.update(
+            (key, value)
+            for key, value, enabled in (
+                ("wait_for_selector", wait_for_selector, bool(wait_for_selector)),
+                ("delay", delay_ms, delay_ms is not None),
+                ("screenshot", True, screenshot),
+                ("extract_images", True, extract_images),
+                ("extract_links", True, extract_links),
+                ("headers", custom_headers, bool(custom_headers)),
+            )
+            if enabled
+        )
+        return params
+    
     def _extract_content_from_response(self, response: Any, url: str, format: str) -> str:
         """Extract content from Steel API response.
         
@@ -295,46 +372,29 @@ class SteelScrapeTool(BaseSteelTool):
             if hasattr(response, 'content'):
                 content_obj = response.content
                 
-                # Extract based on requested format
-                if format == "markdown" and hasattr(content_obj, 'markdown') and content_obj.markdown:
-                    return content_obj.markdown.strip()
-                elif format == "html" and hasattr(content_obj, 'html') and content_obj.html:
-                    return content_obj.html.strip()
-                elif format == "readability" and hasattr(content_obj, 'readability') and content_obj.readability:
-                    return content_obj.readability.strip()
-                elif format == "cleaned_html" and hasattr(content_obj, 'cleaned_html') and content_obj.cleaned_html:
-                    return content_obj.cleaned_html.strip()
-                
-                # Fallback to any available content
-                if hasattr(content_obj, 'markdown') and content_obj.markdown:
-                    return content_obj.markdown.strip()
-                elif hasattr(content_obj, 'readability') and content_obj.readability:
-                    return content_obj.readability.strip()
-                elif hasattr(content_obj, 'cleaned_html') and content_obj.cleaned_html:
-                    return content_obj.cleaned_html.strip()
-                elif hasattr(content_obj, 'html') and content_obj.html:
-                    return content_obj.html.strip()
-            
-            # Legacy dict-based response handling
-            elif isinstance(response, dict):
-                # Try different content keys based on format
-                content_keys = ["content", "data", "body", "text", "html", "markdown"]
+                # Requested format first, then any available content
+                for attr in _SDK_FORMAT_ORDER.get(format, _SDK_CONTENT_FORMATS):
+                    content = getattr(content_obj, attr, None)
+                    if content:
+                        return content.strip()
+            
+            # Legacy dict-based response handling; dicts are the common case,
+            # so look up .get directly and only type-check on failure
+            else:
+                try:
+                    get = response.get
+                except AttributeError:
+                    return response.strip() if isinstance(response, str) else str(response)
                 
-                for key in content_keys:
-                    if key in response and response[key]:
-                        content = response[key]
-                        if isinstance(content, str):
-                            return content.strip()
+                # Try different content keys, starting with the requested format
+                for key in _CONTENT_KEY_ORDER.get(format, _CONTENT_KEYS):
+                    content = get(key)
+                    if content and type(content) is str:
+                        return content.strip()
                 
                 # If no standard content key found, try to serialize
                 if response:
                     return str(response)
-            
-            elif isinstance(response, str):
-                return response.strip()
-            
-            else:
-                return str(response)
         
         except Exception as e:
             raise SteelContentError(
@@ -364,54 +424,47 @@ class SteelScrapeTool(BaseSteelTool):
         
         metadata_parts = []
         
-        # Title and basic info
-        if "title" in response:
-            metadata_parts.append(f"Title: {response['title']}")
-        
-        if "final_url" in response and response["final_url"]:
-            metadata_parts.append(f"Final URL: {response['final_url']}")
-        
-        if "status_code" in response:
-            metadata_parts.append(f"Status Code: {response['status_code']}")
-        
-        # Performance info
-        if "load_time" in response:
-            metadata_parts.append(f"Load Time: {response['load_time']}ms")
+        # Title, basic and performance info
+        for key, template in _SUMMARY_FIELDS:
+            value = response.get(key)
+            if value is not None and value != "":
+                metadata_parts.append(template.format(value))
         
         # Images
-        if "images" in response and response["images"]:
-            images = response["images"]
-            if isinstance(images, list):
-                metadata_parts.append(f"Images Found: {len(images)}")
-                # Show first few image URLs
-                for i, img in enumerate(images[:3]):
-                    if isinstance(img, dict) and "src" in img:
-                        metadata_parts.append(f"  Image {i+1}: {img['src']}")
-                    elif isinstance(img, str):
-                        metadata_parts.append(f"  Image {i+1}: {img}")
-                
-                if len(images) > 3:
-                    metadata_parts.append(f"  ... and {len(images) - 3} more images")
+        images = response.get("images")
+        if images and isinstance(images, list):
+            count = len(images)
+            metadata_parts.append(f"Images Found: {count}")
+            # Show first few image URLs
+            for i, img in enumerate(islice(images, _SUMMARY_PREVIEW), 1):
+                if isinstance(img, dict) and "src" in img:
+                    metadata_parts.append(f"  Image {i}: {img['src']}")
+                elif isinstance(img, str):
+                    metadata_parts.append(f"  Image {i}: {img}")
+            
+            if count > _SUMMARY_PREVIEW:
+                metadata_parts.append(f"  ... and {count - _SUMMARY_PREVIEW} more images")
         
         # Links
-        if "links" in response and response["links"]:
-            links = response["links"]
-            if isinstance(links, list):
-                metadata_parts.append(f"Links Found: {len(links)}")
-                # Show first few links
-                for i, link in enumerate(links[:3]):
-                    if isinstance(link, dict):
-                        href = link.get("href", "")
-                        text = link.get("text", "")
-                        metadata_parts.append(f"  Link {i+1}: {text} -> {href}")
-                    elif isinstance(link, str):
-                        metadata_parts.append(f"  Link {i+1}: {link}")
-                
-                if len(links) > 3:
-                    metadata_parts.append(f"  ... and {len(links) - 3} more links")
+        links = response.get("links")
+        if links and isinstance(links, list):
+            count = len(links)
+            metadata_parts.append(f"Links Found: {count}")
+            # Show first few links
+            for i, link in enumerate(islice(links, _SUMMARY_PREVIEW), 1):
+                if isinstance(link, dict):
+                    href = link.get("href", "")
+                    text = link.get("text", "")
+                    metadata_parts.append(f"  Link {i}: {text} -> {href}")
+                elif isinstance(link, str):
+                    metadata_parts.append(f"  Link {i}: {link}")
+            
+            if count > _SUMMARY_PREVIEW:
+                metadata_parts.append(f"  ... and {count - _SUMMARY_PREVIEW} more links")
         
         # Screenshot
-        if "screenshot" in response and response["screenshot"]:
-            metadata_parts.append(f"Screenshot: {response['screenshot']}")
+        screenshot = response.get("screenshot")
+        if screenshot:
+            metadata_parts.append(f"Screenshot: {screenshot}")
         
         return "\n".join(metadata_parts) if metadata_parts else ""
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Steel utilities for LangChain integration."""
 
-from langchain_steel.utils.config import SteelConfig
+from langchain_steel.utils.config import SteelConfig, get_default_config
 from langchain_steel.utils.client import SteelClient
 from langchain_steel.utils.errors import (
     SteelError,
@@ -13,6 +13,7 @@ from langchain_steel.utils.retry import SteelRetry
 
 __all__ = [
     "SteelConfig",
+    "get_default_config",
     "SteelClient",
     "SteelError",
     "SteelAPIError", 
@@ -6,8 +6,10 @@ import time
 from typing import Any, Dict, List, Optional, Union
 from contextlib import asynccontextmanager, contextmanager
 
+import httpx
+
 try:
-    from steel import Steel, AsyncSteel
+    from steel import Steel, AsyncSteel, DefaultHttpxClient, DefaultAsyncHttpxClient
     from steel.types import Session
 except ImportError as e:
     raise ImportError(
@@ -28,6 +30,22 @@ from langchain_steel.utils.retry import retry_on_steel_error, async_retry_on_ste
 logger = logging.getLogger(__name__)
 
 
+def _http_client_options(config: SteelConfig) -> Dict[str, Any]:
+    """Build httpx client options from the connection pool settings in config.
+    
+    The pool is shared by every request a client makes, so batch scrapes
+    reuse TCP/TLS connections to the Steel API instead of reconnecting.
+    """
+    return {
+        "limits": httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=30.0,
+        ),
+        "timeout": httpx.Timeout(config.http_timeout),
+    }
+
+
 class SteelSessionManager:
     """Manages Steel browser sessions with pooling and reuse capabilities."""
     
@@ -147,8 +165,15 @@ class SteelClient:
         
         # Initialize Steel SDK clients
         try:
-            self._client = Steel(steel_api_key=self.config.api_key)
-            self._async_client = AsyncSteel(steel_api_key=self.config.api_key)
+            http_options = _http_client_options(self.config)
+            self._client = Steel(
+                steel_api_key=self.config.api_key,
+                http_client=DefaultHttpxClient(**http_options),
+            )
+            self._async_client = AsyncSteel(
+                steel_api_key=self.config.api_key,
+                http_client=DefaultAsyncHttpxClient(**http_options),
+            )
         except Exception as e:
             raise SteelAuthenticationError(
                 "Failed to initialize Steel client. Check API key.",
@@ -183,7 +208,7 @@ class SteelClient:
         if reuse_existing:
             existing_session = self.session_manager.get_available_session()
             if existing_session:
-                logger.info(f"Reusing existing session: {existing_session.id}")
+                logger.info("Reusing existing session: %s", existing_session.id)
                 return existing_session
         
         # Create new session
@@ -198,7 +223,7 @@ class SteelClient:
             # Add to session pool if reusable
             self.session_manager.add_session(session, reusable=reuse_existing)
             
-            logger.info(f"Created Steel session: {session.id}")
+            logger.info("Created Steel session: %s", session.id)
             return session
             
         except Exception as e:
@@ -222,7 +247,7 @@ class SteelClient:
         try:
             self._client.sessions.release(session_id)
             self.session_manager.remove_session(session_id)
-            logger.info(f"Released Steel session: {session_id}")
+            logger.info("Released Steel session: %s", session_id)
             
         except Exception as e:
             logger.warning(f"Failed to release session {session_id}: {str(e)}")
@@ -270,13 +295,13 @@ class SteelClient:
                 **scrape_options
             }
             
-            logger.info(f"Scraping URL: {url} (format: {format}) with session: {session.id}")
+            logger.info("Scraping URL: %s (format: %s) with session: %s", url, format, session.id)
             
             # Perform scraping through Steel SDK
             # The session is managed separately from the scrape parameters
             result = self._client.scrape(**scrape_params)
             
-            logger.info(f"Successfully scraped {url}")
+            logger.info("Successfully scraped %s", url)
             return result
             
         except Exception as e:
@@ -310,7 +335,7 @@ class SteelClient:
         """Cleanup expired sessions."""
         expired = self.session_manager.cleanup_expired_sessions()
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+            logger.info("Cleaned up %d expired sessions", len(expired))
         
         # Release expired sessions from Steel API
         for session_id in expired:
@@ -352,7 +377,10 @@ class AsyncSteelClient:
         
         # Initialize Steel SDK async client
         try:
-            self._client = AsyncSteel(steel_api_key=self.config.api_key)
+            self._client = AsyncSteel(
+                steel_api_key=self.config.api_key,
+                http_client=DefaultAsyncHttpxClient(**_http_client_options(self.config)),
+            )
         except Exception as e:
             raise SteelAuthenticationError(
                 "Failed to initialize async Steel client. Check API key.",
@@ -381,7 +409,7 @@ class AsyncSteelClient:
             async with self.session_manager._session_lock:
                 existing_session = self.session_manager.get_available_session()
                 if existing_session:
-                    logger.info(f"Reusing existing session: {existing_session.id}")
+                    logger.info("Reusing existing session: %s", existing_session.id)
                     return existing_session
         
         # Create new session
@@ -396,7 +424,7 @@ class AsyncSteelClient:
             async with self.session_manager._session_lock:
                 self.session_manager.add_session(session, reusable=reuse_existing)
             
-            logger.info(f"Created Steel session (async): {session.id}")
+            logger.info("Created Steel session (async): %s", session.id)
             return session
             
         except Exception as e:
@@ -420,13 +448,68 @@ class AsyncSteelClient:
             await self._client.sessions.release(session_id)
             async with self.session_manager._session_lock:
                 self.session_manager.remove_session(session_id)
-            logger.info(f"Released Steel session (async): {session_id}")
+            logger.info("Released Steel session (async): %s", session_id)
             
         except Exception as e:
             logger.warning(f"Failed to release session {session_id}: {str(e)}")
             async with self.session_manager._session_lock:
                 self.session_manager.remove_session(session_id)
     
+    async def scrape(
+        self,
+        url: str,
+        session: Optional[Session] = None,
+        format: Optional[str] = None,
+        **scrape_options: Any
+    ) -> Dict[str, Any]:
+        """Scrape content from URL using Steel asynchronously.
+        
+        Args:
+            url: URL to scrape
+            session: Optional existing session to use
+            format: Output format (html, markdown, text, pdf)
+            **scrape_options: Additional scraping options
+            
+        Returns:
+            Scraped content data
+            
+        Raises:
+            SteelAPIError: If scraping fails
+        """
+        if session is None:
+            session = await self.create_session()
+            session_created = True
+        else:
+            session_created = False
+        
+        try:
+            if format is None:
+                format = self.config.default_format.value
+            
+            scrape_params = {
+                "url": url,
+                "format": [format] if isinstance(format, str) else format,  # Steel expects array
+                **scrape_options
+            }
+            
+            logger.info("Scraping URL (async): %s (format: %s) with session: %s", url, format, session.id)
+            
+            result = await self._client.scrape(**scrape_params)
+            
+            logger.info("Successfully scraped %s (async)", url)
+            return result
+            
+        except Exception as e:
+            if hasattr(e, "response"):
+                raise handle_steel_api_error(e.response)
+            else:
+                raise SteelError(f"Failed to scrape {url}: {str(e)}", original_error=e)
+        
+        finally:
+            if session_created:
+                async with self.session_manager._session_lock:
+                    self.session_manager.release_session(session.id)
+    
     @asynccontextmanager
     async def session_context(self, **session_options: Any):
         """Async context manager for session lifecycle.
@@ -443,13 +526,17 @@ class AsyncSteelClient:
         finally:
             await self.release_session(session.id)
     
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.close()
+    
     async def cleanup_sessions(self) -> None:
         """Cleanup expired sessions asynchronously."""
         async with self.session_manager._session_lock:
             expired = self.session_manager.cleanup_expired_sessions()
         
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions (async)")
+            logger.info("Cleaned up %d expired sessions (async)", len(expired))
         
         # Release expired sessions from Steel API
         for session_id in expired:
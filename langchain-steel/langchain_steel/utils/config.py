@@ -1,8 +1,10 @@
 """Configuration management for Steel LangChain integration."""
 
+import json
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 
 from langchain_steel.utils.errors import SteelConfigError
@@ -50,6 +52,9 @@ class SteelConfig:
         proxy_config: Proxy-specific configuration
         user_agent: Custom user agent string
         enable_logging: Whether to enable detailed logging
+        max_connections: Maximum concurrent HTTP connections to the Steel API
+        max_keepalive_connections: Maximum idle connections kept open for reuse
+        http_timeout: HTTP request timeout for Steel API calls in seconds
     """
     
     # Authentication
@@ -77,6 +82,11 @@ class SteelConfig:
     user_agent: Optional[str] = None
     enable_logging: bool = False
     
+    # HTTP connection pool
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    http_timeout: float = 120.0
+    
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         self._validate_config()
@@ -107,6 +117,15 @@ class SteelConfig:
         
         if self.retry_delay < 0:
             raise SteelConfigError("Retry delay cannot be negative.")
+        
+        if self.max_connections <= 0:
+            raise SteelConfigError("Max connections must be positive.")
+        
+        if self.max_keepalive_connections < 0:
+            raise SteelConfigError("Max keepalive connections cannot be negative.")
+        
+        if self.http_timeout <= 0:
+            raise SteelConfigError("HTTP timeout must be positive.")
     
     def validate_browser_agent_config(self) -> None:
         """Validate configuration specifically for browser agent usage."""
@@ -178,6 +197,14 @@ class SteelConfig:
         
         return cls(**env_config)
     
+    def cache_key(self) -> str:
+        """Return a key that is equal for configurations with identical settings.
+        
+        SteelConfig is mutable and therefore unhashable; this key lets
+        clients be shared between objects holding equivalent configs.
+        """
+        return json.dumps(asdict(self), sort_keys=True, default=str)
+    
     def to_session_options(self) -> Dict[str, Any]:
         """Convert configuration to Steel SDK session options.
         
@@ -232,4 +259,37 @@ class SteelConfig:
         # Apply changes
         current_values.update(changes)
         
-        return SteelConfig(**current_values)
\ No newline at end of file
+        return SteelConfig(**current_values)
+
+
+# Environment variables read by SteelConfig.from_env()
+_CONFIG_ENV_VARS = (
+    "STEEL_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "STEEL_BASE_URL",
+    "STEEL_USE_PROXY",
+    "STEEL_SOLVE_CAPTCHA",
+    "STEEL_STEALTH_MODE",
+    "STEEL_SESSION_TIMEOUT",
+    "STEEL_API_TIMEOUT",
+    "STEEL_MAX_RETRIES",
+    "STEEL_RETRY_DELAY",
+)
+
+
+@lru_cache(maxsize=1)
+def _config_for_env(env: tuple) -> SteelConfig:
+    return SteelConfig.from_env()
+
+
+def get_default_config() -> SteelConfig:
+    """Get the shared configuration built from environment variables.
+    
+    Callers get the same instance until one of the Steel environment
+    variables changes, so treat it as read-only; use ``copy()`` to
+    customise it.
+    
+    Returns:
+        Shared SteelConfig instance
+    """
+    return _config_for_env(tuple(os.environ.get(name) for name in _CONFIG_ENV_VARS))
\ No newline at end of file
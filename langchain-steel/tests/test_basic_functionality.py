@@ -76,7 +76,7 @@ class TestSteelScrapeTool:
             mock_client_class.return_value = mock_client
             
             tool = SteelScrapeTool(config=mock_config)
-            tool._client = mock_client
+            tool.client = mock_client
             return tool
     
     def test_tool_initialization(self, mock_config):
@@ -113,7 +113,7 @@ class TestSteelScrapeTool:
     def test_format_validation(self, scrape_tool):
         """Test output format validation."""
         # Mock the client scrape method
-        scrape_tool._client.scrape.return_value = {"content": "test content"}
+        scrape_tool.client.scrape.return_value = {"content": "test content"}
         
         # Valid format should work
         result = scrape_tool._run("https://example.com", format="markdown")
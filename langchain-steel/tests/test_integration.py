@@ -107,8 +107,8 @@ class TestWorkflowIntegration:
                 browser_agent = SteelBrowserAgent()
                 
                 # Mock successful responses
-                scrape_tool._client = mock_client
-                browser_agent._client = mock_client
+                scrape_tool.client = mock_client
+                browser_agent.client = mock_client
                 
                 mock_client.scrape.return_value = {"content": "Mock scraped content"}
                 mock_client.browser_task.return_value = {"result": "Mock browser result"}
@@ -7,7 +7,11 @@ import asyncio
 import time
 import sys
 import os
-from unittest.mock import Mock, patch, MagicMock
+import json
+import tempfile
+import weakref
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 # Add the parent directory to sys.path so we can import langchain_steel
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -15,7 +19,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from langchain_steel.agents.claude_computer_use import (
     ActionBatcher, 
     NavigationOptimizer, 
-    _handle_rate_limit_error
+    AsyncSteelBrowserSession,
+    SteelBrowserSession,
+    SteelSessionPool,
+    _PooledSession,
+    _encode_screenshot,
+    _prune_old_screenshots,
+    _handle_rate_limit_error,
+    _rate_limit_headroom_delay,
+    _request_interval,
+    _shared_sync_playwright,
+    _sync_playwright_local
 )
 
 
@@ -140,27 +154,589 @@ class TestNavigationOptimizer(unittest.TestCase):
 class TestRateLimitHandling(unittest.TestCase):
     """Test rate limit error handling improvements."""
     
-    def test_exponential_backoff_delays(self):
-        """Test that exponential backoff uses optimized delays."""
-        expected_ranges = [
-            (0.5, 1.0),   # Attempt 0
-            (1.0, 1.5),   # Attempt 1
-            (2.0, 2.5),   # Attempt 2
-            (4.0, 4.5),   # Attempt 3
-            (8.0, 8.5),   # Attempt 4
-        ]
-        
-        for attempt, (min_delay, max_delay) in enumerate(expected_ranges):
+    def _error(self, headers=None):
+        error = Mock()
+        error.response.headers = headers or {}
+        return error
+    
+    def test_decorrelated_jitter_delays(self):
+        """Test that backoff delays stay within the decorrelated jitter bounds."""
+        prev_delay = 1.0
+        for attempt in range(8):
             with self.subTest(attempt=attempt):
-                delay = _handle_rate_limit_error(attempt)
-                self.assertIsNotNone(delay)
-                self.assertGreaterEqual(delay, min_delay)
-                self.assertLessEqual(delay, max_delay)
+                delay, next_prev = _handle_rate_limit_error(self._error(), attempt, prev_delay)
+                self.assertGreaterEqual(delay, 1.0)
+                self.assertLessEqual(delay, min(60.0, prev_delay * 3))
+                self.assertEqual(delay, next_prev)
+                prev_delay = next_prev
+    
+    def test_retry_after_header_respected(self):
+        """Test that a retry-after header overrides the computed delay."""
+        delay, prev_delay = _handle_rate_limit_error(
+            self._error({"retry-after": "7"}), 0, 2.0
+        )
+        self.assertEqual(delay, 7.0)
+        self.assertEqual(prev_delay, 2.0)
+        
+        # Only the jitter is capped; a longer server-requested wait is kept
+        delay, _ = _handle_rate_limit_error(self._error({"retry-after": "120"}), 0)
+        self.assertEqual(delay, 120.0)
+    
+    def test_errors_without_response(self):
+        """Test that errors without a response (timeouts) still back off."""
+        delay, _ = _handle_rate_limit_error(Exception("timeout"), 0)
+        self.assertGreaterEqual(delay, 1.0)
     
     def test_max_retries_exceeded(self):
         """Test that None is returned when max retries are exceeded."""
-        delay = _handle_rate_limit_error(10, max_retries=10)
+        delay = _handle_rate_limit_error(self._error(), 10, max_retries=10)
         self.assertIsNone(delay)
+    
+    def test_headroom_delay(self):
+        """Test proactive pausing when few requests remain."""
+        reset = (datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat()
+        low = {
+            "anthropic-ratelimit-requests-remaining": "1",
+            "anthropic-ratelimit-requests-reset": reset,
+        }
+        plenty = dict(low, **{"anthropic-ratelimit-requests-remaining": "50"})
+        
+        self.assertGreater(_rate_limit_headroom_delay(low), 3.0)
+        self.assertEqual(_rate_limit_headroom_delay(plenty), 0.0)
+        self.assertEqual(_rate_limit_headroom_delay({}), 0.0)
+    
+    def test_request_interval_shrinks_with_headroom(self):
+        """Test that the inter-request interval scales with the used request budget."""
+        def headers(remaining):
+            return {
+                "anthropic-ratelimit-requests-remaining": str(remaining),
+                "anthropic-ratelimit-requests-limit": "50",
+            }
+        
+        self.assertEqual(_request_interval(headers(50)), 0.0)
+        self.assertAlmostEqual(_request_interval(headers(10)), 0.8)
+        self.assertEqual(_request_interval({}), 1.0)
+
+
+class TestScreenshotEncoding(unittest.TestCase):
+    """Test screenshot encoding options."""
+    
+    def test_jpeg_is_default(self):
+        """Test that screenshots default to JPEG at controlled quality."""
+        session = SteelBrowserSession(steel_client=Mock(), width=800, height=600)
+        
+        options = session._playwright_screenshot_options()
+        self.assertEqual(options["type"], "jpeg")
+        self.assertEqual(options["quality"], 75)
+        self.assertEqual(options["clip"], {"x": 0, "y": 0, "width": 800, "height": 600})
+        self.assertEqual(session._cdp_screenshot_params()["format"], "jpeg")
+        self.assertTrue(session._cdp_screenshot_params()["optimizeForSpeed"])
+        self.assertFalse(session._cdp_screenshot_params()["captureBeyondViewport"])
+        self.assertEqual(session.screenshot_media_type, "image/jpeg")
+    
+    def test_png_omits_quality(self):
+        """Test that PNG screenshots do not pass a quality setting."""
+        session = SteelBrowserSession(steel_client=Mock(), screenshot_format="png")
+        
+        self.assertNotIn("quality", session._playwright_screenshot_options())
+        self.assertNotIn("quality", session._cdp_screenshot_params())
+        self.assertEqual(session.screenshot_media_type, "image/png")
+    
+    def test_screenshot_uses_cached_cdp_session(self):
+        """Test that CDP base64 data is returned as-is and the session is reused."""
+        session = SteelBrowserSession(steel_client=Mock())
+        session._page = Mock()
+        session._page.is_closed.return_value = False
+        cdp = session._page.context.new_cdp_session.return_value
+        cdp.send.return_value = {"data": "abc123"}
+        
+        self.assertEqual(session.screenshot(), "abc123")
+        self.assertEqual(session.screenshot(), "abc123")
+        
+        session._page.context.new_cdp_session.assert_called_once_with(session._page)
+        session._page.screenshot.assert_not_called()
+    
+    def test_screenshot_reused_until_page_touched(self):
+        """Test that passive actions reuse the last screenshot and clicks do not."""
+        session = SteelBrowserSession(steel_client=Mock())
+        session._page = Mock()
+        session._page.is_closed.return_value = False
+        cdp = session._page.context.new_cdp_session.return_value
+        cdp.send.return_value = {"data": "abc123"}
+        
+        def capture_count():
+            return sum(1 for c in cdp.send.call_args_list if c.args[0] == "Page.captureScreenshot")
+        
+        session.execute_computer_action("screenshot")
+        session.execute_computer_action("cursor_position")
+        self.assertEqual(capture_count(), 1)
+        
+        session.execute_computer_action("left_click", coordinate=[5, 5])
+        self.assertEqual(capture_count(), 2)
+    
+    def test_fallback_bytes_encoded_as_base64(self):
+        """Test that raw fallback screenshot bytes encode to standard base64."""
+        self.assertEqual(_encode_screenshot(b"\xff\xd8\xff"), "/9j/")
+    
+    def test_invalid_format_rejected(self):
+        """Test that unsupported screenshot formats are rejected."""
+        with self.assertRaises(ValueError):
+            SteelBrowserSession(steel_client=Mock(), screenshot_format="gif")
+
+
+class TestKeyActions(unittest.TestCase):
+    """Test keyboard action translation."""
+    
+    def setUp(self):
+        self.session = SteelBrowserSession(steel_client=Mock())
+        self.session._page = Mock()
+        self.session._page.is_closed.return_value = False
+        self.session._page.context.new_cdp_session.return_value.send.return_value = {"data": ""}
+    
+    def test_modifier_combo_normalized(self):
+        """Test that modifier aliases map to Playwright key names."""
+        self.session.execute_computer_action("key", text="ctrl+Option+cmd+Return")
+        self.session._page.keyboard.press.assert_called_once_with("Control+Alt+Meta+Enter")
+    
+    def test_unknown_modifier_passed_through(self):
+        """Test that unrecognized modifiers are left untouched."""
+        self.session.execute_computer_action("key", text="Hyper+a")
+        self.session._page.keyboard.press.assert_called_once_with("Hyper+a")
+    
+    def test_type_chunks_with_configured_delay(self):
+        """Test that typing is chunked by group size using the configured delay."""
+        self.session.fast_type = False
+        self.session.typing_group_size = 4
+        self.session.typing_delay_ms = 0
+        self.session.execute_computer_action("type", text="abcdefghij")
+        
+        calls = self.session._page.keyboard.type.call_args_list
+        self.assertEqual([c.args[0] for c in calls], ["abcd", "efgh", "ij"])
+        self.assertTrue(all(c.kwargs["delay"] == 0 for c in calls))
+    
+    def test_fast_type_inserts_lines_and_presses_enter(self):
+        """Test that fast typing inserts each line via CDP and presses Enter between."""
+        cdp = self.session._page.context.new_cdp_session.return_value
+        self.session.execute_computer_action("type", text="hello world\nnext")
+        
+        insert_calls = [c for c in cdp.send.call_args_list if c.args[0] == "Input.insertText"]
+        self.assertEqual([c.args[1]["text"] for c in insert_calls], ["hello world", "next"])
+        self.session._page.keyboard.press.assert_called_once_with("Enter")
+        self.session._page.keyboard.type.assert_not_called()
+
+
+class TestActionDispatch(unittest.TestCase):
+    """Test table-driven action dispatch and argument validation."""
+    
+    def setUp(self):
+        self.session = SteelBrowserSession(steel_client=Mock())
+        self.session._page = Mock()
+        self.session._page.is_closed.return_value = False
+        self.session._page.context.new_cdp_session.return_value.send.return_value = {"data": ""}
+    
+    def test_invalid_action_rejected(self):
+        """Test that unknown actions raise before touching the page."""
+        with self.assertRaisesRegex(ValueError, "Invalid action: fly"):
+            self.session.execute_computer_action("fly")
+        self.session._page.mouse.click.assert_not_called()
+    
+    def test_argument_rules_enforced(self):
+        """Test that text/coordinate rules come from the action table."""
+        with self.assertRaisesRegex(ValueError, "text is not accepted for left_click"):
+            self.session.execute_computer_action("left_click", text="x")
+        with self.assertRaisesRegex(ValueError, "coordinate is required for mouse_move"):
+            self.session.execute_computer_action("mouse_move")
+        with self.assertRaisesRegex(ValueError, "coordinate is not accepted for type"):
+            self.session.execute_computer_action("type", text="x", coordinate=[1, 1])
+    
+    def test_click_dispatched_with_button(self):
+        """Test that click variants share one handler with the right button."""
+        self.session.execute_computer_action("right_click", coordinate=[10, 20])
+        self.session._page.mouse.click.assert_called_once_with(10, 20, button="right")
+    
+    def test_scroll_scales_direction_delta(self):
+        """Test that scroll amount multiplies the per-direction wheel delta."""
+        self.session.execute_computer_action("scroll", scroll_direction="left", scroll_amount=3)
+        self.session._page.mouse.wheel.assert_called_once_with(-300, 0)
+        with self.assertRaises(ValueError):
+            self.session.execute_computer_action("scroll", scroll_direction="sideways", scroll_amount=1)
+    
+    def test_short_hold_key_uses_cdp(self):
+        """Test that short holds dispatch CDP key events instead of keyboard calls."""
+        cdp = self.session._page.context.new_cdp_session.return_value
+        self.session.execute_computer_action("hold_key", text="shift", duration=0)
+        
+        key_calls = [c.args[1] for c in cdp.send.call_args_list if c.args[0] == "Input.dispatchKeyEvent"]
+        self.assertEqual(key_calls, [{"type": "keyDown", "key": "Shift"}, {"type": "keyUp", "key": "Shift"}])
+        self.session._page.keyboard.down.assert_not_called()
+    
+    def test_triple_click_single_cdp_event(self):
+        """Test that triple_click sends one press/release pair with clickCount=3."""
+        cdp = self.session._page.context.new_cdp_session.return_value
+        self.session.execute_computer_action("triple_click", coordinate=[30, 40])
+        
+        mouse_calls = [c.args[1] for c in cdp.send.call_args_list if c.args[0] == "Input.dispatchMouseEvent"]
+        self.assertEqual([c["type"] for c in mouse_calls], ["mousePressed", "mouseReleased"])
+        self.assertTrue(all(c["clickCount"] == 3 and (c["x"], c["y"]) == (30, 40) for c in mouse_calls))
+        self.session._page.mouse.click.assert_not_called()
+    
+    def test_coordinates_clamped_to_viewport(self):
+        """Test that out-of-bounds coordinates clamp to the last pixel."""
+        w, h = self.session.dimensions
+        self.assertEqual(self.session.clamp_coordinates(5, 7), (5, 7))
+        self.assertEqual(self.session.clamp_coordinates(w + 50, -3), (w - 1, 0))
+    
+    def test_coordinate_validation(self):
+        """Test that coordinates are unpacked, checked and clamped."""
+        w, h = self.session.dimensions
+        self.assertEqual(self.session.validate_and_get_coordinates([3, 4]), (3, 4))
+        self.assertEqual(self.session.validate_and_get_coordinates((w + 9, 4)), (w - 1, 4))
+        for bad in ([1, 2, 3], [1], "12", [-1, 2], [1.5, 2]):
+            with self.subTest(coordinate=bad):
+                with self.assertRaises(ValueError):
+                    self.session.validate_and_get_coordinates(bad)
+
+
+class TestPageStateCache(unittest.TestCase):
+    """Test caching of page closed/url reads."""
+    
+    def setUp(self):
+        self.session = SteelBrowserSession(steel_client=Mock())
+        self.session._page = Mock()
+        self.session._page.is_closed.return_value = False
+        self.session._page.url = "https://example.com/"
+    
+    def test_reads_reused_within_ttl(self):
+        """Test that repeated checks within the TTL hit the driver once."""
+        for _ in range(5):
+            self.assertEqual(self.session.get_current_url(), "https://example.com/")
+            self.assertFalse(self.session._cached_page_closed())
+        self.assertEqual(self.session._page.is_closed.call_count, 1)
+    
+    def test_invalidate_forces_refresh(self):
+        """Test that invalidation re-reads the page state."""
+        self.session.get_current_url()
+        self.session._page.is_closed.return_value = True
+        self.session._invalidate_page_state()
+        
+        self.assertTrue(self.session._cached_page_closed())
+        self.assertEqual(self.session.get_current_url(), "")
+
+
+class TestPageHealthCheck(unittest.TestCase):
+    """Test the combined page readiness and keepalive check."""
+    
+    def setUp(self):
+        self.session = SteelBrowserSession(steel_client=Mock())
+        self.session._browser = Mock()
+        self.session._page = Mock()
+    
+    def test_recovers_closed_page(self):
+        """Test that a closed page is replaced from the browser context."""
+        new_page = Mock()
+        new_page.is_closed.return_value = False
+        self.session._browser.contexts = [Mock(pages=[new_page])]
+        self.session._page.is_closed.return_value = True
+        
+        self.assertTrue(self.session._page_health_check())
+        self.assertIs(self.session._page, new_page)
+    
+    def test_keepalive_skipped_within_interval(self):
+        """Test that keepalive checks only run once per interval."""
+        self.session._page.is_closed.return_value = False
+        self.assertTrue(self.session._page_health_check(for_keepalive=True))
+        self.session._invalidate_page_state()
+        self.assertTrue(self.session._page_health_check(for_keepalive=True))
+        self.assertEqual(self.session._page.is_closed.call_count, 1)
+    
+    def test_start_url_failure_falls_back_to_local_page(self):
+        """Test that a failed start URL goes straight to the blank page fallback."""
+        self.session._page.is_closed.return_value = False
+        self.session._page.goto.side_effect = [Exception("timeout"), None]
+        self.session.start_url = "https://slow.example.com"
+        self.session._safe_navigate_to_start_url()
+        
+        first, second = self.session._page.goto.call_args_list
+        self.assertEqual(first.kwargs["wait_until"], "commit")
+        self.assertEqual(second.args[0], "about:blank")
+
+
+class TestSharedPlaywright(unittest.TestCase):
+    """Test the per-thread shared sync Playwright driver."""
+    
+    def tearDown(self):
+        _sync_playwright_local.__dict__.pop("driver", None)
+    
+    @patch("playwright.sync_api.sync_playwright")
+    def test_driver_started_once_per_thread(self, mock_sync_playwright):
+        """Test that sessions on one thread reuse a single driver."""
+        _sync_playwright_local.__dict__.pop("driver", None)
+        first = _shared_sync_playwright()
+        second = _shared_sync_playwright()
+        
+        self.assertIs(first, second)
+        mock_sync_playwright.return_value.start.assert_called_once()
+
+
+class TestSteelSessionPool(unittest.TestCase):
+    """Test reuse and eviction of pooled Steel sessions."""
+    
+    def _entry(self, created_at=None):
+        return _PooledSession(
+            time.time() if created_at is None else created_at,
+            Mock(), Mock(), Mock(), Mock(), Mock(),
+        )
+    
+    def test_acquire_matches_key(self):
+        """Test that only sessions with a matching key are handed out."""
+        pool = SteelSessionPool()
+        entry = self._entry()
+        pool.release((1024, 768, False, False), entry)
+        
+        self.assertIsNone(pool.acquire((1280, 800, False, False)))
+        self.assertIs(pool.acquire((1024, 768, False, False)), entry)
+        self.assertEqual(len(pool), 0)
+    
+    def test_lru_eviction_closes_oldest(self):
+        """Test that the least recently released session is closed past max_idle."""
+        pool = SteelSessionPool(max_idle=1)
+        oldest, newest = self._entry(), self._entry()
+        pool.release(("k",), oldest)
+        pool.release(("k",), newest)
+        
+        oldest.browser.close.assert_called_once()
+        oldest.steel_client.sessions.release.assert_called_once_with(oldest.session.id)
+        self.assertIs(pool.acquire(("k",)), newest)
+    
+    def test_expired_sessions_discarded(self):
+        """Test that sessions older than max_age_seconds are not reused."""
+        pool = SteelSessionPool(max_age_seconds=60)
+        stale = self._entry(created_at=time.time() - 120)
+        pool._idle.append((("k",), stale))
+        
+        self.assertIsNone(pool.acquire(("k",)))
+        stale.browser.close.assert_called_once()
+        
+        # A session timeout shorter than max_age_seconds retires the entry first
+        short_lived = _PooledSession(time.time() - 45, Mock(), Mock(), Mock(), Mock(), Mock(), 90.0)
+        pool._idle.append((("k",), short_lived))
+        self.assertIsNone(pool.acquire(("k",)))
+        short_lived.browser.close.assert_called_once()
+    
+    def test_pool_key_separates_accounts_and_timeouts(self):
+        """Test that sessions are only shared between matching accounts and timeouts."""
+        def key(api_key, timeout=900000):
+            return SteelBrowserSession(
+                steel_client=Mock(steel_api_key=api_key), session_timeout=timeout
+            )._pool_key()
+        
+        self.assertEqual(key("a"), key("a"))
+        self.assertNotEqual(key("a"), key("b"))
+        self.assertNotEqual(key("a"), key("a", timeout=60000))
+    
+    def test_release_wipes_state_and_attach_restores_it(self):
+        """Test that pooled sessions go back clean and pick up the next user's storage state."""
+        pool = SteelSessionPool()
+        first = SteelBrowserSession(steel_client=Mock(steel_api_key="a"), session_pool=pool)
+        first.session, first._browser, first._page = Mock(), Mock(), Mock()
+        first._session_created_at = time.time()
+        first._browser.contexts = []
+        context = first._page.context
+        context.storage_state.return_value = {"origins": [{"origin": "https://a.test"}]}
+        cdp = context.new_cdp_session.return_value
+        
+        with patch.object(SteelBrowserSession, "_page_health_check", return_value=True):
+            first.__exit__(None, None, None)
+        
+        cdp.send.assert_called_once_with(
+            "Storage.clearDataForOrigin", {"origin": "https://a.test", "storageTypes": "all"}
+        )
+        context.clear_cookies.assert_called_once()
+        self.assertEqual(len(pool), 1)
+        
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"cookies": [{"name": "sid", "value": "b"}]}, f)
+        self.addCleanup(os.remove, f.name)
+        second = SteelBrowserSession(
+            steel_client=Mock(steel_api_key="a"), session_pool=pool, storage_state_path=f.name
+        )
+        with patch.object(SteelBrowserSession, "_page_health_check", return_value=True), \
+             patch.object(SteelBrowserSession, "_safe_navigate_to_start_url"):
+            self.assertTrue(second._attach_pooled_session())
+        context.add_cookies.assert_called_once_with([{"name": "sid", "value": "b"}])
+    
+    def test_pools_closed_at_exit_without_being_kept_alive(self):
+        """Test that one exit hook closes live pools and does not pin dropped ones."""
+        import gc
+        from langchain_steel.agents import claude_computer_use
+        
+        pool = SteelSessionPool()
+        entry = self._entry()
+        pool.release(("k",), entry)
+        claude_computer_use._close_session_pools()
+        entry.browser.close.assert_called_once()
+        
+        ref = weakref.ref(pool)
+        del pool
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class TestDeferredScreenshot(unittest.IsolatedAsyncioTestCase):
+    """Test capturing async screenshots separately from the action."""
+    
+    async def test_action_without_capture_then_separate_screenshot(self):
+        """Test that actions can skip the screenshot for callers that capture it later."""
+        session = AsyncSteelBrowserSession(steel_client=Mock())
+        session._page = Mock()
+        session._page.is_closed.return_value = False
+        session._page.mouse.move = AsyncMock()
+        session._page.mouse.click = AsyncMock()
+        cdp = Mock()
+        cdp.send = AsyncMock(return_value={"data": "img"})
+        session._page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        
+        result = await session.execute_computer_action(
+            "left_click", coordinate=[10, 20], capture_screenshot=False
+        )
+        self.assertEqual(result, "")
+        cdp.send.assert_not_called()
+        
+        self.assertEqual(await session.screenshot(), "img")
+        session._page.mouse.click.assert_awaited_once_with(10, 20)
+    
+    async def test_mouse_down_dispatched_and_invalid_action_rejected(self):
+        """Test that left_mouse_down reaches the page and unknown actions raise."""
+        session = AsyncSteelBrowserSession(steel_client=Mock())
+        session._page = Mock()
+        session._page.is_closed.return_value = False
+        session._page.mouse.down = AsyncMock()
+        
+        result = await session.execute_computer_action("left_mouse_down", capture_screenshot=False)
+        self.assertEqual(result, "")
+        session._page.mouse.down.assert_awaited_once()
+        
+        with self.assertRaises(ValueError):
+            await session.execute_computer_action("fly", capture_screenshot=False)
+    
+    async def test_keepalive_piggybacked_only_when_idle(self):
+        """Test that an action sends a keepalive only after the idle interval."""
+        session = AsyncSteelBrowserSession(steel_client=Mock())
+        session._page = Mock()
+        session._page.is_closed.return_value = False
+        session._page.mouse.down = AsyncMock()
+        cdp = Mock()
+        cdp.send = AsyncMock(return_value={})
+        session._cdp = cdp
+        
+        await session.execute_computer_action("left_mouse_down", capture_screenshot=False)
+        await session._keepalive_task
+        await session.execute_computer_action("left_mouse_down", capture_screenshot=False)
+        
+        cdp.send.assert_awaited_once_with("Target.getTargets")
+    
+    async def test_mouse_move_overlaps_screenshot(self):
+        """Test that mouse_move returns the screenshot captured alongside the move."""
+        session = AsyncSteelBrowserSession(steel_client=Mock())
+        session._page = Mock()
+        session._page.is_closed.return_value = False
+        session._page.mouse.move = AsyncMock()
+        session._last_keepalive = time.monotonic()
+        session.screenshot = AsyncMock(return_value="img")
+        
+        result = await session.execute_computer_action("mouse_move", coordinate=[5, 6])
+        
+        self.assertEqual(result, "img")
+        session._page.mouse.move.assert_awaited_once_with(5, 6)
+        session.screenshot.assert_awaited_once()
+
+
+class TestAsyncTeardown(unittest.IsolatedAsyncioTestCase):
+    """Test async session cleanup."""
+    
+    async def test_browser_close_and_release_both_run(self):
+        """Test that teardown closes the browser and releases the session even if one fails."""
+        steel_client = Mock()
+        session = AsyncSteelBrowserSession(steel_client=steel_client)
+        session._page = Mock()
+        session._page.close = AsyncMock()
+        session._browser = Mock()
+        session._browser.close = AsyncMock(side_effect=Exception("already gone"))
+        session._playwright = Mock()
+        session._playwright.stop = AsyncMock()
+        session.session = Mock(id="sess-1")
+        
+        await session.__aexit__(None, None, None)
+        
+        steel_client.sessions.release.assert_called_once_with("sess-1")
+        session._playwright.stop.assert_awaited_once()
+        session._page.close.assert_not_awaited()
+    
+    async def test_pending_keepalive_cancelled_before_close(self):
+        """Test that teardown stops an in-flight keepalive before closing the browser."""
+        session = AsyncSteelBrowserSession(steel_client=Mock())
+        started = asyncio.Event()
+        
+        async def slow_send(method):
+            started.set()
+            await asyncio.sleep(10)
+        
+        session._cdp = Mock(send=slow_send, detach=AsyncMock())
+        session._last_keepalive = float("-inf")
+        session._maybe_keepalive()
+        task = session._keepalive_task
+        await started.wait()
+        
+        await session.__aexit__(None, None, None)
+        
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(session._keepalive_task)
+
+
+class TestStorageState(unittest.TestCase):
+    """Test browser storage state persistence."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "state.json")
+        self.session = SteelBrowserSession(steel_client=Mock(), storage_state_path=self.path)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_restore_injects_cookies_and_local_storage(self):
+        """Test that saved cookies and localStorage are loaded into the context."""
+        cookies = [{"name": "sid", "value": "1", "domain": "example.com", "path": "/"}]
+        origins = [{"origin": "https://example.com",
+                    "localStorage": [{"name": "token", "value": "abc"}]}]
+        with open(self.path, "w") as f:
+            json.dump({"cookies": cookies, "origins": origins}, f)
+        context = Mock()
+        
+        self.session._restore_storage_state(context)
+        
+        context.add_cookies.assert_called_once_with(cookies)
+        script = context.add_init_script.call_args.kwargs["script"]
+        self.assertIn("https://example.com", script)
+        self.assertIn("token", script)
+        self.assertTrue(self.session._storage_state_restored)
+    
+    def test_missing_file_is_ignored(self):
+        """Test that a missing state file leaves the context untouched."""
+        context = Mock()
+        self.session._restore_storage_state(context)
+        context.add_cookies.assert_not_called()
+        self.assertFalse(self.session._storage_state_restored)
+    
+    def test_save_writes_context_state(self):
+        """Test that the context state is saved to the configured path."""
+        self.session._browser = Mock()
+        context = Mock()
+        self.session._browser.contexts = [context]
+        
+        self.session._save_storage_state()
+        
+        context.storage_state.assert_called_once_with(path=self.path)
 
 
 class TestIntegrationOptimizations(unittest.TestCase):
@@ -205,6 +781,790 @@ class TestIntegrationOptimizations(unittest.TestCase):
         self.assertIn("direct navigation methods", agent.system_prompt)
         self.assertIn("rate limits", agent.system_prompt)
 
+    
+    @patch('langchain_steel.agents.claude_computer_use.Anthropic')
+    def test_repeated_screenshot_sent_as_text(self, mock_anthropic):
+        """Test that an unchanged screenshot is not re-uploaded to Claude."""
+        from langchain_steel.agents.claude_computer_use import ClaudeComputerUseAgent
+        
+        self.mock_session.screenshot_media_type = "image/jpeg"
+        agent = ClaudeComputerUseAgent(
+            anthropic_api_key="test_key",
+            browser_session=self.mock_session
+        )
+        
+        self.assertEqual(agent._screenshot_result_content("aaa")[0]["type"], "image")
+        self.assertEqual(agent._screenshot_result_content("aaa")[0]["type"], "text")
+        self.assertEqual(agent._screenshot_result_content("bbb")[0]["type"], "image")
+
+    
+    @patch('langchain_steel.agents.claude_computer_use.Anthropic')
+    def test_cached_screenshot_requires_same_page_state(self, mock_anthropic):
+        """Test that the agent's screenshot cache is dropped once the page state changes."""
+        from langchain_steel.agents.claude_computer_use import ClaudeComputerUseAgent
+        
+        agent = ClaudeComputerUseAgent(
+            anthropic_api_key="test_key",
+            browser_session=self.mock_session
+        )
+        top, scrolled = "https://a/|0|0|complete", "https://a/|0|400|complete"
+        self.mock_session.page_state_key.return_value = top
+        agent._cache_screenshot("img", top)
+        self.mock_session.page_state_key.assert_not_called()
+        self.assertEqual(agent._get_cached_screenshot(), "img")
+        
+        self.mock_session.page_state_key.return_value = scrolled
+        self.assertIsNone(agent._get_cached_screenshot())
+        
+        # The page changed after the capture but before the first reuse
+        agent._cache_screenshot("img", top)
+        self.assertIsNone(agent._get_cached_screenshot())
+        
+        # Screenshots cached without a fingerprint are never reused
+        agent._cache_screenshot("img")
+        self.assertIsNone(agent._get_cached_screenshot())
+
+    
+    @patch('langchain_steel.agents.claude_computer_use.AsyncAnthropic')
+    def test_async_agent_pauses_only_when_request_window_full(self, mock_anthropic):
+        """Test that the async agent waits only once requests_per_minute is reached."""
+        from langchain_steel.agents.claude_computer_use import AsyncClaudeComputerUseAgent
+        
+        agent = AsyncClaudeComputerUseAgent(
+            anthropic_api_key="test_key",
+            browser_session=self.mock_session,
+            requests_per_minute=2
+        )
+        now = time.monotonic()
+        agent._recent_request_times.append(now)
+        self.assertEqual(agent._request_window_delay(), 0.0)
+        agent._recent_request_times.append(now)
+        self.assertGreater(agent._request_window_delay(), 55.0)
+        
+        for invalid in (0, -1):
+            with self.assertRaises(ValueError):
+                AsyncClaudeComputerUseAgent(
+                    anthropic_api_key="test_key",
+                    browser_session=self.mock_session,
+                    requests_per_minute=invalid
+                )
+
+    
+    @patch('langchain_steel.agents.claude_computer_use.AsyncAnthropic')
+    def test_async_agent_closes_only_its_own_client(self, mock_anthropic):
+        """Test that a passed client is shared and left open, an own client is closed."""
+        from langchain_steel.agents.claude_computer_use import AsyncClaudeComputerUseAgent
+        
+        mock_anthropic.return_value.close = AsyncMock()
+        own = AsyncClaudeComputerUseAgent(
+            anthropic_api_key="test_key", browser_session=self.mock_session
+        )
+        shared = MagicMock()
+        shared.close = AsyncMock()
+        borrowed = AsyncClaudeComputerUseAgent(
+            anthropic_api_key="test_key", browser_session=self.mock_session, client=shared
+        )
+        self.assertIs(borrowed.client, shared)
+        
+        asyncio.run(own.aclose())
+        asyncio.run(borrowed.aclose())
+        own.client.close.assert_awaited_once()
+        shared.close.assert_not_awaited()
+
+    
+    def test_old_screenshots_pruned_from_conversation(self):
+        """Test that only the most recent screenshots are kept in the request."""
+        def tool_result(data):
+            return {"role": "user", "content": [{
+                "type": "tool_result", "tool_use_id": data,
+                "content": [{"type": "image", "source": {"data": data}}],
+            }]}
+        
+        conversation = [{"role": "user", "content": "task"}]
+        conversation += [tool_result(str(i)) for i in range(5)]
+        _prune_old_screenshots(conversation, keep=3)
+        
+        kinds = [m["content"][0]["content"][0]["type"] for m in conversation[1:]]
+        self.assertEqual(kinds, ["text", "text", "image", "image", "image"])
+        self.assertEqual(conversation[1]["content"][0]["tool_use_id"], "0")
+
+
+
+class TestSimplifiedComputerUse(unittest.TestCase):
+    """Test optimizations in the simplified computer_use module."""
+    
+    @patch('anthropic.AsyncAnthropic')
+    def test_repeated_screenshot_sent_as_text(self, mock_anthropic):
+        """Test that ClaudeAgent does not re-upload an unchanged screenshot."""
+        from langchain_steel.agents.computer_use import ClaudeAgent
+        
+        agent = ClaudeAgent(api_key="test_key")
+        
+        self.assertEqual(agent._screenshot_result_content("aaa")[0]["type"], "image")
+        self.assertEqual(agent._screenshot_result_content("aaa")[0]["type"], "text")
+        self.assertEqual(agent._screenshot_result_content("bbb")[0]["type"], "image")
+    
+    def test_screenshot_uses_configured_format(self):
+        """Test that SteelBrowser captures JPEG over CDP, falling back to Playwright."""
+        from langchain_steel.agents.computer_use import SteelBrowser
+        
+        from playwright.async_api import Error as PlaywrightError
+        
+        browser = SteelBrowser(steel_client=Mock())
+        browser.page = Mock()
+        cdp = Mock()
+        cdp.send = AsyncMock(return_value={"data": "cdp-img"})
+        browser.page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        browser.page.screenshot = AsyncMock(return_value=b"img")
+        
+        self.assertEqual(asyncio.run(browser.screenshot()), "cdp-img")
+        self.assertEqual(cdp.send.call_args.args[1]["format"], "jpeg")
+        self.assertTrue(cdp.send.call_args.args[1]["optimizeForSpeed"])
+        self.assertEqual(browser.screenshot_media_type, "image/jpeg")
+        
+        cdp.send.side_effect = PlaywrightError("detached")
+        self.assertEqual(asyncio.run(browser.screenshot()), "aW1n")
+        self.assertEqual(browser.page.screenshot.call_args.kwargs["type"], "jpeg")
+        with self.assertRaises(ValueError):
+            SteelBrowser(steel_client=Mock(), screenshot_format="gif")
+    
+    def test_key_names_mapped_case_insensitively(self):
+        """Test that key names map regardless of case and combos are converted."""
+        from langchain_steel.agents.computer_use import _map_key, _playwright_combo
+        
+        self.assertEqual(_map_key("CTRL"), "Control")
+        self.assertEqual(_map_key(" Return "), "Enter")
+        self.assertEqual(_map_key("a"), "a")
+        self.assertEqual(_playwright_combo("Ctrl+Shift+t"), "Control+Shift+t")
+    
+    def test_scroll_defaults_when_inputs_missing(self):
+        """Test that scroll scales the unit delta and tolerates None inputs."""
+        from langchain_steel.agents.computer_use import SteelBrowser
+        
+        browser = SteelBrowser(steel_client=Mock())
+        browser.page = Mock()
+        browser.page.mouse.wheel = AsyncMock()
+        browser.screenshot = AsyncMock(return_value="img")
+        
+        asyncio.run(browser.execute_action("scroll", scroll_direction="left", scroll_amount=2))
+        browser.page.mouse.wheel.assert_awaited_with(-200, 0)
+        asyncio.run(browser.execute_action("scroll", scroll_direction=None, scroll_amount=None))
+        browser.page.mouse.wheel.assert_awaited_with(0, 300)
+    
+    def test_old_screenshots_pruned_from_messages(self):
+        """Test that ClaudeAgent keeps only the last few screenshots in the request."""
+        from langchain_steel.agents.computer_use import _prune_old_screenshots
+        
+        messages = [{"role": "user", "content": "task"}]
+        for i in range(5):
+            messages.append({"role": "user", "content": [{
+                "type": "tool_result", "tool_use_id": str(i),
+                "content": [{"type": "image", "source": {"data": str(i)}}],
+            }]})
+        _prune_old_screenshots(messages, keep=3)
+        
+        kinds = [m["content"][0]["content"][0]["type"] for m in messages[1:]]
+        self.assertEqual(kinds, ["text", "text", "image", "image", "image"])
+    
+    @patch('anthropic.AsyncAnthropic')
+    def test_agents_share_passed_client_and_close_own(self, mock_anthropic):
+        """Test that ClaudeAgents share a passed client and close only clients they created."""
+        from langchain_steel.agents.computer_use import ClaudeAgent
+        
+        mock_anthropic.side_effect = lambda **kwargs: Mock(close=AsyncMock())
+        shared = Mock(close=AsyncMock())
+        
+        async def run_agents():
+            first = ClaudeAgent(api_key="k1", client=shared)
+            second = ClaudeAgent(api_key="k1", client=shared)
+            own = ClaudeAgent(api_key="k1")
+            for agent in (first, second, own):
+                await agent.aclose()
+            return first, second, own
+        
+        first, second, own = asyncio.run(run_agents())
+        self.assertIs(first.client, second.client)
+        self.assertIsNot(own.client, shared)
+        shared.close.assert_not_awaited()
+        own.client.close.assert_awaited_once()
+    
+    def test_retry_delay_jittered_and_capped(self):
+        """Test that retry delays use decorrelated jitter and honor retry-after."""
+        from langchain_steel.agents.computer_use import _retry_delay
+        
+        error = Mock()
+        error.response.headers = {}
+        for prev_delay in (1.0, 5.0, 40.0):
+            with self.subTest(prev_delay=prev_delay):
+                delay = _retry_delay(error, prev_delay)
+                self.assertGreaterEqual(delay, 1.0)
+                self.assertLessEqual(delay, min(60.0, prev_delay * 3))
+        
+        error.response.headers = {"retry-after": "30"}
+        self.assertGreaterEqual(_retry_delay(error, 1.0), 30.0)
+        
+        # A retry-after beyond the jitter cap is honoured, not shortened
+        error.response.headers = {"retry-after": "120"}
+        self.assertEqual(_retry_delay(error, 1.0), 120.0)
+
+
+class TestSteelDocumentLoader(unittest.IsolatedAsyncioTestCase):
+    """Test SteelDocumentLoader batching and concurrency."""
+    
+    def _loader(self, urls, **kwargs):
+        from langchain_steel.document_loaders import SteelDocumentLoader
+        from langchain_steel.utils.config import SteelConfig
+        return SteelDocumentLoader(urls, config=SteelConfig(api_key="test-key"), **kwargs)
+    
+    def _async_client(self):
+        client = MagicMock()
+        client.session_context.return_value.__aenter__.return_value = Mock(id="session-1")
+        client.cleanup_sessions = AsyncMock()
+        return client
+    
+    async def test_aload_bounds_concurrency(self):
+        """aload should never have more than max_concurrency scrapes in flight."""
+        from langchain_core.documents import Document
+        
+        urls = [f"https://example.com/{i}" for i in range(12)]
+        loader = self._loader(urls, max_concurrency=3)
+        loader._async_client = self._async_client()
+        in_flight = peak = 0
+        
+        async def fake_load(url, session):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later URLs finish first, so completion order differs from URL order
+            await asyncio.sleep(0.01 * (12 - int(url.rsplit("/", 1)[1])) / 12)
+            in_flight -= 1
+            return Document(page_content=url, metadata={"source": url})
+        
+        with patch.object(loader, '_aload_single_url', side_effect=fake_load):
+            documents = await loader.aload()
+        
+        self.assertEqual([d.page_content for d in documents], urls)
+        self.assertEqual(peak, 3)
+    
+    async def test_aload_iter_yields_in_completion_order(self):
+        """aload_iter should hand over fast documents before slow ones finish."""
+        from langchain_core.documents import Document
+        
+        urls = ["https://example.com/slow", "https://example.com/fast", "https://example.com/bad"]
+        loader = self._loader(urls)
+        loader._async_client = self._async_client()
+        
+        async def fake_load(url, session):
+            if url.endswith("bad"):
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.05 if url.endswith("slow") else 0)
+            return Document(page_content=url)
+        
+        with patch.object(loader, '_aload_single_url', side_effect=fake_load):
+            documents = [d async for d in loader.aload_iter()]
+        
+        self.assertEqual([d.page_content for d in documents], urls[1::-1])
+        loader._async_client.cleanup_sessions.assert_awaited_once()
+    
+    async def test_alazy_load_prefetches_within_window(self):
+        """alazy_load should yield in URL order without racing far ahead of the consumer."""
+        from langchain_core.documents import Document
+        
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        loader = self._loader(urls, max_concurrency=2)
+        loader._async_client = self._async_client()
+        started = []
+        
+        async def fake_load(url, session):
+            started.append(url)
+            if url.endswith("/3"):
+                raise RuntimeError("boom")
+            return Document(page_content=url)
+        
+        documents = []
+        with patch.object(loader, '_aload_single_url', side_effect=fake_load):
+            async for document in loader.alazy_load():
+                # Queue slots, the awaited task, the one waiting on put and the failed URL
+                self.assertLessEqual(len(started) - len(documents), 2 + 2 + 1)
+                documents.append(document)
+                await asyncio.sleep(0.01)
+        
+        self.assertEqual([d.page_content for d in documents], urls[:3] + urls[4:])
+    
+    async def test_aload_shares_one_session(self):
+        """aload should open one Steel session and scrape every URL through it."""
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        loader = self._loader(urls)
+        client = loader._async_client = self._async_client()
+        client.scrape = AsyncMock(side_effect=lambda url, **kwargs: {"content": url})
+        
+        documents = await loader.aload()
+        
+        self.assertEqual(len(documents), 4)
+        client.session_context.assert_called_once()
+        session = client.session_context.return_value.__aenter__.return_value
+        for call in client.scrape.call_args_list:
+            self.assertIs(call.kwargs["session"], session)
+            self.assertEqual(call.kwargs["format"], "markdown")
+    
+    def test_load_scrapes_in_parallel_threads(self):
+        """load should overlap scrapes across worker threads and keep URL order."""
+        import threading
+        
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        loader = self._loader(urls, max_workers=4)
+        barrier = threading.Barrier(4, timeout=5)
+        
+        def fake_scrape(url, **kwargs):
+            barrier.wait()  # Only passes if all four scrapes run at once
+            return {"content": url}
+        
+        loader._client = MagicMock()
+        loader._client.scrape.side_effect = fake_scrape
+        
+        documents = loader.load()
+        
+        self.assertEqual([d.page_content for d in documents], urls)
+    
+    def test_load_async_path_keeps_url_order_without_session_reuse(self):
+        """Large batches on the asyncio path should keep URL order and honour session_reuse."""
+        from langchain_steel.document_loaders import steel_loader
+        
+        count = steel_loader.THREAD_POOL_MAX_URLS + 4
+        urls = [f"https://example.com/{i}" for i in range(count)]
+        loader = self._loader(urls, session_reuse=False)
+        client = loader._async_client = self._async_client()
+        client.close = AsyncMock()
+        
+        async def fake_scrape(url, session, **kwargs):
+            await asyncio.sleep(0.001 * (count - int(url.rsplit("/", 1)[1])))
+            return {"content": url}
+        
+        client.scrape = AsyncMock(side_effect=fake_scrape)
+        
+        self.assertEqual(loader._resolve_executor(), "async")
+        documents = loader.load()
+        
+        self.assertEqual([d.page_content for d in documents], urls)
+        client.session_context.assert_not_called()
+        for call in client.scrape.call_args_list:
+            self.assertIsNone(call.kwargs["session"])
+    
+    def test_load_process_mode_uses_worker_clients(self):
+        """Process mode should scrape through per-worker clients built by the initializer."""
+        from concurrent.futures import ThreadPoolExecutor
+        from langchain_steel.document_loaders import steel_loader
+        
+        urls = [f"https://example.com/{i}" for i in range(steel_loader.PROCESS_POOL_MIN_URLS)]
+        loader = self._loader(urls, executor="process")
+        loader._client = MagicMock()
+        
+        def fake_scrape(url, **kwargs):
+            if url.endswith("/0"):
+                raise RuntimeError("boom")
+            return {"content": url}
+        
+        # A thread pool accepts the same initializer/map arguments without forking
+        with patch.object(steel_loader, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+             patch.object(steel_loader, 'SteelClient') as client_cls:
+            client_cls.return_value.scrape.side_effect = fake_scrape
+            documents = loader.load()
+        
+        client_cls.assert_called_with(loader.config)
+        self.assertEqual([d.page_content for d in documents], urls[1:])
+        loader._client.scrape.assert_not_called()
+    
+    async def test_single_url_skips_session_and_cleanup(self):
+        """A single URL should be scraped directly, without a shared session or cleanup."""
+        url = "https://example.com/page"
+        loader = self._loader(url)
+        loader._client = MagicMock()
+        loader._client.scrape.return_value = {"content": "sync"}
+        loader._async_client = self._async_client()
+        loader._async_client.scrape = AsyncMock(return_value={"content": "async"})
+        
+        self.assertEqual([d.page_content for d in loader.load()], ["sync"])
+        self.assertEqual([d.page_content for d in loader.lazy_load()], ["sync"])
+        self.assertEqual([d.page_content for d in await loader.aload()], ["async"])
+        
+        loader._client.session_context.assert_not_called()
+        loader._client.cleanup_sessions.assert_not_called()
+        loader._async_client.session_context.assert_not_called()
+        loader._async_client.cleanup_sessions.assert_not_awaited()
+    
+    def test_auto_executor_picks_by_batch_size(self):
+        """The auto executor should use threads for small batches and asyncio for large ones."""
+        from langchain_steel.document_loaders import steel_loader
+        
+        small = self._loader([f"https://example.com/{i}" for i in range(steel_loader.THREAD_POOL_MAX_URLS)])
+        large = self._loader([f"https://example.com/{i}" for i in range(steel_loader.THREAD_POOL_MAX_URLS + 1)])
+        self.assertEqual(small._resolve_executor(), "thread")
+        self.assertEqual(large._resolve_executor(), "async")
+        self.assertEqual(self._loader(small.urls, executor="async")._resolve_executor(), "async")
+        
+        client = large._async_client = self._async_client()
+        client.scrape = AsyncMock(side_effect=lambda url, **kwargs: {"content": url})
+        client.close = AsyncMock()
+        
+        documents = large.load()
+        
+        self.assertEqual(sorted(d.page_content for d in documents), sorted(large.urls))
+        client.close.assert_awaited_once()
+        self.assertIsNone(large._async_client)
+    
+    async def test_auto_executor_stays_on_threads_inside_event_loop(self):
+        """load() called from a running loop cannot use asyncio.run."""
+        from langchain_steel.document_loaders import steel_loader
+        
+        loader = self._loader([f"https://example.com/{i}" for i in range(steel_loader.THREAD_POOL_MAX_URLS + 1)])
+        self.assertEqual(loader._resolve_executor(), "thread")
+    
+    def test_response_cache_serves_repeat_urls(self):
+        """Repeated URLs with the same params should hit the cache, not Steel."""
+        class DictCache(dict):
+            def set(self, key, value, expire=None):
+                self[key] = value
+        
+        url = "https://example.com/page"
+        loader = self._loader([url, url, url], cache=DictCache(), cache_ttl=60)
+        loader._client = MagicMock()
+        loader._client.scrape.return_value = {"content": "cached"}
+        loader.max_workers = 1  # Serialize so the second scrape sees the first one's entry
+        
+        documents = loader.load()
+        
+        self.assertEqual([d.page_content for d in documents], ["cached"] * 3)
+        loader._client.scrape.assert_called_once()
+    
+    def test_process_pool_path_uses_response_cache(self):
+        """The process-pool path should skip cached URLs and cache what the workers return."""
+        from concurrent.futures import ThreadPoolExecutor
+        from langchain_steel.document_loaders import steel_loader
+        
+        class DictCache(dict):
+            def set(self, key, value, expire=None):
+                self[key] = value
+        
+        cached, fresh = "https://example.com/cached", "https://example.com/fresh"
+        loader = self._loader([cached, fresh, fresh], cache=DictCache(), cache_ttl=60)
+        loader.cache.set(loader._cache_key(cached, loader._scrape_params), {"content": "hit"})
+        worker = MagicMock(return_value=({"content": "scraped"}, None))
+        
+        # Threads stand in for processes so the worker mock stays observable
+        with patch.object(steel_loader, "ProcessPoolExecutor", ThreadPoolExecutor), \
+             patch.object(steel_loader, "_init_scrape_worker"), \
+             patch.object(steel_loader, "_scrape_url_worker", worker):
+            documents, errors = loader._load_in_processes()
+            self.assertEqual(errors, [])
+            self.assertEqual([d.page_content for d in documents], ["hit", "scraped", "scraped"])
+            worker.assert_called_once_with(fresh, loader._scrape_params)
+            self.assertIn(loader._cache_key(fresh, loader._scrape_params), loader.cache)
+            
+            worker.reset_mock()
+            loader._load_in_processes()
+            worker.assert_not_called()
+    
+    def test_extract_document_prefers_primary_keys(self):
+        """Content and metadata lookup should honour key priority regardless of response order."""
+        url = "https://example.com/page"
+        loader = self._loader(url)
+        response = {
+            "page_title": "Fallback", "url": "https://example.com/r", "title": "Primary",
+            "resolved_url": "https://example.com/final", "http_status": 200, "unrelated": 1,
+            "html": "<p>page</p>", "data": "", "content": "# page",
+        }
+        
+        document = loader._extract_document(response, url)
+        metadata = document.metadata
+        
+        self.assertEqual(document.page_content, "# page")
+        self.assertEqual(metadata["title"], "Primary")
+        self.assertEqual(metadata["final_url"], "https://example.com/final")
+        self.assertEqual(metadata["status_code"], 200)
+        self.assertNotIn("unrelated", metadata)
+    
+    def test_extract_document_requires_content(self):
+        """Responses without content should raise instead of being serialized."""
+        from steel.types import ScrapeResponse
+        from langchain_steel.utils.errors import SteelContentError
+        
+        url = "https://example.com/page"
+        loader = self._loader(url)
+        
+        with self.assertRaises(SteelContentError):
+            loader._extract_document({"status_code": 200, "links": []}, url)
+        with self.assertRaises(SteelContentError):
+            loader._extract_document(None, url)
+        
+        response = ScrapeResponse.model_construct(
+            content={"html": "<h1>Hi</h1>", "markdown": "# Hi"}, links=[]
+        )
+        self.assertEqual(loader._extract_document(response, url).page_content, "# Hi")
+    
+    def test_url_validation(self):
+        """URL validation should accept http(s) URLs and reject everything else."""
+        from langchain_steel.utils.errors import SteelContentError
+        
+        self._loader(["https://example.com", "HTTP://example.com:8080/path?q=1"])
+        for bad_url, message in [
+            ("example.com", "Invalid URL format"),
+            ("https:///path", "Invalid URL format"),
+            ("ftp://example.com/file", "Unsupported URL scheme: ftp"),
+            (42, "URL must be string"),
+        ]:
+            with self.subTest(url=bad_url):
+                with self.assertRaisesRegex(SteelContentError, message):
+                    self._loader([bad_url])
+    
+    def test_sort_by_host_groups_urls(self):
+        """sort_by_host should group URLs per host while keeping their relative order."""
+        urls = ["https://b.com/1", "https://a.com/1", "https://B.com/2", "https://a.com/2"]
+        
+        self.assertEqual(self._loader(urls).urls, urls)
+        loader = self._loader(urls, sort_by_host=True)
+        self.assertEqual(loader.urls, ["https://a.com/1", "https://a.com/2", "https://b.com/1", "https://B.com/2"])
+        self.assertEqual(loader._url_hosts, ["a.com", "a.com", "b.com", "b.com"])
+
+
+class TestSteelToolClients(unittest.IsolatedAsyncioTestCase):
+    """Test client sharing and hot paths in Steel tools."""
+    
+    def _tool(self, **config_kwargs):
+        from langchain_steel.tools import SteelScrapeTool
+        from langchain_steel.utils.config import SteelConfig
+        return SteelScrapeTool(config=SteelConfig(api_key="test-key", **config_kwargs))
+    
+    def test_tools_with_equal_configs_share_client(self):
+        """Tools built from equivalent configs should reuse one Steel client."""
+        from langchain_steel.tools import base
+        
+        with patch.object(base, 'SteelClient') as client_cls, \
+             patch.dict(base._CLIENT_POOL, clear=True):
+            client_cls.side_effect = lambda config: Mock()
+            first, second = self._tool(), self._tool()
+            other = self._tool(use_proxy=True)
+            
+            self.assertIs(first.client, second.client)
+            self.assertIsNot(first.client, other.client)
+            self.assertEqual(client_cls.call_count, 2)
+    
+    async def test_async_client_owned_by_tool_and_closed(self):
+        """A tool should close the async client it created, but not one it was given."""
+        from langchain_steel.tools import base
+        
+        with patch.object(base, 'AsyncSteelClient') as client_cls:
+            client_cls.side_effect = lambda config: Mock(close=AsyncMock())
+            tool = self._tool()
+            own = tool.async_client
+            self.assertIs(tool.async_client, own)
+            self.assertIsNot(self._tool().async_client, own)
+            
+            await tool.aclose()
+            own.close.assert_awaited_once()
+            
+            given = tool.async_client = Mock(close=AsyncMock())
+            async with tool:
+                self.assertIs(tool.async_client, given)
+            given.close.assert_not_awaited()
+    
+    def test_async_client_follows_running_loop(self):
+        """A tool used from a new loop should replace its own async client, not a given one."""
+        from langchain_steel.tools import base
+        
+        async def current_client(tool):
+            return tool.async_client, tool.async_client
+        
+        with patch.object(base, 'AsyncSteelClient') as client_cls:
+            client_cls.side_effect = lambda config: Mock()
+            tool = self._tool()
+            first, again = asyncio.run(current_client(tool))
+            second, _ = asyncio.run(current_client(tool))
+            self.assertIs(first, again)
+            self.assertIsNot(first, second)
+            
+            given = tool.async_client = Mock()
+            self.assertIs(asyncio.run(current_client(tool))[0], given)
+    
+    def test_scrape_params_skip_unset_options(self):
+        """Scrape params should only carry options that were actually set."""
+        from langchain_steel.tools import SteelScrapeTool
+        
+        build = SteelScrapeTool._build_scrape_params
+        self.assertEqual(build(None, None, None, False, False, False, None), {"format": "markdown"})
+        self.assertEqual(
+            build("html", ".main", 0, True, True, True, {"X-Test": "1"}),
+            {
+                "format": "html", "wait_for_selector": ".main", "delay": 0, "screenshot": True,
+                "extract_images": True, "extract_links": True, "headers": {"X-Test": "1"},
+            },
+        )
+    
+    async def test_dynamic_tool_runs_sync_func_off_loop(self):
+        """Without async_func, the factory tool should run sync_func in a worker thread."""
+        import threading
+        from pydantic import BaseModel
+        from langchain_steel.tools.base import create_steel_tool
+        
+        class EchoInput(BaseModel):
+            text: str
+        
+        loop_thread = threading.get_ident()
+        
+        def echo(client, params, run_manager):
+            return params["text"], client, threading.get_ident() != loop_thread
+        
+        tool_cls = create_steel_tool("echo", "Echo text", EchoInput, echo)
+        tool = tool_cls(config=self._tool().config)
+        tool.client = Mock()
+        
+        text, client, off_loop = await tool._arun(text="hi")
+        
+        self.assertEqual(text, "hi")
+        self.assertIs(client, tool.client)
+        self.assertTrue(off_loop)
+    
+    def test_content_extraction_prefers_requested_format(self):
+        """Content extraction should try the requested format before the fallbacks."""
+        from types import SimpleNamespace
+        
+        tool = self._tool()
+        url = "https://example.com"
+        sdk_response = SimpleNamespace(content=SimpleNamespace(
+            markdown="# md", readability=None, cleaned_html="<p>clean</p>", html="<p>raw</p>"
+        ))
+        dict_response = {"content": "generic", "html": "<p>raw</p>"}
+        
+        self.assertEqual(tool._extract_content_from_response(sdk_response, url, "html"), "<p>raw</p>")
+        self.assertEqual(tool._extract_content_from_response(sdk_response, url, "readability"), "# md")
+        self.assertEqual(tool._extract_content_from_response(sdk_response, url, "text"), "# md")
+        self.assertEqual(tool._extract_content_from_response(dict_response, url, "html"), "<p>raw</p>")
+        self.assertEqual(tool._extract_content_from_response(dict_response, url, "markdown"), "generic")
+    
+    def test_tools_share_default_config(self):
+        """Tools built without a config should share one env-derived config."""
+        from langchain_steel.tools import SteelScrapeTool
+        
+        with patch.dict(os.environ, {"STEEL_API_KEY": "env-key"}):
+            first, second = SteelScrapeTool(), SteelScrapeTool()
+        with patch.dict(os.environ, {"STEEL_API_KEY": "other-key"}):
+            third = SteelScrapeTool()
+        
+        self.assertIs(first.config, second.config)
+        self.assertEqual(first.config.api_key, "env-key")
+        self.assertEqual(third.config.api_key, "other-key")
+    
+    async def test_abatch_reuses_one_session(self):
+        """abatch should scrape every URL, in order, inside a single session."""
+        from contextlib import asynccontextmanager
+        
+        tool = self._tool()
+        session = Mock()
+        opened = []
+        
+        @asynccontextmanager
+        async def session_context():
+            opened.append(session)
+            yield session
+        
+        async def scrape(url, session, **params):
+            if url.endswith("bad"):
+                raise RuntimeError("boom")
+            return {"content": f"page {url}"}
+        
+        tool.async_client = Mock(session_context=session_context, scrape=AsyncMock(side_effect=scrape))
+        urls = ["https://a.com", "https://b.com/bad", "https://c.com"]
+        
+        results = await tool.abatch(urls, concurrency=2)
+        
+        self.assertEqual(len(opened), 1)
+        self.assertEqual(results[0], "page https://a.com")
+        self.assertTrue(results[1].startswith("Error scraping https://b.com/bad"))
+        self.assertEqual(results[2], "page https://c.com")
+        for call in tool.async_client.scrape.await_args_list:
+            self.assertIs(call.kwargs["session"], session)
+    
+    async def test_arun_shares_session_only_inside_async_with(self):
+        """_arun should hold one shared session only inside ``async with tool:``."""
+        from contextlib import asynccontextmanager
+        from langchain_steel.tools import base
+        
+        tool = self._tool()
+        session = Mock(id="session-1")
+        per_call = []
+        
+        async def create_session():
+            await asyncio.sleep(0)
+            return session
+        
+        @asynccontextmanager
+        async def session_context():
+            per_call.append(1)
+            yield Mock(id="per-call")
+        
+        tool.async_client = Mock(
+            create_session=AsyncMock(side_effect=create_session),
+            release_session=AsyncMock(),
+            session_context=session_context,
+            scrape=AsyncMock(return_value={"content": "page"}),
+        )
+        
+        self.assertEqual(await tool._arun(url="https://plain.com"), "page")
+        self.assertEqual(len(per_call), 1)
+        tool.async_client.create_session.assert_not_awaited()
+        
+        async with tool:
+            results = await asyncio.gather(*(tool._arun(url=f"https://{i}.com") for i in range(3)))
+            self.assertIn("session-1", base._LIVE_SESSIONS)
+        
+        self.assertEqual(results, ["page"] * 3)
+        self.assertEqual(len(per_call), 1)
+        tool.async_client.create_session.assert_awaited_once()
+        tool.async_client.release_session.assert_awaited_once_with("session-1")
+        self.assertNotIn("session-1", base._LIVE_SESSIONS)
+        await tool.aclose()
+        tool.async_client.release_session.assert_awaited_once()
+    
+    def test_session_lock_created_per_loop(self):
+        """The session lock should be recreated when the tool moves to another loop."""
+        tool = self._tool()
+        
+        async def lock():
+            return tool._get_session_lock(), tool._get_session_lock()
+        
+        first, again = asyncio.run(lock())
+        second, _ = asyncio.run(lock())
+        self.assertIs(first, again)
+        self.assertIsNot(first, second)
+    
+    def test_unclosed_tool_sessions_released_at_exit(self):
+        """Sessions a tool never closed should be released through a sync client at exit."""
+        from langchain_steel.tools import base
+        
+        tool = self._tool()
+        client = Mock()
+        with patch.dict(base._LIVE_SESSIONS, {"session-1": tool.config}, clear=True), \
+             patch.dict(base._CLIENT_POOL, {tool.config.cache_key(): client}, clear=True):
+            base._cleanup_client_pool()
+            self.assertEqual(base._LIVE_SESSIONS, {})
+        
+        client.release_session.assert_called_once_with("session-1")
+    
+    def test_http_pool_limits_come_from_config(self):
+        """Async clients should size their HTTP pool from the Steel config."""
+        from langchain_steel.utils import client as client_module
+        from langchain_steel.utils.config import SteelConfig
+        
+        config = SteelConfig(api_key="test-key", max_connections=500,
+                             max_keepalive_connections=200, http_timeout=30.0)
+        with patch.object(client_module, 'AsyncSteel'), \
+             patch.object(client_module, 'DefaultAsyncHttpxClient') as http_client:
+            client_module.AsyncSteelClient(config)
+        
+        options = http_client.call_args.kwargs
+        self.assertEqual(options["limits"].max_connections, 500)
+        self.assertEqual(options["limits"].max_keepalive_connections, 200)
+        self.assertEqual(options["timeout"].read, 30.0)
+
 
 async def run_async_tests():
     """Run async tests separately."""